@@ -37,6 +37,7 @@ setup(name='spotty',
       packages=find_packages(exclude=['tests*']),
       package_data={
           'spotty.deployment.container.docker.scripts': ['data/*', 'data/*/*'],
+          'spotty.providers.aws.commands': ['data/*'],
           'spotty.providers.aws.cfn_templates.instance': ['data/*', 'data/*/*'],
           'spotty.providers.aws.cfn_templates.instance_profile': ['data/*', 'data/*/*'],
           'spotty.providers.gcp.dm_templates.instance': ['data/*', 'data/*/*'],
@@ -46,6 +47,7 @@ setup(name='spotty',
           'boto3>=1.9.0',
           'google-api-python-client>=1.7.8',
           'google-cloud-storage>=1.15.0',
+          'google-crc32c',
           'cfn_flip',  # to work with CloudFormation templates
           'schema',
           'chevron',
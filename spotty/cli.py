@@ -1,36 +1,51 @@
 import argparse
+from importlib import import_module
 from typing import List, Type
-import pkg_resources
 from spotty.commands.abstract_command import AbstractCommand
-from spotty.commands.aws import AwsCommand
-from spotty.commands.download import DownloadCommand
-from spotty.commands.exec import ExecCommand
-from spotty.commands.run import RunCommand
-from spotty.commands.sh import ShCommand
-from spotty.commands.start import StartCommand
-from spotty.commands.status import StatusCommand
-from spotty.commands.stop import StopCommand
-from spotty.commands.sync import SyncCommand
-
-
-def get_parser() -> argparse.ArgumentParser:
+
+
+# built-in commands: (command name, module name, class name)
+COMMANDS = [
+    ('start', 'spotty.commands.start', 'StartCommand'),
+    ('stop', 'spotty.commands.stop', 'StopCommand'),
+    ('status', 'spotty.commands.status', 'StatusCommand'),
+    ('sh', 'spotty.commands.sh', 'ShCommand'),
+    ('run', 'spotty.commands.run', 'RunCommand'),
+    ('exec', 'spotty.commands.exec', 'ExecCommand'),
+    ('sync', 'spotty.commands.sync', 'SyncCommand'),
+    ('download', 'spotty.commands.download', 'DownloadCommand'),
+    ('aws', 'spotty.commands.aws', 'AwsCommand'),
+]
+
+
+def get_parser(args: List[str] = None) -> argparse.ArgumentParser:
+    """Returns a parser for the Spotty commands.
+
+    Args:
+        args: Command line arguments. If the arguments are provided and they start with
+            the name of a built-in command, only the module of this command is imported.
+            Otherwise, all the commands are loaded.
+    """
     parser = argparse.ArgumentParser()
     parser.add_argument('-V', '--version', action='store_true', help='Display the version of the Spotty')
 
-    command_classes = [
-       StartCommand,
-       StopCommand,
-       StatusCommand,
-       ShCommand,
-       RunCommand,
-       ExecCommand,
-       SyncCommand,
-       DownloadCommand,
-       AwsCommand,
-    ] + _get_custom_commands()
-
-    # add commands to the parser
-    add_subparsers(parser, command_classes)
+    command_name = args[0] if args and not args[0].startswith('-') else None
+    builtin_names = [name for name, _, _ in COMMANDS]
+
+    if command_name in builtin_names:
+        # load only the requested command, other commands are added as stubs to keep the list of choices
+        subparsers = parser.add_subparsers()
+        for name, module_name, class_name in COMMANDS:
+            if name == command_name:
+                _add_subparser(subparsers, _load_command_class(module_name, class_name))
+            else:
+                subparsers.add_parser(name)
+    else:
+        command_classes = [_load_command_class(module_name, class_name) for _, module_name, class_name in COMMANDS] \
+            + _get_custom_commands()
+
+        # add commands to the parser
+        add_subparsers(parser, command_classes)
 
     return parser
 
@@ -39,12 +54,34 @@ def add_subparsers(parser: argparse.ArgumentParser, command_classes: List[Type[A
     """Adds commands to the parser."""
     subparsers = parser.add_subparsers()
     for command_class in command_classes:
-        command = command_class()
-        subparser = subparsers.add_parser(command.name, help=command.description, description=command.description)
-        subparser.set_defaults(command=command, parser=subparser)
-        command.configure(subparser)
+        _add_subparser(subparsers, command_class)
+
+
+def _add_subparser(subparsers, command_class: Type[AbstractCommand]):
+    command = command_class()
+    subparser = subparsers.add_parser(command.name, help=command.description, description=command.description)
+    subparser.set_defaults(command=command, parser=subparser)
+    command.configure(subparser)
+
+
+def _load_command_class(module_name: str, class_name: str) -> Type[AbstractCommand]:
+    return getattr(import_module(module_name), class_name)
 
 
 def _get_custom_commands() -> List[Type[AbstractCommand]]:
     """Returns custom commands that integrated through entry points."""
-    return [entry_point.load() for entry_point in pkg_resources.iter_entry_points('spotty.commands')]
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        # Python < 3.8
+        import pkg_resources
+        return [entry_point.load() for entry_point in pkg_resources.iter_entry_points('spotty.commands')]
+
+    all_entry_points = entry_points()
+    if hasattr(all_entry_points, 'select'):
+        command_entry_points = all_entry_points.select(group='spotty.commands')
+    else:
+        # Python < 3.10
+        command_entry_points = all_entry_points.get('spotty.commands', [])
+
+    return [entry_point.load() for entry_point in command_entry_points]
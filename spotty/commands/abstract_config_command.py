@@ -1,16 +1,25 @@
+import threading
+import time
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from argparse import Namespace, ArgumentParser
 from spotty.config.config_utils import load_config
 from spotty.deployment.abstract_instance_manager import AbstractInstanceManager
+from spotty.deployment.utils.timings import timings
 from spotty.providers.instance_manager_factory import InstanceManagerFactory
 from spotty.commands.abstract_command import AbstractCommand
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
+from spotty.commands.writers.instance_output_writer import InstanceOutputWriter
+from spotty.utils import render_table
 
 
 class AbstractConfigCommand(AbstractCommand):
     """Abstract class for a Spotty sub-command that needs to use a project's configuration."""
 
+    # the command can be run for several instances at once using the "--all" or the "--instances" options
+    fleet_support = False
+
     @abstractmethod
     def _run(self, instance_manager: AbstractInstanceManager, args: Namespace, output: AbstractOutputWriter):
         raise NotImplementedError
@@ -18,12 +27,30 @@ class AbstractConfigCommand(AbstractCommand):
     def configure(self, parser: ArgumentParser):
         super().configure(parser)
         parser.add_argument('-c', '--config', type=str, default=None, help='Path to the configuration file')
-        parser.add_argument('instance_name', metavar='INSTANCE_NAME', nargs='?', type=str, help='Instance name')
+
+        if self.fleet_support:
+            group = parser.add_mutually_exclusive_group()
+            group.add_argument('instance_name', metavar='INSTANCE_NAME', nargs='?', type=str, help='Instance name')
+            group.add_argument('-a', '--all', action='store_true',
+                               help='Run the command for all the instances from the configuration file concurrently')
+            group.add_argument('-i', '--instances', type=str, metavar='NAMES',
+                               help='Comma-separated names of the instances to run the command for concurrently')
+        else:
+            parser.add_argument('instance_name', metavar='INSTANCE_NAME', nargs='?', type=str, help='Instance name')
 
     def run(self, args: Namespace, output: AbstractOutputWriter):
         # get project configuration
         project_config = load_config(args.config)
 
+        # run the command for several instances
+        if self._is_fleet(args):
+            instance_ids = list(range(len(project_config.instances))) if args.all \
+                else self._get_instance_ids_by_names(project_config.instances, args.instances)
+            instance_managers = [InstanceManagerFactory.get_instance(project_config, project_config.instances[i])
+                                 for i in instance_ids]
+            self._run_fleet(instance_managers, args, output)
+            return
+
         # get instance configuration
         instance_id = self._get_instance_id(project_config.instances, args.instance_name, output)
         instance_config = project_config.instances[instance_id]
@@ -34,6 +61,76 @@ class AbstractConfigCommand(AbstractCommand):
         # run the command
         self._run(instance_manager, args, output)
 
+    def _is_fleet(self, args: Namespace) -> bool:
+        """Checks if the command should be run for several instances."""
+        return self.fleet_support and (args.all or bool(args.instances))
+
+    def _run_fleet(self, instance_managers: List[AbstractInstanceManager], args: Namespace,
+                   output: AbstractOutputWriter):
+        """Runs the command for several instances concurrently.
+
+        Messages of the instances are written line by line with the instance names as prefixes.
+        Once all the instances are processed, a summary table is displayed.
+        """
+        names = [instance_manager.instance_config.name for instance_manager in instance_managers]
+        name_length = max(len(name) for name in names)
+        lock = threading.Lock()
+
+        def run_instance(instance_manager: AbstractInstanceManager, instance_output: InstanceOutputWriter):
+            start_time = time.time()
+            try:
+                # the timings of different instances are reported separately
+                with timings.instance(instance_manager.instance_config.name):
+                    self._run(instance_manager, args, instance_output)
+
+                error = None
+            except Exception as e:
+                error = e
+                instance_output.write('Error: %s' % e)
+            finally:
+                instance_output.flush()
+
+            return error, time.time() - start_time
+
+        with ThreadPoolExecutor(max_workers=len(instance_managers)) as executor:
+            futures = [executor.submit(run_instance, instance_manager,
+                                       InstanceOutputWriter(output, ('[%s]' % name).ljust(name_length + 3), lock))
+                       for instance_manager, name in zip(instance_managers, names)]
+            results = [future.result() for future in futures]
+
+        # print the summary
+        table = [('Instance', 'Result', 'Duration')]
+        for name, (error, duration) in zip(names, results):
+            result = 'OK' if error is None else ('FAILED: %s' % str(error).split('\n')[0])
+            table.append((name, result, '%.0fs' % duration))
+
+        output.write('\n%s\n' % render_table(table, separate_title=True))
+
+        num_failed = sum(1 for error, _ in results if error is not None)
+        if num_failed:
+            raise ValueError('The command failed for %d of %d instances.' % (num_failed, len(results)))
+
+    @staticmethod
+    def _get_instance_ids_by_names(instances: List[dict], instance_names: str) -> List[int]:
+        """Returns IDs of the instances from a comma-separated list of names."""
+        instance_ids = []
+        for instance_name in instance_names.split(','):
+            instance_name = instance_name.strip()
+            if not instance_name:
+                continue
+
+            ids = [i for i, instance in enumerate(instances) if instance['name'] == instance_name]
+            if not ids:
+                raise ValueError('Instance "%s" not found in the configuration file' % instance_name)
+
+            if ids[0] not in instance_ids:
+                instance_ids.append(ids[0])
+
+        if not instance_ids:
+            raise ValueError('Instance names are not specified.')
+
+        return instance_ids
+
     @staticmethod
     def _get_instance_id(instances: List[dict], instance_name: str, output: AbstractOutputWriter):
         if not instance_name:
@@ -1,5 +1,6 @@
 from spotty.commands.abstract_provider_command import AbstractProviderCommand
 from spotty.providers.aws.commands.clean_logs import CleanLogsCommand
+from spotty.providers.aws.commands.create_ami import CreateAmiCommand
 from spotty.providers.aws.commands.spot_prices import SpotPricesCommand
 
 
@@ -10,4 +11,5 @@ class AwsCommand(AbstractProviderCommand):
     commands = [
         SpotPricesCommand,
         CleanLogsCommand,
+        CreateAmiCommand,
     ]
@@ -1,11 +1,15 @@
 from argparse import ArgumentParser, Namespace
 from spotty.commands.abstract_config_command import AbstractConfigCommand
+from spotty.config.config_utils import load_config
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
-from spotty.deployment.utils.commands import get_script_command, get_log_command, get_tmux_session_command, get_bash_command
+from spotty.deployment.utils.commands import get_tmux_session_command, get_bash_command
 from spotty.errors.instance_not_running import InstanceNotRunningError
 from spotty.errors.nothing_to_do import NothingToDoError
 from spotty.deployment.utils.user_scripts import parse_script_parameters, render_script
 from spotty.deployment.abstract_instance_manager import AbstractInstanceManager
+from spotty.deployment.job_pool import JobPool, Job, read_params_file, JOB_LOST_EXIT_CODE
+from spotty.providers.instance_manager_factory import InstanceManagerFactory
+from spotty.utils import render_table
 
 
 class RunCommand(AbstractConfigCommand):
@@ -25,6 +29,15 @@ class RunCommand(AbstractConfigCommand):
                                  'argument can be used multiple times to set several parameters. Parameters can be '
                                  'used in the script as Mustache variables (for example: {{PARAMETER}}).')
         parser.add_argument('--no-sync', action='store_true', help='Don\'t sync the project before running the script')
+        parser.add_argument('--pool', type=str, metavar='NAMES',
+                            help='Comma-separated names of the instances to run the script on. Each job runs in a '
+                                 'detached tmux session and its output is always logged to a file.')
+        parser.add_argument('--params-file', type=str, metavar='PATH',
+                            help='A JSON Lines file for the "--pool" option: each line is an object with the '
+                                 'script parameters for one job. The "-p" parameters are used as default values.')
+        parser.add_argument('--max-attempts', type=int, default=2,
+                            help='Maximum number of attempts to run a job with the "--pool" option, failed jobs '
+                                 'are retried on other instances (default: 2)')
 
         # add the "double-dash" argument to the usage message
         parser.prog = 'spotty run'
@@ -32,6 +45,18 @@ class RunCommand(AbstractConfigCommand):
         parser.epilog = 'The double dash (--) separates custom arguments that you can pass to the script ' \
                         'from the Spotty arguments.'
 
+    def run(self, args: Namespace, output: AbstractOutputWriter):
+        if args.pool:
+            if args.instance_name:
+                raise ValueError('The instance name cannot be used together with the "--pool" option.')
+
+            self._run_pool(args, output)
+        else:
+            if args.params_file:
+                raise ValueError('The "--params-file" option can be used only with the "--pool" option.')
+
+            super().run(args, output)
+
     def _run(self, instance_manager: AbstractInstanceManager, args: Namespace, output: AbstractOutputWriter):
         # check that the script exists
         script_name = args.script_name
@@ -55,10 +80,9 @@ class RunCommand(AbstractConfigCommand):
                 pass
 
         # get a command to run the script with "docker exec"
-        script_command = get_script_command(script_name, script_content, script_args=args.custom_args,
-                                            logging=args.logging)
-        command = instance_manager.container_commands.exec(script_command, interactive=True, tty=True,
-                                                           user=args.user)
+        command = instance_manager.get_script_exec_command(script_name, script_content, script_args=args.custom_args,
+                                                           logging=args.logging, user=args.user, interactive=True,
+                                                           tty=True)
 
         # wrap the command with the tmux session
         if instance_manager.use_tmux:
@@ -70,3 +94,57 @@ class RunCommand(AbstractConfigCommand):
 
         # execute command on the host OS
         instance_manager.exec(command)
+
+    def _run_pool(self, args: Namespace, output: AbstractOutputWriter):
+        project_config = load_config(args.config)
+
+        # check that the script exists
+        script_name = args.script_name
+        if script_name not in project_config.scripts:
+            raise ValueError('Script "%s" is not defined in the configuration file.' % script_name)
+
+        if args.max_attempts < 1:
+            raise ValueError('The number of attempts should be greater than 0.')
+
+        # render the script for every set of parameters
+        default_params = parse_script_parameters(args.parameter)
+        params_list = read_params_file(args.params_file) if args.params_file else [{}]
+        jobs = [Job(i + 1, params, render_script(project_config.scripts[script_name], {**default_params, **params}))
+                for i, params in enumerate(params_list)]
+
+        instance_ids = self._get_instance_ids_by_names(project_config.instances, args.pool)
+        instance_managers = [InstanceManagerFactory.get_instance(project_config, project_config.instances[i])
+                             for i in instance_ids]
+
+        for instance_manager in instance_managers:
+            # check that the instance is started
+            if not instance_manager.is_running():
+                raise InstanceNotRunningError(instance_manager.instance_config.name)
+
+            # sync the project with the instance
+            if not args.no_sync:
+                try:
+                    with output.prefix('[%s] ' % instance_manager.instance_config.name):
+                        instance_manager.sync(output)
+                except NothingToDoError:
+                    pass
+
+        output.write('Running %d job(s) on %d instance(s)...' % (len(jobs), len(instance_managers)))
+
+        job_pool = JobPool(instance_managers, script_name, script_args=args.custom_args, user=args.user,
+                           max_attempts=args.max_attempts)
+        results = job_pool.run(jobs, output)
+
+        # print the summary
+        table = [('Job', 'Parameters', 'Instance', 'Attempts', 'Result')]
+        for result in results:
+            params_str = ', '.join('%s=%s' % (key, value) for key, value in sorted(result.job.params.items()))
+            status = 'OK' if result.exit_code == 0 else \
+                ('FAILED (exit code: %d)' % result.exit_code if result.exit_code != JOB_LOST_EXIT_CODE else 'FAILED')
+            table.append(('#%d' % result.job.num, params_str, result.instance_name or '-', result.attempts, status))
+
+        output.write('\n%s\n' % render_table(table, separate_title=True))
+
+        num_failed = sum(1 for result in results if result.exit_code != 0)
+        if num_failed:
+            raise ValueError('%d of %d jobs failed.' % (num_failed, len(results)))
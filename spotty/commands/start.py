@@ -1,14 +1,17 @@
+from typing import List
 from argparse import Namespace, ArgumentParser
 from spotty.commands.abstract_config_command import AbstractConfigCommand
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
 from spotty.errors.instance_not_running import InstanceNotRunningError
 from spotty.deployment.abstract_instance_manager import AbstractInstanceManager
+from spotty.deployment.utils.timings import timings
 
 
 class StartCommand(AbstractConfigCommand):
 
     name = 'start'
     description = 'Start an instance with a container'
+    fleet_support = True
 
     def configure(self, parser: ArgumentParser):
         super().configure(parser)
@@ -17,6 +20,9 @@ class StartCommand(AbstractConfigCommand):
         parser.add_argument('--dry-run', action='store_true', help='Displays the steps that would be performed '
                                                                    'using the specified command without actually '
                                                                    'running them')
+        parser.add_argument('--timings', action='store_true', help='Show how long each phase of the deployment took')
+        parser.add_argument('--timings-json', type=str, metavar='PATH',
+                            help='Save durations of the deployment phases to a JSON file')
 
     def _run(self, instance_manager: AbstractInstanceManager, args: Namespace, output: AbstractOutputWriter):
         dry_run = args.dry_run
@@ -39,8 +45,15 @@ class StartCommand(AbstractConfigCommand):
                              % instance_name)
         else:
             # start the instance
-            with output.prefix('[dry-run] ' if dry_run else ''):
-                instance_manager.start(output, dry_run)
+            try:
+                with output.prefix('[dry-run] ' if dry_run else ''):
+                    with timings.span('starting the instance'):
+                        instance_manager.start(output, dry_run)
+            finally:
+                # report timings even if the deployment failed, for several instances
+                # the report is displayed once all of them are started
+                if not self._is_fleet(args):
+                    self._report_timings(args, output)
 
             if not dry_run:
                 instance_name = ''
@@ -50,3 +63,18 @@ class StartCommand(AbstractConfigCommand):
                 output.write('\n%s\n'
                              '\nUse the "spotty sh%s" command to connect to the container.\n'
                              % (instance_manager.get_status_text(), instance_name))
+
+    def _run_fleet(self, instance_managers: List[AbstractInstanceManager], args: Namespace,
+                   output: AbstractOutputWriter):
+        try:
+            super()._run_fleet(instance_managers, args, output)
+        finally:
+            self._report_timings(args, output)
+
+    @staticmethod
+    def _report_timings(args: Namespace, output: AbstractOutputWriter):
+        if args.timings:
+            output.write('\nTimings:\n%s' % timings.render_report())
+
+        if args.timings_json:
+            timings.save_json(args.timings_json)
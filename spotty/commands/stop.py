@@ -1,4 +1,4 @@
-from argparse import Namespace
+from argparse import Namespace, ArgumentParser
 from spotty.commands.abstract_config_command import AbstractConfigCommand
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
 from spotty.deployment.abstract_instance_manager import AbstractInstanceManager
@@ -8,14 +8,15 @@ class StopCommand(AbstractConfigCommand):
 
     name = 'stop'
     description = 'Terminate running instance and apply deletion policies for the volumes'
+    fleet_support = True
 
-    # TODO: the "spotty start" command should restart the instance and the container if the instance was shutdown
-    # def configure(self, parser: ArgumentParser):
-    #     super().configure(parser)
-    #     parser.add_argument('-s', '--shutdown', action='store_true',
-    #                         help='Shutdown the instance without terminating it. Deletion policies for the volumes '
-    #                              'won\'t be applied.')
+    def configure(self, parser: ArgumentParser):
+        super().configure(parser)
+        parser.add_argument('-s', '--only-shutdown', action='store_true',
+                            help='Shutdown the instance without terminating it. Deletion policies for the volumes '
+                                 'won\'t be applied. The "spotty start" command will restart the instance and '
+                                 'the container.')
 
     def _run(self, instance_manager: AbstractInstanceManager, args: Namespace, output: AbstractOutputWriter):
 
-        instance_manager.stop(only_shutdown=False, output=output)
+        instance_manager.stop(only_shutdown=args.only_shutdown, output=output)
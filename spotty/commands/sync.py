@@ -14,6 +14,8 @@ class SyncCommand(AbstractConfigCommand):
     def configure(self, parser: ArgumentParser):
         super().configure(parser)
         parser.add_argument('--dry-run', action='store_true', help='Show files to be synced')
+        parser.add_argument('-w', '--watch', action='store_true', help='Keep watching the project directory and '
+                                                                      'upload changed files to the instance')
 
     def _run(self, instance_manager: AbstractInstanceManager, args: Namespace, output: AbstractOutputWriter):
         # check that the instance is started
@@ -21,11 +23,24 @@ class SyncCommand(AbstractConfigCommand):
             raise InstanceNotRunningError(instance_manager.instance_config.name)
 
         dry_run = args.dry_run
+        if dry_run and args.watch:
+            raise ValueError('The "--dry-run" and "--watch" flags cannot be used together.')
+
         with output.prefix('[dry-run] ' if dry_run else ''):
             try:
                 instance_manager.sync(output, dry_run)
+            except NothingToDoError as e:
+                output.write(str(e))
+                if not args.watch:
+                    return
+
+        if args.watch:
+            try:
+                instance_manager.watch(output)
             except NothingToDoError as e:
                 output.write(str(e))
                 return
+            except KeyboardInterrupt:
+                pass
 
         output.write('Done')
@@ -0,0 +1,32 @@
+import threading
+from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
+
+
+class InstanceOutputWriter(AbstractOutputWriter):
+    """Writes messages of one of the instances that are processed concurrently.
+
+    Complete lines are prefixed with the instance name and written to the shared
+    output writer, so messages from different instances don't get mixed. Empty lines
+    are skipped.
+    """
+
+    def __init__(self, output: AbstractOutputWriter, line_prefix: str, lock: threading.Lock):
+        super().__init__()
+        self._output = output
+        self._line_prefix = line_prefix
+        self._lock = lock
+        self._buffer = ''
+
+    def _write(self, msg: str, newline: bool = True):
+        self._buffer += msg
+        if newline:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered part of the line if there is one."""
+        lines = [line for line in self._buffer.split('\n') if line.strip()]
+        self._buffer = ''
+
+        with self._lock:
+            for line in lines:
+                self._output.write(self._line_prefix + line)
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import os
 from abc import ABC, abstractmethod
 from collections import OrderedDict, namedtuple
@@ -22,7 +24,7 @@ class AbstractInstanceConfig(ABC):
         # set instance parameters
         self._name = instance_config['name']
         self._provider_name = instance_config['provider']
-        self._params = self._validate_instance_params(instance_config['parameters'])
+        self._params = self._get_validated_params(instance_config['parameters'])
 
         # get container config
         container_configs = filter_list(project_config.containers, 'name', self.container_name)
@@ -40,6 +42,19 @@ class AbstractInstanceConfig(ABC):
         # get the host project directory
         self._host_project_dir = self._get_host_project_dir(self._volume_mounts)
 
+    def _get_validated_params(self, params: dict) -> dict:
+        """Returns validated instance parameters, uses the config cache if it's available."""
+        config_cache = self._project_config.config_cache
+        if not config_cache:
+            return self._validate_instance_params(params)
+
+        validated_params = config_cache.get_instance_params(self._name, params)
+        if validated_params is None:
+            validated_params = self._validate_instance_params(params)
+            config_cache.set_instance_params(self._name, params, validated_params)
+
+        return validated_params
+
     @abstractmethod
     def _validate_instance_params(self, params: dict) -> dict:
         """Validates instance parameters and fill missing ones with the default values."""
@@ -73,6 +88,11 @@ class AbstractInstanceConfig(ABC):
         """Provider name."""
         return self._provider_name
 
+    @property
+    def params_hash(self) -> str:
+        """Hash of the instance parameters to find out if the instance was deployed with a different config."""
+        return hashlib.sha1(json.dumps(self._params, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
     @property
     def container_name(self) -> str:
         return self._params['containerName'] if self._params['containerName'] else DEFAULT_CONTAINER_NAME
@@ -138,6 +158,16 @@ class AbstractInstanceConfig(ABC):
         """A directory mainly for the "spotty run" command logs."""
         return self.host_container_dir + '/logs'
 
+    @property
+    def host_scripts_dir(self):
+        """A directory with the scripts uploaded to the host OS, file names contain hashes of the scripts."""
+        return self.host_container_dir + '/scripts'
+
+    @property
+    def host_jobs_dir(self):
+        """A directory with exit codes of the jobs started by the "spotty run --pool" command."""
+        return self.host_container_dir + '/jobs'
+
     @property
     def host_volumes_dir(self):
         """A directory with temporary volumes. If there is a Volume Mount in the configuration file
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import logging
+import os
+from typing import List
+import spotty
+from spotty.configuration import get_spotty_cache_dir
+
+
+class ConfigCache(object):
+    """Keeps a validated project configuration between runs of Spotty.
+
+    The cache is keyed by the path, size, modification time and content hash of
+    each configuration file and by the version of Spotty, so any edit of the files
+    invalidates it. Validated parameters of the instances are stored alongside,
+    keyed by a hash of the raw parameters.
+    """
+
+    def __init__(self, config_paths: List[str]):
+        self._key = json.dumps([spotty.__version__] + [_get_file_fingerprint(path) for path in config_paths])
+        self._path = os.path.join(get_spotty_cache_dir('config'),
+                                  '%s.json' % hashlib.sha1(config_paths[0].encode()).hexdigest())
+        self._data = None
+
+    def _load(self) -> dict:
+        if self._data is None:
+            self._data = {}
+            if os.path.isfile(self._path):
+                try:
+                    with open(self._path) as f:
+                        data = json.load(f)
+                except ValueError:
+                    data = {}
+
+                if data.get('key') == self._key:
+                    self._data = data
+
+        return self._data
+
+    def _save(self):
+        data = {**self._load(), 'key': self._key}
+        tmp_path = '%s.%d.tmp' % (self._path, os.getpid())
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            logging.debug('Couldn\'t save the config cache: ' + str(e))
+
+    def get_config(self) -> dict:
+        """Returns the validated config or None if the config files were changed."""
+        return self._load().get('config')
+
+    def set_config(self, config: dict):
+        """Saves the validated config."""
+        config_copy = _get_json_copy(config)
+        if config_copy is not None:
+            self._load().clear()
+            self._data['config'] = config_copy
+            self._save()
+
+    def get_instance_params(self, instance_name: str, params: dict) -> dict:
+        """Returns validated parameters of the instance or None if they were not validated yet."""
+        cached_params = self._load().get('instance_params', {}).get(instance_name)
+        if cached_params and (cached_params['hash'] == _get_params_hash(params)):
+            return cached_params['params']
+
+        return None
+
+    def set_instance_params(self, instance_name: str, params: dict, validated_params: dict):
+        """Saves validated parameters of the instance."""
+        params_copy = _get_json_copy(validated_params)
+        if params_copy is not None:
+            self._load().setdefault('instance_params', {})[instance_name] = {
+                'hash': _get_params_hash(params),
+                'params': params_copy,
+            }
+            self._save()
+
+
+def _get_file_fingerprint(path: str) -> list:
+    if not os.path.isfile(path):
+        return [path, None]
+
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        file_hash = hashlib.sha1(f.read()).hexdigest()
+
+    return [path, stat.st_size, stat.st_mtime_ns, file_hash]
+
+
+def _get_params_hash(params: dict) -> str:
+    return hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _get_json_copy(data: dict):
+    """Returns a copy of the data if it will be the same after loading it from JSON, otherwise - None."""
+    try:
+        data_copy = json.loads(json.dumps(data))
+    except (TypeError, ValueError):
+        return None
+
+    return data_copy if data_copy == data else None
@@ -1,8 +1,9 @@
 import os
 from collections import namedtuple
 import yaml
+from spotty.config.config_cache import ConfigCache
 from spotty.config.project_config import ProjectConfig
-from spotty.config.validation import DEFAULT_CONTAINER_NAME
+from spotty.config.validation import DEFAULT_CONTAINER_NAME, validate_basic_config
 
 
 DEFAULT_CONFIG_FILENAME = 'spotty.yaml'
@@ -25,18 +26,31 @@ def load_config(config_path: str = None) -> ProjectConfig:
     # get the project directory
     project_dir = os.path.dirname(config_abs_path)
 
+    # get paths to the config files
+    config_paths = [config_abs_path]
+    if os.path.basename(config_abs_path) == DEFAULT_CONFIG_FILENAME:
+        config_paths.append(os.path.join(project_dir, OVERRIDE_CONFIG_FILENAME))
+
+    # use the validated config from the cache if the files were not changed
+    config_cache = ConfigCache(config_paths)
+    config = config_cache.get_config()
+    if config is not None:
+        return ProjectConfig(config, project_dir, validate=False, config_cache=config_cache)
+
     # read the config
     config = _read_yaml(config_abs_path)
 
     # update the config if an override config exists
-    if os.path.basename(config_abs_path) == DEFAULT_CONFIG_FILENAME:
-        override_config_abs_path = os.path.join(project_dir, OVERRIDE_CONFIG_FILENAME)
-        if os.path.isfile(override_config_abs_path):
-            override_config = _read_yaml(override_config_abs_path)
-            config = _merge_configs(config, override_config)
+    if len(config_paths) > 1 and os.path.isfile(config_paths[1]):
+        override_config = _read_yaml(config_paths[1])
+        config = _merge_configs(config, override_config)
+
+    # validate the config
+    config = validate_basic_config(config)
+    config_cache.set_config(config)
 
     # get project configuration
-    project_config = ProjectConfig(config, project_dir)
+    project_config = ProjectConfig(config, project_dir, validate=False, config_cache=config_cache)
 
     return project_config
 
@@ -1,19 +1,27 @@
+from spotty.config.config_cache import ConfigCache
 from spotty.config.validation import validate_basic_config
 
 
 class ProjectConfig(object):
 
-    def __init__(self, config: dict, project_dir: str):
+    def __init__(self, config: dict, project_dir: str, validate: bool = True, config_cache: ConfigCache = None):
         # validate the config
-        config = validate_basic_config(config)
+        if validate:
+            config = validate_basic_config(config)
 
         self._project_dir = project_dir
         self._config = config
+        self._config_cache = config_cache
 
     @property
     def project_dir(self) -> str:
         return self._project_dir
 
+    @property
+    def config_cache(self) -> ConfigCache:
+        """A cache for validated parameters of the instances."""
+        return self._config_cache
+
     @property
     def project_name(self) -> str:
         return self._config['project']['name']
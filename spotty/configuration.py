@@ -17,3 +17,12 @@ def get_spotty_keys_dir(provider_name: str):
         os.makedirs(path, mode=0o755, exist_ok=True)
 
     return path
+
+
+def get_spotty_cache_dir(cache_name: str):
+    """Spotty cache directory."""
+    path = os.path.join(get_spotty_config_dir(), 'cache', cache_name)
+    if not os.path.isdir(path):
+        os.makedirs(path, mode=0o755, exist_ok=True)
+
+    return path
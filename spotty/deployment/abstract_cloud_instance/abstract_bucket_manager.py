@@ -1,18 +1,69 @@
-from abc import ABC
+from abc import ABC, abstractmethod
+from spotty.deployment.abstract_cloud_instance.bucket_name_cache import BucketNameCache
 from spotty.deployment.abstract_cloud_instance.resources.abstract_bucket import AbstractBucket
 
 
 class AbstractBucketManager(ABC):
 
-    def __init__(self, project_name: str):
+    def __init__(self, project_name: str, region: str):
         self._project_name = project_name
+        self._region = region
+        self._bucket = None
 
     @property
     def project_name(self) -> str:
         return self._project_name
 
-    def get_bucket(self) -> AbstractBucket:
+    @property
+    @abstractmethod
+    def provider_name(self) -> str:
         raise NotImplementedError
 
+    def get_bucket(self) -> AbstractBucket:
+        """Returns the project bucket.
+
+        The bucket name is cached locally and verified with a cheap request. The bucket
+        is looked up again only if the cached bucket doesn't exist anymore.
+
+        Raises:
+            BucketNotFoundError: The project bucket doesn't exist.
+        """
+        if not self._bucket:
+            bucket_name_cache = BucketNameCache(self.provider_name, self._project_name, self._region)
+
+            bucket_name = bucket_name_cache.get()
+            if bucket_name:
+                self._bucket = self._get_bucket_by_name(bucket_name)
+                if not self._bucket:
+                    bucket_name_cache.delete()
+
+            if not self._bucket:
+                self._bucket = self._find_bucket()
+                bucket_name_cache.save(self._bucket.name)
+
+        return self._bucket
+
     def create_bucket(self) -> AbstractBucket:
+        """Creates a bucket for the project."""
+        self._bucket = self._create_bucket()
+        BucketNameCache(self.provider_name, self._project_name, self._region).save(self._bucket.name)
+
+        return self._bucket
+
+    @abstractmethod
+    def _get_bucket_by_name(self, bucket_name: str) -> AbstractBucket:
+        """Returns the bucket if it exists, otherwise - None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _find_bucket(self) -> AbstractBucket:
+        """Looks up the project bucket in the cloud.
+
+        Raises:
+            BucketNotFoundError: The project bucket doesn't exist.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _create_bucket(self) -> AbstractBucket:
         raise NotImplementedError
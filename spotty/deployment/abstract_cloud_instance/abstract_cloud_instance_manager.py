@@ -1,4 +1,7 @@
 import logging
+import subprocess
+import threading
+import time
 from abc import ABC, abstractmethod
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
 from spotty.config.project_config import ProjectConfig
@@ -6,18 +9,40 @@ from spotty.deployment.abstract_cloud_instance.abstract_data_transfer import Abs
 from spotty.deployment.abstract_cloud_instance.abstract_instance_deployment import AbstractInstanceDeployment
 from spotty.deployment.abstract_cloud_instance.abstract_bucket_manager import AbstractBucketManager
 from spotty.deployment.abstract_cloud_instance.errors.bucket_not_found import BucketNotFoundError
+from spotty.deployment.abstract_cloud_instance.resources.abstract_instance import AbstractInstance
+from spotty.deployment.abstract_cloud_instance.instance_endpoint_cache import InstanceEndpointCache, InstanceEndpoint
+from spotty.deployment.abstract_cloud_instance.sync_manifest import SyncManifest
+from spotty.deployment.container.docker.scripts.start_container_script import ImageCacheCommands
+from spotty.deployment.utils.commands import get_ssh_command
+from spotty.deployment.utils.rsync import check_rsync_installed, get_download_command, get_transferred_size
+from spotty.deployment.utils.timings import timings
+from spotty.errors.nothing_to_do import NothingToDoError
 from spotty.errors.instance_not_running import InstanceNotRunningError
 from spotty.deployment.abstract_ssh_instance_manager import AbstractSshInstanceManager
 
 
 class AbstractCloudInstanceManager(AbstractSshInstanceManager, ABC):
 
+    # bigger downloads go through the bucket, as files are transferred from the bucket in parallel
+    DIRECT_DOWNLOAD_MAX_SIZE = 10 * 1024 ** 3
+
+    # in the watch mode, the bucket is refreshed once the project files stay unchanged for this period of time
+    BUCKET_REFRESH_DELAY_SECS = 30
+
+    _confirmation_lock = threading.Lock()
+
     def __init__(self, project_config: ProjectConfig, instance_config: dict):
         super().__init__(project_config, instance_config)
 
         self._bucket_manager = self._get_bucket_manager()
         self._data_transfer = self._get_data_transfer()
         self._instance_deployment = self._get_instance_deployment()
+        self._endpoint_cache = InstanceEndpointCache(project_config.project_name, self.instance_config.name,
+                                                     self.instance_config.provider_name)
+
+        self._is_bucket_outdated = False
+        self._bucket_refresh_timer = None
+        self._bucket_refresh_lock = threading.Lock()
 
     @abstractmethod
     def _get_bucket_manager(self) -> AbstractBucketManager:
@@ -51,20 +76,42 @@ class AbstractCloudInstanceManager(AbstractSshInstanceManager, ABC):
 
     def is_running(self) -> bool:
         """Checks if the instance is running."""
-        instance = self.instance_deployment.get_instance()
-        return instance and instance.is_running
+        return self._get_instance_endpoint() is not None
+
+    def exec(self, command: str, tty: bool = True) -> int:
+        """Executes a command on the host OS."""
+        cached_endpoint = self._endpoint_cache.get()
+        exit_code = super().exec(command, tty)
+
+        if exit_code == 255:
+            # SSH connection failed, the cached address of the instance could be outdated
+            endpoint = self._get_instance_endpoint(refresh=True)
+            if not endpoint:
+                raise InstanceNotRunningError(self.instance_config.name)
+
+            if not self._instance_config.local_ssh_port and cached_endpoint \
+                    and (endpoint.ip_address != cached_endpoint.ip_address):
+                exit_code = super().exec(command, tty)
+
+        return exit_code
 
     def start(self, output: AbstractOutputWriter, dry_run=False):
         # make sure the Dockerfile exists
         self._check_dockerfile_exists()
 
         if not dry_run:
+            self._endpoint_cache.delete()
+
             # check if the instance is already running
             instance = self.instance_deployment.get_instance()
             if instance:
                 if instance.is_running:
-                    print('Instance is already running. Are you sure you want to restart it?')
-                    res = input('Type "y" to confirm: ')
+                    # several instances can be started concurrently, so the questions are asked one by one
+                    with self._confirmation_lock:
+                        print('Instance "%s" is already running. Are you sure you want to restart it?'
+                              % self.instance_config.name)
+                        res = input('Type "y" to confirm: ')
+
                     if res != 'y':
                         raise ValueError('The operation was cancelled.')
 
@@ -74,31 +121,74 @@ class AbstractCloudInstanceManager(AbstractSshInstanceManager, ABC):
                     output.write('DONE')
 
                 elif instance.is_stopped:
-                    # TODO: restart the instance if it stopped
-                    pass
+                    # start the stopped instance and the container without redeploying the stack
+                    resume_instance_cmd = self.instance_deployment.get_resume_instance_command()
+                    if resume_instance_cmd:
+                        if self.instance_deployment.is_deployed_with_current_config():
+                            self._resume_instance(instance, resume_instance_cmd, output)
+                            return
+
+                        output.write('The instance parameters were changed since the instance was stopped, '
+                                     'the instance will be redeployed.')
 
         # create or get existing bucket for the project
         bucket_name = None
-        try:
-            bucket_name = self.bucket_manager.get_bucket().name
-        except BucketNotFoundError:
-            if not dry_run:
-                bucket_name = self.bucket_manager.create_bucket().name
-                output.write('Bucket "%s" was created.' % bucket_name)
+        with timings.span('getting the bucket'), self.instance_deployment.shared_resources_lock:
+            try:
+                bucket_name = self.bucket_manager.get_bucket().name
+            except BucketNotFoundError:
+                if not dry_run:
+                    bucket_name = self.bucket_manager.create_bucket().name
+                    output.write('Bucket "%s" was created.' % bucket_name)
+
+        # get the state of the project files before they are uploaded to the bucket
+        sync_manifest = None
+        local_state = None
+        if not dry_run:
+            with timings.span('hashing the project files'):
+                sync_manifest = self._get_sync_manifest(bucket_name)
+                sync_manifest.delete()
+                local_state = sync_manifest.get_local_state(self.project_config.project_dir)
 
         # deploy the instance
-        self.instance_deployment.deploy(
-            container_commands=self.container_commands,
-            bucket_name=bucket_name,
-            data_transfer=self.data_transfer,
-            output=output,
-            dry_run=dry_run,
-        )
+        with timings.span('deploying the instance'):
+            self.instance_deployment.deploy(
+                container_commands=self.container_commands,
+                bucket_name=bucket_name,
+                data_transfer=self.data_transfer,
+                output=output,
+                dry_run=dry_run,
+            )
+
+        if not dry_run:
+            # the instance downloaded the project from the bucket during the deployment
+            sync_manifest.save(local_state)
+
+            # cache the address of the new instance
+            self._get_instance_endpoint(refresh=True)
 
     def stop(self, only_shutdown: bool, output: AbstractOutputWriter):
+        # the next start will sync the project from scratch
+        try:
+            self._get_sync_manifest(self.bucket_manager.get_bucket().name).delete()
+        except BucketNotFoundError:
+            pass
+
+        # close the master SSH connection while the instance is still available
+        try:
+            self.close_ssh_connection()
+        except InstanceNotRunningError:
+            pass
+
+        self._endpoint_cache.delete()
+
         if only_shutdown:
+            instance = self.instance_deployment.get_instance()
+            if not instance or not instance.is_running:
+                raise InstanceNotRunningError(self.instance_config.name)
+
             output.write('Shutting down the instance... ', newline=False)
-            self.instance_deployment.get_instance().stop()
+            instance.stop()
             output.write('DONE')
         else:
             # delete the stack and apply deletion policies
@@ -111,6 +201,16 @@ class AbstractCloudInstanceManager(AbstractSshInstanceManager, ABC):
         # get the project bucket name
         bucket_name = self.bucket_manager.get_bucket().name
 
+        # compare the project files with the last synced state
+        sync_manifest = self._get_sync_manifest(bucket_name)
+        local_state = sync_manifest.get_local_state(self.project_config.project_dir)
+        if sync_manifest.is_synced(local_state):
+            if not dry_run:
+                # update modification times, so the hashes won't be recalculated next time
+                sync_manifest.save(local_state)
+
+            raise NothingToDoError('Nothing to do. The project is already synced with the instance.')
+
         # sync the project with the S3 bucket
         output.write('Syncing the project with the bucket...')
         self.data_transfer.upload_local_to_bucket(bucket_name, dry_run=dry_run)
@@ -129,7 +229,68 @@ class AbstractCloudInstanceManager(AbstractSshInstanceManager, ABC):
             if exit_code != 0:
                 raise ValueError('Failed to download files from the bucket to the instance')
 
+            sync_manifest.save(local_state)
+
+    def watch(self, output: AbstractOutputWriter):
+        try:
+            super().watch(output)
+        finally:
+            if self._bucket_refresh_timer:
+                self._bucket_refresh_timer.cancel()
+
+            if self._is_bucket_outdated:
+                output.write('Syncing the project with the bucket...')
+                self._refresh_bucket()
+
+    def upload_files(self, rel_paths: list, deleted_rel_paths: list, compress: bool = False):
+        super().upload_files(rel_paths, deleted_rel_paths, compress=compress)
+
+        # the files go directly to the instance, the bucket is refreshed in background once the changes stop
+        self._is_bucket_outdated = True
+        if self._bucket_refresh_timer:
+            self._bucket_refresh_timer.cancel()
+
+        self._bucket_refresh_timer = threading.Timer(self.BUCKET_REFRESH_DELAY_SECS, self._refresh_bucket)
+        self._bucket_refresh_timer.daemon = True
+        self._bucket_refresh_timer.start()
+
+    def _refresh_bucket(self):
+        """Uploads the project to the bucket, so it has the same files as the instance."""
+        with self._bucket_refresh_lock:
+            if not self._is_bucket_outdated:
+                return
+
+            self._is_bucket_outdated = False
+            try:
+                bucket_name = self.bucket_manager.get_bucket().name
+                sync_manifest = self._get_sync_manifest(bucket_name)
+                local_state = sync_manifest.get_local_state(self.project_config.project_dir)
+
+                self.data_transfer.upload_local_to_bucket(bucket_name)
+                sync_manifest.save(local_state)
+            except Exception as e:
+                self._is_bucket_outdated = True
+                logging.warning('Failed to sync the project with the bucket: ' + str(e))
+
     def download(self, download_filters: list, output: AbstractOutputWriter, dry_run=False):
+        # download files directly from the instance if rsync is available and the files are not too big
+        download_size = self._get_direct_download_size(download_filters)
+        if download_size is not None:
+            logging.debug('Download size: %d bytes' % download_size)
+            if not download_size:
+                raise NothingToDoError('Nothing to do. The files are already downloaded.')
+
+            if download_size <= self.DIRECT_DOWNLOAD_MAX_SIZE:
+                output.write('Downloading files from the instance...')
+                rsync_cmd = self._get_download_rsync_command(download_filters, dry_run=dry_run)
+                logging.debug('rsync command: ' + rsync_cmd)
+
+                exit_code = subprocess.call(rsync_cmd, shell=True)
+                if exit_code != 0:
+                    raise ValueError('Failed to download files from the instance.')
+
+                return
+
         # get the project bucket name
         bucket_name = self.bucket_manager.get_bucket().name
 
@@ -153,22 +314,119 @@ class AbstractCloudInstanceManager(AbstractSshInstanceManager, ABC):
             output.write('Downloading files from the bucket to local...')
             self.data_transfer.download_bucket_to_local(bucket_name=bucket_name, download_filters=download_filters)
 
+    def _resume_instance(self, instance: AbstractInstance, resume_instance_cmd: str, output: AbstractOutputWriter):
+        """Starts the stopped instance, syncs the project and starts the container."""
+        output.write('Starting the stopped instance... ', newline=False)
+        with timings.span('starting the stopped instance'):
+            instance.start()
+        output.write('DONE')
+
+        output.write('Waiting for SSH... ', newline=False)
+        with timings.span('waiting for SSH'):
+            self._wait_ssh_available()
+        output.write('DONE')
+
+        with timings.span('preparing the instance'):
+            logging.debug('Resume instance command: ' + resume_instance_cmd)
+            exit_code = self.exec(resume_instance_cmd, tty=False)
+            if exit_code != 0:
+                raise ValueError('Failed to prepare the instance. Use the "spotty stop" command to terminate '
+                                 'the instance and start it again.')
+
+        with timings.span('starting the container'):
+            self.start_container(output)
+
+    def _wait_ssh_available(self, timeout: int = 300, delay_secs: int = 5):
+        """Waits until the instance accepts SSH connections."""
+        start_time = time.time()
+        while True:
+            ssh_command = get_ssh_command(self.ssh_host, self.ssh_port, self.ssh_user, self.ssh_key_path, 'true',
+                                          tty=False, quiet=True, control_path=self.ssh_control_path)
+            exit_code = subprocess.call(ssh_command, shell=True, stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.DEVNULL)
+            if exit_code == 0:
+                break
+
+            if time.time() - start_time > timeout:
+                raise ValueError('The instance is not available over SSH.')
+
+            time.sleep(delay_secs)
+
+    def _get_direct_download_size(self, download_filters: list) -> int:
+        """Returns the size of files to download from the instance using rsync
+        or None if the files cannot be downloaded directly."""
+        try:
+            check_rsync_installed()
+        except ValueError:
+            return None
+
+        rsync_cmd = self._get_download_rsync_command(download_filters, dry_run=True, stats=True)
+        logging.debug('rsync command: ' + rsync_cmd)
+
+        res = subprocess.run(rsync_cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if res.returncode != 0:
+            logging.debug('Failed to get the download size: ' + res.stderr.decode('utf-8', 'ignore'))
+            return None
+
+        return get_transferred_size(res.stdout.decode('utf-8', 'ignore'))
+
+    def _get_download_rsync_command(self, download_filters: list, dry_run: bool = False, stats: bool = False) -> str:
+        return get_download_command(
+            local_dir=self.project_config.project_dir,
+            remote_dir=self.instance_config.host_project_dir,
+            ssh_user=self.ssh_user,
+            ssh_host=self.ssh_host,
+            ssh_key_path=self.ssh_key_path,
+            ssh_port=self.ssh_port,
+            filters=download_filters,
+            use_sudo=(not self.instance_config.container_config.run_as_host_user),
+            dry_run=dry_run,
+            ssh_control_path=self.ssh_control_path,
+            stats=stats,
+        )
+
+    def _get_image_cache_commands(self) -> ImageCacheCommands:
+        if not self.instance_config.cache_docker_image:
+            return None
+
+        return self.data_transfer.get_image_cache_commands(self.bucket_manager.get_bucket().name)
+
+    def _get_sync_manifest(self, bucket_name: str) -> SyncManifest:
+        """Returns a manifest of the project files that were synced with the instance."""
+        return SyncManifest(self.project_config.project_name, self.instance_config.name,
+                            '%s:%s' % (bucket_name, self.instance_config.host_project_dir),
+                            self.project_config.sync_filters)
+
+    def _get_instance_endpoint(self, refresh: bool = False) -> InstanceEndpoint:
+        """Returns an endpoint of the running instance or None if the instance is not running.
+        The endpoint is taken from the local cache, unless the refresh is requested."""
+        if not refresh:
+            endpoint = self._endpoint_cache.get()
+            if endpoint:
+                return endpoint
+
+        instance = self.instance_deployment.get_instance()
+        if not instance or not instance.is_running:
+            self._endpoint_cache.delete()
+            return None
+
+        return self._endpoint_cache.save(instance)
+
     @property
     def ssh_host(self):
         """Returns an IP address that will be used for SSH connections."""
         if self._instance_config.local_ssh_port:
             return '127.0.0.1'
 
-        # get a public IP address of the running instance
-        instance = self.instance_deployment.get_instance()
-        if not instance or not instance.is_running:
+        # get an IP address of the running instance
+        endpoint = self._get_instance_endpoint()
+        if not endpoint:
             raise InstanceNotRunningError(self.instance_config.name)
 
-        instance_ip_address = instance.public_ip_address if instance.public_ip_address else instance.private_ip_address
-        if not instance_ip_address:
+        if not endpoint.ip_address:
             raise ValueError('Instance IP address not found')
 
-        return instance_ip_address
+        return endpoint.ip_address
 
     @property
     def ssh_port(self) -> int:
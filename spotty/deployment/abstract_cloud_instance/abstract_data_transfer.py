@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from spotty.deployment.container.docker.scripts.start_container_script import ImageCacheCommands
 
 
 class AbstractDataTransfer(ABC):
@@ -22,9 +23,17 @@ class AbstractDataTransfer(ABC):
         """A bucket path where the project files are located."""
         return '%s://%s/project' % (self.scheme_name, bucket_name)
 
+    def _get_bucket_downloads_prefix(self) -> str:
+        """A prefix of the bucket objects for the downloaded files."""
+        return 'download/instance-%s' % self.instance_name
+
     def _get_bucket_downloads_path(self, bucket_name: str) -> str:
         """A bucket path where the downloaded files are located."""
-        return '%s://%s/download/instance-%s' % (self.scheme_name, bucket_name, self.instance_name)
+        return '%s://%s/%s' % (self.scheme_name, bucket_name, self._get_bucket_downloads_prefix())
+
+    def _get_bucket_image_cache_path(self, bucket_name: str) -> str:
+        """A bucket path where the saved Docker image for the instance is located."""
+        return '%s://%s/docker-images/instance-%s.tar' % (self.scheme_name, bucket_name, self.instance_name)
 
     @abstractmethod
     def upload_local_to_bucket(self, bucket_name: str, dry_run: bool = False):
@@ -46,3 +55,8 @@ class AbstractDataTransfer(ABC):
                                               dry_run: bool = False) -> str:
         """A remote command to upload files from the instance to the bucket."""
         raise NotImplementedError
+
+    @abstractmethod
+    def get_image_cache_commands(self, bucket_name: str) -> ImageCacheCommands:
+        """Remote commands to download a saved Docker image from the bucket and to upload it back."""
+        raise NotImplementedError
@@ -1,3 +1,4 @@
+import threading
 from abc import abstractmethod, ABC
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
 from spotty.config.abstract_instance_config import AbstractInstanceConfig
@@ -8,6 +9,10 @@ from spotty.deployment.container.abstract_container_commands import AbstractCont
 
 class AbstractInstanceDeployment(ABC):
 
+    # instances of the project can be deployed concurrently, but they share the bucket and
+    # the SSH key, so these resources are created and updated by one deployment at a time
+    shared_resources_lock = threading.RLock()
+
     def __init__(self, instance_config: AbstractInstanceConfig):
         self._instance_config = instance_config
 
@@ -26,6 +31,15 @@ class AbstractInstanceDeployment(ABC):
         """Deploys or redeploys the instance."""
         raise NotImplementedError
 
+    def get_resume_instance_command(self) -> str:
+        """A remote command that prepares a restarted instance to run the container.
+        Returns None if the stopped instances cannot be resumed and should be redeployed."""
+        return None
+
+    def is_deployed_with_current_config(self) -> bool:
+        """Checks that the instance parameters weren't changed since the instance was deployed."""
+        return True
+
     @abstractmethod
     def delete(self, output: AbstractOutputWriter):
         """Deletes the stack with the instance and applies deletion policies for the volumes."""
@@ -0,0 +1,51 @@
+import json
+import os
+import threading
+from spotty.configuration import get_spotty_cache_dir
+
+
+class BucketNameCache(object):
+    """Keeps names of the project buckets, so the buckets don't need to be looked up every time."""
+
+    # the cache file is shared by all the instances that can be processed concurrently
+    _lock = threading.Lock()
+
+    def __init__(self, provider_name: str, project_name: str, region: str):
+        self._path = os.path.join(get_spotty_cache_dir('buckets'), '%s.json' % provider_name)
+        self._key = '%s:%s' % (project_name, region)
+
+    def _load(self) -> dict:
+        if not os.path.isfile(self._path):
+            return {}
+
+        try:
+            with open(self._path) as f:
+                return json.load(f)
+        except ValueError:
+            return {}
+
+    def _save(self, data: dict):
+        tmp_path = '%s.%d.tmp' % (self._path, os.getpid())
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+        os.replace(tmp_path, self._path)
+
+    def get(self) -> str:
+        """Returns the cached bucket name or None."""
+        with self._lock:
+            return self._load().get(self._key)
+
+    def save(self, bucket_name: str):
+        with self._lock:
+            data = self._load()
+            if data.get(self._key) != bucket_name:
+                data[self._key] = bucket_name
+                self._save(data)
+
+    def delete(self):
+        with self._lock:
+            data = self._load()
+            if self._key in data:
+                del data[self._key]
+                self._save(data)
@@ -17,5 +17,8 @@ INSTANCE_SCRIPTS_DIR = INSTANCE_DIR + '/scripts'
 # instance startup scripts
 INSTANCE_STARTUP_SCRIPTS_DIR = INSTANCE_SCRIPTS_DIR + '/startup'
 
+# logs of the instance startup stages
+INSTANCE_STARTUP_LOGS_DIR = '/var/log/spotty/startup'
+
 # a path to the script that attaches user to the container
 CONTAINER_BASH_SCRIPT_PATH = INSTANCE_SCRIPTS_DIR + '/container_bash.sh'
@@ -0,0 +1,70 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from spotty.configuration import get_spotty_cache_dir
+from spotty.deployment.abstract_cloud_instance.resources.abstract_instance import AbstractInstance
+
+
+InstanceEndpoint = namedtuple('InstanceEndpoint', ['instance_id', 'ip_address', 'state', 'launch_time'])
+
+
+class InstanceEndpointCache(object):
+    """Keeps an address of the running instance, so SSH commands don't need to look up the instance
+    in the cloud every time. Entries expire after the TTL (in seconds)."""
+
+    TTL = 3600
+
+    # the temporary file name is the same for all the threads of the process
+    _lock = threading.Lock()
+
+    def __init__(self, project_name: str, instance_name: str, provider_name: str, ttl: int = TTL):
+        key = json.dumps([project_name, instance_name, provider_name])
+        self._key = key
+        self._path = os.path.join(get_spotty_cache_dir('instances'),
+                                  '%s.json' % hashlib.sha1(key.encode()).hexdigest())
+        self._ttl = ttl
+
+    def get(self) -> InstanceEndpoint:
+        """Returns the cached endpoint or None if it's not cached or expired."""
+        if not os.path.isfile(self._path):
+            return None
+
+        try:
+            with open(self._path) as f:
+                data = json.load(f)
+        except ValueError:
+            return None
+
+        if (data.get('key') != self._key) or (data['updated_at'] + self._ttl < time.time()):
+            return None
+
+        return InstanceEndpoint(**data['endpoint'])
+
+    def save(self, instance: AbstractInstance) -> InstanceEndpoint:
+        """Saves an endpoint of the running instance."""
+        ip_address = instance.public_ip_address if instance.public_ip_address else instance.private_ip_address
+        launch_time = instance.launch_time
+        endpoint = InstanceEndpoint(
+            instance_id=instance.instance_id,
+            ip_address=ip_address,
+            state=instance.state,
+            launch_time=launch_time.timestamp() if launch_time else None,
+        )
+
+        with self._lock:
+            tmp_path = '%s.%d.tmp' % (self._path, os.getpid())
+            with open(tmp_path, 'w') as f:
+                json.dump({'key': self._key, 'updated_at': time.time(), 'endpoint': endpoint._asdict()}, f)
+
+            os.replace(tmp_path, self._path)
+
+        return endpoint
+
+    def delete(self):
+        """Invalidates the cache."""
+        with self._lock:
+            if os.path.isfile(self._path):
+                os.unlink(self._path)
@@ -1,8 +1,21 @@
 from abc import ABC
+from datetime import datetime
 
 
 class AbstractInstance(ABC):
 
+    @property
+    def instance_id(self) -> str:
+        raise NotImplementedError
+
+    @property
+    def state(self) -> str:
+        raise NotImplementedError
+
+    @property
+    def launch_time(self) -> datetime:
+        raise NotImplementedError
+
     @property
     def public_ip_address(self):
         raise NotImplementedError
@@ -21,6 +34,9 @@ class AbstractInstance(ABC):
         """Returns true if the instance is stopped, so it can be restarted."""
         raise NotImplementedError
 
+    def start(self, wait: bool = True):
+        raise NotImplementedError
+
     def terminate(self, wait: bool = True):
         raise NotImplementedError
 
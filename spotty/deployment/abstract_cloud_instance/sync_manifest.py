@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+from spotty.configuration import get_spotty_cache_dir
+from spotty.deployment.utils.sync_filters import get_local_files
+
+
+class SyncManifest(object):
+    """Keeps the state of the project files that were synced with the instance last time.
+
+    The state is a dictionary where keys are relative paths and values are
+    [size, mtime, hash] lists. Content hashes are only recalculated for files
+    with a changed size or modification time.
+    """
+
+    def __init__(self, project_name: str, instance_name: str, bucket_path: str, sync_filters: list):
+        key = json.dumps([project_name, instance_name, bucket_path, sync_filters], sort_keys=True)
+        self._key = key
+        self._path = os.path.join(get_spotty_cache_dir('sync'), '%s.json' % hashlib.sha1(key.encode()).hexdigest())
+        self._sync_filters = sync_filters
+
+    def _load_files(self) -> dict:
+        if not os.path.isfile(self._path):
+            return {}
+
+        try:
+            with open(self._path) as f:
+                data = json.load(f)
+        except ValueError:
+            return {}
+
+        return data['files'] if data.get('key') == self._key else {}
+
+    def get_local_state(self, local_dir: str) -> dict:
+        """Returns the current state of the local project files."""
+        synced_files = self._load_files()
+
+        files = {}
+        for rel_path, local_file in get_local_files(local_dir, self._sync_filters).items():
+            synced_file = synced_files.get(rel_path)
+            if synced_file and (synced_file[0] == local_file.size) and (synced_file[1] == local_file.mtime):
+                file_hash = synced_file[2]
+            else:
+                file_hash = _get_file_hash(local_file.path)
+
+            files[rel_path] = [local_file.size, local_file.mtime, file_hash]
+
+        return files
+
+    def is_synced(self, local_state: dict) -> bool:
+        """Checks if the local state has the same content as the last synced state."""
+        synced_files = self._load_files()
+        if synced_files.keys() != local_state.keys():
+            return False
+
+        for rel_path, (size, _, file_hash) in local_state.items():
+            if (synced_files[rel_path][0] != size) or (synced_files[rel_path][2] != file_hash):
+                return False
+
+        return True
+
+    def save(self, local_state: dict):
+        """Saves the state of the synced files."""
+        tmp_path = self._path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'key': self._key, 'files': local_state}, f)
+
+        os.replace(tmp_path, self._path)
+
+    def delete(self):
+        """Deletes the manifest, so the next sync will transfer the files."""
+        if os.path.isfile(self._path):
+            os.unlink(self._path)
+
+
+def _get_file_hash(path: str) -> str:
+    file_hash = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
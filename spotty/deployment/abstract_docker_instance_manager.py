@@ -1,9 +1,10 @@
 import os
 from abc import ABC
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
-from spotty.deployment.utils.commands import get_script_command
+from spotty.deployment.utils.commands import get_script_command, get_script_file_command
 from spotty.deployment.container.docker.docker_commands import DockerCommands
-from spotty.deployment.container.docker.scripts.start_container_script import StartContainerScript
+from spotty.deployment.container.docker.scripts.start_container_script import StartContainerScript, \
+    ImageCacheCommands
 from spotty.deployment.container.docker.scripts.stop_container_script import StopContainerScript
 from spotty.deployment.abstract_instance_manager import AbstractInstanceManager
 from spotty.errors.nothing_to_do import NothingToDoError
@@ -36,8 +37,9 @@ class AbstractDockerInstanceManager(AbstractInstanceManager, ABC):
             pass
 
         # generate a script that starts container
-        start_container_script = StartContainerScript(self.container_commands).render()
-        start_container_command = get_script_command('start-container', start_container_script)
+        start_container_script = StartContainerScript(self.container_commands,
+                                                      image_cache=self._get_image_cache_commands()).render()
+        start_container_command = self._get_host_script_command('start-container', start_container_script)
 
         # start the container
         exit_code = self.exec(start_container_command)
@@ -51,7 +53,7 @@ class AbstractDockerInstanceManager(AbstractInstanceManager, ABC):
     def stop(self, only_shutdown: bool, output: AbstractOutputWriter):
         # stop container
         stop_container_script = StopContainerScript(self.container_commands).render()
-        stop_container_command = get_script_command('stop-container', stop_container_script)
+        stop_container_command = self._get_host_script_command('stop-container', stop_container_script)
 
         exit_code = self.exec(stop_container_command)
         if exit_code != 0:
@@ -65,6 +67,42 @@ class AbstractDockerInstanceManager(AbstractInstanceManager, ABC):
 
         return render_table([(msg,)])
 
+    def get_script_exec_command(self, script_name: str, script_content: str, script_args: list = None,
+                                logging: bool = False, user: str = None, interactive: bool = False,
+                                tty: bool = False) -> str:
+        """A command for the host OS that runs the script inside the container."""
+        script_path = self.upload_script(script_content)
+        if not script_path:
+            script_command = get_script_command(script_name, script_content, script_args=script_args,
+                                                logging=logging)
+            return self.container_commands.exec(script_command, interactive=interactive, tty=tty, user=user)
+
+        # copy the uploaded script to the container, the copy is local to the host and it's cheap
+        container_script_path = '/tmp/' + os.path.basename(script_path)
+        script_command = get_script_file_command(script_name, container_script_path, script_args=script_args,
+                                                 logging=logging)
+
+        return '%s && %s' % (self.container_commands.copy(script_path, container_script_path),
+                             self.container_commands.exec(script_command, interactive=interactive, tty=tty,
+                                                          user=user))
+
+    def upload_script(self, script_content: str) -> str:
+        """Uploads the script to the host OS and returns its path. Returns None if
+        the script should be inlined into the command."""
+        return None
+
+    def _get_host_script_command(self, script_name: str, script_content: str) -> str:
+        """A command that runs the script on the host OS."""
+        script_path = self.upload_script(script_content)
+        if not script_path:
+            return get_script_command(script_name, script_content)
+
+        return get_script_file_command(script_name, script_path)
+
+    def _get_image_cache_commands(self) -> ImageCacheCommands:
+        """Commands to restore a built Docker image from the cache or None if the image is not cached."""
+        return None
+
     def _check_dockerfile_exists(self):
         """Raises an error if a Dockerfile specified in the configuration file but doesn't exist."""
         if self.instance_config.container_config.file:
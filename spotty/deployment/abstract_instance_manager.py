@@ -65,6 +65,11 @@ class AbstractInstanceManager(ABC):
         """Synchronizes the project code with the instance."""
         raise NotImplementedError
 
+    @abstractmethod
+    def watch(self, output: AbstractOutputWriter):
+        """Watches the project directory and uploads changed files to the instance until interrupted."""
+        raise NotImplementedError
+
     @abstractmethod
     def download(self, download_filters: list, output: AbstractOutputWriter, dry_run=False):
         """Downloads files from the instance."""
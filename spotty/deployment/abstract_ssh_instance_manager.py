@@ -1,23 +1,176 @@
+import hashlib
 import logging
 import os
+import shlex
+import subprocess
+import sys
+import time
 from abc import abstractmethod
-from spotty.deployment.utils.commands import get_ssh_command
+from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
+from spotty.configuration import get_spotty_config_dir
+from spotty.deployment.utils.commands import get_ssh_command, get_ssh_control_exit_command, \
+    get_shared_dir_command
+from spotty.deployment.utils.file_watcher import get_file_watcher
+from spotty.deployment.utils.tar_archive import write_tar_archive
 from spotty.deployment.abstract_docker_instance_manager import AbstractDockerInstanceManager
 
 
 class AbstractSshInstanceManager(AbstractDockerInstanceManager):
 
+    # delay before the changes are uploaded again if the previous upload failed
+    WATCH_RETRY_DELAY_SECS = 5
+
+    # the project is synced using rsync, so the sync filters that match a directory exclude all its files
+    RSYNC_FILTER_RULES = False
+
     def exec(self, command: str, tty: bool = True) -> int:
         """Executes a command on the host OS."""
         if not os.path.isfile(self.ssh_key_path):
             raise ValueError('SSH key doesn\'t exist: ' + self.ssh_key_path)
 
         ssh_command = get_ssh_command(self.ssh_host, self.ssh_port, self.ssh_user, self.ssh_key_path,
-                                      command, env_vars=self.ssh_env_vars, tty=tty)
+                                      command, env_vars=self.ssh_env_vars, tty=tty,
+                                      control_path=self.ssh_control_path)
         logging.debug('SSH command: ' + ssh_command)
 
         return super().exec(ssh_command)
 
+    def stop(self, only_shutdown: bool, output: AbstractOutputWriter):
+        super().stop(only_shutdown, output)
+        self.close_ssh_connection()
+
+    def watch(self, output: AbstractOutputWriter):
+        watcher = get_file_watcher(self.project_config.project_dir, self.project_config.sync_filters,
+                                   rsync_rules=self.RSYNC_FILTER_RULES)
+        output.write('Watching the project directory for changes. Press Ctrl+C to stop.')
+
+        # changes that are not uploaded yet, they are kept until the upload succeeds
+        changed = set()
+        deleted = set()
+
+        try:
+            while True:
+                # if the previous upload failed, it's retried after a delay even if there are no new changes
+                changes = watcher.wait_changes(timeout=(self.WATCH_RETRY_DELAY_SECS if changed or deleted else None))
+                changed = (changed - set(changes.deleted)) | set(changes.changed)
+                deleted = (deleted - set(changes.changed)) | set(changes.deleted)
+                if not changed and not deleted:
+                    continue
+
+                try:
+                    self.upload_files(sorted(changed), sorted(deleted))
+                except (ValueError, OSError) as e:
+                    output.write('[%s] Failed to sync the changes, retrying in %d seconds: %s'
+                                 % (time.strftime('%H:%M:%S'), self.WATCH_RETRY_DELAY_SECS, str(e)))
+                    continue
+
+                output.write('[%s] Synced: %d changed, %d deleted file(s).'
+                             % (time.strftime('%H:%M:%S'), len(changed), len(deleted)))
+
+                changed = set()
+                deleted = set()
+        finally:
+            watcher.close()
+
+    def upload_files(self, rel_paths: list, deleted_rel_paths: list, compress: bool = False):
+        """Uploads the project files directly to the instance and deletes the removed files.
+
+        The files are streamed as a tar archive through the master SSH connection.
+        """
+        sudo = '' if self.instance_config.container_config.run_as_host_user else 'sudo '
+        host_project_dir = shlex.quote(self.instance_config.host_project_dir)
+
+        if deleted_rel_paths:
+            remote_cmd = 'cd %s && %sxargs -0 rm -f --' % (host_project_dir, sudo)
+            file_list = b''.join(os.fsencode(rel_path) + b'\0' for rel_path in deleted_rel_paths)
+            self._exec_with_input(remote_cmd, lambda stdin: stdin.write(file_list))
+
+        if rel_paths:
+            remote_cmd = '%smkdir -p %s && %star -x%s -f - -C %s --no-same-owner' \
+                         % (sudo, host_project_dir, sudo, 'z' if compress else '', host_project_dir)
+            self._exec_with_input(remote_cmd, lambda stdin: write_tar_archive(
+                stdin, self.project_config.project_dir, rel_paths, compress=compress))
+
+    def upload_script(self, script_content: str) -> str:
+        """Uploads the script to the host OS and returns its path.
+
+        Scripts are stored by the hashes of their contents, so running the same script
+        again only checks that the file exists instead of sending the whole script.
+        Returns None if the script couldn't be uploaded, so it will be inlined into the command.
+        """
+        script_hash = hashlib.sha256(script_content.encode('utf-8')).hexdigest()[:16]
+        script_path = '%s/spotty-script-%s.sh' % (self.instance_config.host_scripts_dir, script_hash)
+
+        exit_code = self.exec('test -f %s' % shlex.quote(script_path), tty=False)
+        if exit_code == 0:
+            return script_path
+
+        if exit_code != 1:
+            # the host is not available, the script will be inlined into the command
+            return None
+
+        # write the script to a temporary file first, so a concurrent run never sees a partial script
+        tmp_script_path = shlex.quote(script_path) + '.$$'
+        remote_cmd = '%s && cat > %s && chmod 755 %s && mv %s %s' \
+                     % (get_shared_dir_command(self.instance_config.host_scripts_dir), tmp_script_path,
+                        tmp_script_path, tmp_script_path, shlex.quote(script_path))
+        try:
+            self._exec_with_input(remote_cmd, lambda stdin: stdin.write(script_content.encode('utf-8')))
+        except ValueError as e:
+            logging.debug('Failed to upload the script, it will be inlined into the command: ' + str(e))
+            return None
+
+        return script_path
+
+    def is_host_project_dir_empty(self) -> bool:
+        """Checks if the project directory on the host OS doesn't exist or doesn't contain any files."""
+        host_project_dir = shlex.quote(self.instance_config.host_project_dir)
+        exit_code = self.exec('[ -z "$(ls -A %s 2>/dev/null | grep -vx lost+found)" ]' % host_project_dir,
+                              tty=False)
+
+        return exit_code == 0
+
+    def _exec_with_input(self, command: str, write_input):
+        """Executes a command on the host OS and writes data to its standard input."""
+        ssh_command = get_ssh_command(self.ssh_host, self.ssh_port, self.ssh_user, self.ssh_key_path, command,
+                                      tty=False, quiet=True, control_path=self.ssh_control_path)
+        logging.debug('SSH command: ' + ssh_command)
+
+        process = subprocess.Popen(ssh_command, shell=True, stdin=subprocess.PIPE)
+        try:
+            write_input(process.stdin)
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+
+        if process.wait() != 0:
+            raise ValueError('Failed to upload files to the instance.')
+
+    def close_ssh_connection(self):
+        """Closes the master SSH connection if it exists."""
+        if not self.ssh_control_path:
+            return
+
+        exit_command = get_ssh_control_exit_command(self.ssh_host, self.ssh_port, self.ssh_user,
+                                                    self.ssh_control_path)
+        logging.debug('SSH command: ' + exit_command)
+
+        subprocess.call(exit_command, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    @property
+    def ssh_control_path(self) -> str:
+        """A path to the socket of the master SSH connection that is shared by all SSH sessions
+        with the same host, port and user. Returns None if connection sharing is not supported."""
+        if sys.platform == 'win32':
+            return None
+
+        control_dir = os.path.join(get_spotty_config_dir(), 'ssh')
+        if not os.path.isdir(control_dir):
+            os.makedirs(control_dir, mode=0o700, exist_ok=True)
+
+        # "%C" is replaced by SSH with a hash of the local host name, remote host, port and user
+        return os.path.join(control_dir, 'cm-%C')
+
     @property
     @abstractmethod
     def ssh_host(self):
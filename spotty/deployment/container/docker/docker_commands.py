@@ -5,7 +5,7 @@ from spotty.deployment.utils.cli import shlex_join
 
 class DockerCommands(AbstractContainerCommands):
 
-    def build(self, image_name: str) -> str:
+    def build(self, image_name: str, cache_from: str = None) -> str:
         if not self._instance_config.dockerfile_path:
             raise ValueError('Cannot generate the "build" command as Dockerfile path is not specified')
 
@@ -19,6 +19,11 @@ class DockerCommands(AbstractContainerCommands):
             build_cmd += ' --build-arg USER_ID=$(id -u %s) --build-arg GROUP_ID=$(id -g %s)' \
                          % (self._instance_config.user, self._instance_config.user)
 
+        if cache_from:
+            # BuildKit reuses layers of a loaded image only if the image contains inline cache metadata,
+            # so the built image, that is cached for the next build, is built with the metadata
+            build_cmd += ' --cache-from %s --build-arg BUILDKIT_INLINE_CACHE=1' % cache_from
+
         return build_cmd
 
     def pull(self) -> str:
@@ -67,6 +72,14 @@ class DockerCommands(AbstractContainerCommands):
     def remove(self):
         return 'docker rm -f "%s" > /dev/null' % self._instance_config.full_container_name
 
+    def copy(self, host_path: str, container_path: str, container_name: str = None) -> str:
+        """Copies a file from the host OS to the container if the container is running."""
+        container_name = container_name if container_name else self._instance_config.full_container_name
+        test_cmd = self.is_created(container_name, is_running=True)
+
+        return 'if %s; then docker cp %s %s:%s; fi' \
+               % (test_cmd, shlex.quote(host_path), container_name, shlex.quote(container_path))
+
     def exec(self, command: str, interactive: bool = False, tty: bool = False, user: str = None,
              container_name: str = None, working_dir: str = None) -> str:
         container_name = container_name if container_name else self._instance_config.full_container_name
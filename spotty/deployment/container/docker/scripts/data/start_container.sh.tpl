@@ -11,8 +11,26 @@ fi
 {{> before_image_build}}
 
 {{#build_image_cmd}}
+{{#image_cache}}
+if ! docker image inspect {{{cache_image_name}}} &> /dev/null; then
+  echo 'Loading Docker image from the cache...'
+  {{{download_cmd}}} | docker load || echo 'Docker image is not cached yet.'
+fi
+CACHED_IMAGE_ID=$(docker images -q --no-trunc {{{cache_image_name}}})
+
+{{/image_cache}}
 echo 'Building Docker image...'
 {{{build_image_cmd}}}
+{{#image_cache}}
+
+# upload the image to the cache in background if the build produced a new image
+docker tag {{{image_name}}} {{{cache_image_name}}}
+if [ "$(docker images -q --no-trunc {{{cache_image_name}}})" != "$CACHED_IMAGE_ID" ]; then
+  echo 'Uploading Docker image to the cache in background...'
+  mkdir -p "$(dirname '{{{upload_log_path}}}')"
+  (trap '' HUP; docker save {{{cache_image_name}}} | {{{upload_cmd}}}) > '{{{upload_log_path}}}' 2>&1 < /dev/null &
+fi
+{{/image_cache}}
 {{/build_image_cmd}}
 
 {{> before_container_run}}
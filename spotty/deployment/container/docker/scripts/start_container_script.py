@@ -1,12 +1,22 @@
 import os
 import time
+from collections import namedtuple
 import chevron
 from spotty.deployment.utils.commands import get_script_command
+from spotty.deployment.container.docker.docker_commands import DockerCommands
 from spotty.deployment.container.docker.scripts.abstract_docker_script import AbstractDockerScript
 
 
+# commands that stream a saved Docker image from the cache to stdout and from stdin to the cache
+ImageCacheCommands = namedtuple('ImageCacheCommands', ['download_cmd', 'upload_cmd'])
+
+
 class StartContainerScript(AbstractDockerScript):
 
+    def __init__(self, container_commands: DockerCommands, image_cache: ImageCacheCommands = None):
+        super().__init__(container_commands)
+        self._image_cache = image_cache
+
     def _partials(self) -> dict:
         return {
             'before_image_build': '',
@@ -21,9 +31,23 @@ class StartContainerScript(AbstractDockerScript):
             template = f.read()
 
         # generate "docker build" command if necessary
+        image_cache = ''
         if self.commands.instance_config.dockerfile_path:
             image_name = '%s:%d' % (self.commands.instance_config.full_container_name, time.time())
-            build_image_cmd = self.commands.build(image_name)
+
+            # layers of the previously built image are restored from the cache and reused by the build
+            cache_image_name = None
+            if self._image_cache:
+                cache_image_name = '%s:cache' % self.commands.instance_config.full_container_name
+                image_cache = {
+                    'image_name': image_name,
+                    'cache_image_name': cache_image_name,
+                    'download_cmd': self._image_cache.download_cmd,
+                    'upload_cmd': self._image_cache.upload_cmd,
+                    'upload_log_path': self.commands.instance_config.host_container_dir + '/image-cache-upload.log',
+                }
+
+            build_image_cmd = self.commands.build(image_name, cache_from=cache_image_name)
             pull_image_cmd = ''
         else:
             image_name = self.commands.instance_config.container_config.image
@@ -43,6 +67,7 @@ class StartContainerScript(AbstractDockerScript):
             'is_created_cmd': self.commands.is_created(),
             'remove_cmd': self.commands.remove(),
             'build_image_cmd': build_image_cmd,
+            'image_cache': image_cache,
             'pull_image_cmd': pull_image_cmd,
             'tmp_container_dir': self.commands.instance_config.host_container_dir,
             'start_container_cmd': self.commands.run(image_name),
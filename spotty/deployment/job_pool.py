@@ -0,0 +1,212 @@
+import json
+import shlex
+import time
+from collections import namedtuple, deque
+from typing import List
+from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
+from spotty.deployment.abstract_instance_manager import AbstractInstanceManager
+from spotty.deployment.utils.commands import get_tmux_session_command, get_shared_dir_command
+from spotty.errors.instance_not_running import InstanceNotRunningError
+
+
+# a job is a script rendered with one set of parameters
+Job = namedtuple('Job', ['num', 'params', 'script_content'])
+
+# the final state of a job
+JobResult = namedtuple('JobResult', ['job', 'instance_name', 'exit_code', 'attempts'])
+
+# an exit code that is used when a job couldn't be started or the instance became unavailable
+JOB_LOST_EXIT_CODE = -1
+
+
+def read_params_file(file_path: str) -> List[dict]:
+    """Reads a JSON Lines file where every non-empty line is an object with script parameters."""
+    params_list = []
+    with open(file_path) as f:
+        for i, line in enumerate(f):
+            if not line.strip():
+                continue
+
+            try:
+                params = json.loads(line)
+            except ValueError as e:
+                raise ValueError('Line %d of the parameters file is not a valid JSON: %s' % (i + 1, str(e)))
+
+            if not isinstance(params, dict):
+                raise ValueError('Line %d of the parameters file should contain a JSON object.' % (i + 1))
+
+            params_list.append({key: value if isinstance(value, str) else json.dumps(value)
+                                for key, value in params.items()})
+
+    if not params_list:
+        raise ValueError('The parameters file is empty.')
+
+    return params_list
+
+
+class JobPool(object):
+    """Runs jobs on a pool of instances.
+
+    Every instance runs one job at a time in a detached tmux session. Once a job
+    is finished, the instance gets the next job from the queue. Failed jobs are
+    retried on other instances if it's possible.
+    """
+
+    # consecutive SSH failures after which the instance is excluded from the pool
+    MAX_CHECK_ERRORS = 3
+
+    def __init__(self, instance_managers: List[AbstractInstanceManager], script_name: str, script_args: list = None,
+                 user: str = None, max_attempts: int = 2, poll_interval: float = 10):
+        self._instance_managers = {instance_manager.instance_config.name: instance_manager
+                                   for instance_manager in instance_managers}
+        self._script_name = script_name
+        self._script_args = script_args
+        self._user = user
+        self._max_attempts = max_attempts
+        self._poll_interval = poll_interval
+        self._run_id = str(int(time.time()))
+
+    def run(self, jobs: List[Job], output: AbstractOutputWriter) -> List[JobResult]:
+        """Runs the jobs and returns their results once all of them are finished."""
+        queue = deque(jobs)
+        attempts = {job.num: 0 for job in jobs}
+        failed_instances = {job.num: set() for job in jobs}
+        results = {}
+
+        free_instances = list(self._instance_managers)
+        running_jobs = {}
+        check_errors = {}
+
+        while queue or running_jobs:
+            # dispatch the jobs to the free instances, a failed job doesn't go to the same instance twice
+            # if there are other instances in the pool
+            for instance_name in list(free_instances):
+                job = self._pop_job(queue, instance_name, failed_instances)
+                if not job:
+                    continue
+
+                if self._start_job(instance_name, job, output):
+                    attempts[job.num] += 1
+                    free_instances.remove(instance_name)
+                    running_jobs[instance_name] = job
+                    check_errors[instance_name] = 0
+                else:
+                    # the job didn't run, so it doesn't use an attempt, but it goes to another instance
+                    queue.appendleft(job)
+                    failed_instances[job.num].add(instance_name)
+                    output.write('[%s] Failed to start job #%d.' % (instance_name, job.num))
+
+                    check_errors[instance_name] = check_errors.get(instance_name, 0) + 1
+                    if check_errors[instance_name] >= self.MAX_CHECK_ERRORS:
+                        self._exclude_instance(instance_name, output)
+                        free_instances.remove(instance_name)
+
+            # all the instances were excluded from the pool
+            if not running_jobs and not free_instances:
+                for job in queue:
+                    results[job.num] = JobResult(job, None, JOB_LOST_EXIT_CODE, attempts[job.num])
+
+                break
+
+            time.sleep(self._poll_interval)
+
+            # check which jobs are finished
+            for instance_name, job in list(running_jobs.items()):
+                exit_code = self._get_exit_code(instance_name, job)
+                if exit_code is None:
+                    continue
+
+                if exit_code == JOB_LOST_EXIT_CODE:
+                    check_errors[instance_name] += 1
+                    if check_errors[instance_name] < self.MAX_CHECK_ERRORS:
+                        continue
+
+                    self._exclude_instance(instance_name, output)
+                else:
+                    free_instances.append(instance_name)
+
+                del running_jobs[instance_name]
+                self._finish_job(instance_name, job, exit_code, queue, attempts, failed_instances, results, output)
+
+        return [results[job.num] for job in jobs]
+
+    def _exclude_instance(self, instance_name: str, output: AbstractOutputWriter):
+        output.write('[%s] Instance is not available, it\'s excluded from the pool.' % instance_name)
+        del self._instance_managers[instance_name]
+
+    def _pop_job(self, queue: deque, instance_name: str, failed_instances: dict) -> Job:
+        """Takes the first job from the queue that didn't fail on the instance before."""
+        for job in queue:
+            tried_instances = failed_instances[job.num]
+            if instance_name not in tried_instances or set(self._instance_managers) <= tried_instances:
+                queue.remove(job)
+                return job
+
+        return None
+
+    def _finish_job(self, instance_name: str, job: Job, exit_code: int, queue: deque, attempts: dict,
+                    failed_instances: dict, results: dict, output: AbstractOutputWriter):
+        if exit_code == 0:
+            output.write('[%s] Job #%d is finished.' % (instance_name, job.num))
+            results[job.num] = JobResult(job, instance_name, exit_code, attempts[job.num])
+            return
+
+        failed_instances[job.num].add(instance_name)
+        if attempts[job.num] < self._max_attempts and self._instance_managers:
+            output.write('[%s] Job #%d failed (exit code: %d), it will be retried.'
+                         % (instance_name, job.num, exit_code))
+            queue.appendleft(job)
+        else:
+            output.write('[%s] Job #%d failed (exit code: %d).' % (instance_name, job.num, exit_code))
+            results[job.num] = JobResult(job, instance_name, exit_code, attempts[job.num])
+
+    def _get_exit_code_path(self, instance_name: str, job: Job) -> str:
+        instance_config = self._instance_managers[instance_name].instance_config
+        return '%s/%s-%s-%d.exit_code' % (instance_config.host_jobs_dir, self._script_name, self._run_id, job.num)
+
+    def _start_job(self, instance_name: str, job: Job, output: AbstractOutputWriter) -> bool:
+        """Starts the job in a detached tmux session. Returns False if the job couldn't be started."""
+        instance_manager = self._instance_managers[instance_name]
+        exit_code_path = shlex.quote(self._get_exit_code_path(instance_name, job))
+        session_name = 'spotty-job-%s-%s-%d' % (self._script_name, self._run_id, job.num)
+
+        try:
+            # the exit code is written to a temporary file first, so the status check never reads a partial file
+            script_command = instance_manager.get_script_exec_command('%s-%d' % (self._script_name, job.num),
+                                                                      job.script_content,
+                                                                      script_args=self._script_args,
+                                                                      logging=True, user=self._user)
+            command = '%s; echo $? > %s.tmp && mv %s.tmp %s' \
+                      % (script_command, exit_code_path, exit_code_path, exit_code_path)
+
+            # the jobs directory is created inside the root-owned container directory
+            command = '%s && %s' % (get_shared_dir_command(instance_manager.instance_config.host_jobs_dir),
+                                    get_tmux_session_command(command, session_name, detached=True))
+
+            if instance_manager.exec(command, tty=False) != 0:
+                return False
+        except (ValueError, InstanceNotRunningError) as e:
+            output.write('[%s] %s' % (instance_name, str(e).split('\n')[0]))
+            return False
+
+        params_str = ', '.join('%s=%s' % (key, value) for key, value in sorted(job.params.items()))
+        output.write('[%s] Job #%d is started (%s).' % (instance_name, job.num, params_str or 'no parameters'))
+
+        return True
+
+    def _get_exit_code(self, instance_name: str, job: Job):
+        """Returns the exit code of the job or None if the job is still running."""
+        instance_manager = self._instance_managers[instance_name]
+        exit_code_path = shlex.quote(self._get_exit_code_path(instance_name, job))
+
+        try:
+            # "test" returns 1 if the job is still running, SSH returns 255 if the instance is not available
+            exit_code = instance_manager.exec('test -f %s' % exit_code_path, tty=False)
+            if exit_code == 1:
+                return None
+            elif exit_code != 0:
+                return JOB_LOST_EXIT_CODE
+
+            return instance_manager.exec('exit $(cat %s)' % exit_code_path, tty=False)
+        except (ValueError, InstanceNotRunningError):
+            return JOB_LOST_EXIT_CODE
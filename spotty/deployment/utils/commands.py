@@ -28,6 +28,19 @@ def get_script_command(script_name: str, script_content: str, script_args: list
         '$TMP_SCRIPT_PATH ' + script_args,
     ])
 
+    return _get_bash_script_command(script_name, script_cmd, logging)
+
+
+def get_script_file_command(script_name: str, script_path: str, script_args: list = None,
+                            logging: bool = False) -> str:
+    """Returns a one-line command that runs an executable script file that already exists."""
+    script_args = shlex_join(script_args) if script_args else ''
+    script_cmd = '%s %s' % (shlex.quote(script_path), script_args)
+
+    return _get_bash_script_command(script_name, script_cmd, logging)
+
+
+def _get_bash_script_command(script_name: str, script_cmd: str, logging: bool = False) -> str:
     # log the command output to a file
     if logging:
         log_file_path = '/var/log/spotty/run/%s-%d.log' % (script_name, time.time())
@@ -39,6 +52,13 @@ def get_script_command(script_name: str, script_content: str, script_args: list
     return script_cmd
 
 
+def get_shared_dir_command(dir_path: str) -> str:
+    """Returns a command that creates a directory writable by all users. The parent directory can be
+    owned by root, so the directory is created with "sudo" if the current user cannot create it."""
+    dir_path = shlex.quote(dir_path)
+    return '{ mkdir -pm 777 %s 2> /dev/null || sudo -n mkdir -pm 777 %s; }' % (dir_path, dir_path)
+
+
 def get_log_command(command: str, log_file_path: str) -> str:
     # log the command outputs to a file on the host OS
     log_dir = os.path.dirname(log_file_path)
@@ -54,8 +74,9 @@ def get_log_command(command: str, log_file_path: str) -> str:
 
 
 def get_tmux_session_command(command: str, session_name: str, window_name: str = None, default_command: str = None,
-                             keep_pane: bool = False) -> str:
-    session_cmd = 'tmux new -A -s ' + session_name
+                             keep_pane: bool = False, detached: bool = False) -> str:
+    # a detached session is created in background, otherwise the existing session is attached
+    session_cmd = ('tmux new -d -s ' if detached else 'tmux new -A -s ') + session_name
     if window_name:
         session_cmd += ' -n ' + window_name
 
@@ -74,16 +95,25 @@ def get_tmux_session_command(command: str, session_name: str, window_name: str =
         session_cmd += ' ' + shlex.quote(tmux_cmd)
 
     # use tmux only if it's installed
-    session_cmd = 'if command -v tmux &> /dev/null; then %s; else %s; fi' % (session_cmd, command)
+    if detached:
+        fallback_cmd = 'nohup %s -c %s > /dev/null 2>&1 &' % (get_bash_command(), shlex.quote(command))
+    else:
+        fallback_cmd = command + ';'
+
+    session_cmd = 'if command -v tmux &> /dev/null; then %s; else %s fi' % (session_cmd, fallback_cmd)
 
     return session_cmd
 
 
 def get_ssh_command(host: str, port: int, user: str, key_path: str, command: str, env_vars: dict = None,
-                    tty: bool = True, quiet: bool = False) -> str:
+                    tty: bool = True, quiet: bool = False, control_path: str = None) -> str:
 
     ssh_command = 'ssh -i %s -o StrictHostKeyChecking=no -o ConnectTimeout=10' % shlex.quote(key_path)
 
+    # reuse a master connection
+    if control_path:
+        ssh_command += ' ' + get_ssh_control_options(control_path)
+
     if tty:
         ssh_command += ' -t'
 
@@ -102,3 +132,23 @@ def get_ssh_command(host: str, port: int, user: str, key_path: str, command: str
     ssh_command += ' %s@%s %s' % (user, host, shlex.quote(command))
 
     return ssh_command
+
+
+def get_ssh_control_options(control_path: str, control_persist: str = '10m') -> str:
+    """SSH options to create a master connection on the first call and reuse it
+    by the following calls until the connection stays idle for the "control_persist"
+    period of time."""
+    return '-o ControlMaster=auto -o ControlPath=%s -o ControlPersist=%s' \
+           % (shlex.quote(control_path), control_persist)
+
+
+def get_ssh_control_exit_command(host: str, port: int, user: str, control_path: str) -> str:
+    """A command to close a master connection."""
+    ssh_command = 'ssh -q -O exit -o ControlPath=%s' % shlex.quote(control_path)
+
+    if port != 22:
+        ssh_command += ' -p %d' % port
+
+    ssh_command += ' %s@%s' % (user, host)
+
+    return ssh_command
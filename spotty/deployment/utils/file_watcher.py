@@ -0,0 +1,254 @@
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from spotty.deployment.utils.sync_filters import get_local_files, is_path_included, check_sync_filters
+
+
+# relative paths of the changed and deleted files
+FileChanges = namedtuple('FileChanges', ['changed', 'deleted'])
+
+
+def get_file_watcher(local_dir: str, filters: list = None, rsync_rules: bool = False) -> 'AbstractFileWatcher':
+    """Returns an inotify-based watcher on Linux and a polling watcher on other systems
+    or if inotify cannot be used (for example, the limit of the watches is reached).
+
+    "rsync_rules" should be set if the project is synced using rsync (see "is_path_included").
+    """
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyFileWatcher(local_dir, filters, rsync_rules=rsync_rules)
+        except OSError as e:
+            logging.debug('inotify is not available: ' + str(e))
+
+    return PollingFileWatcher(local_dir, filters, rsync_rules=rsync_rules)
+
+
+class AbstractFileWatcher(ABC):
+
+    def __init__(self, local_dir: str, filters: list = None, rsync_rules: bool = False):
+        check_sync_filters(filters)
+
+        self._local_dir = local_dir
+        self._filters = filters
+        self._rsync_rules = rsync_rules
+        self._files = self._get_files()
+
+    def _get_files(self) -> dict:
+        """Returns sizes and modification times of the files that pass the filters."""
+        local_files = get_local_files(self._local_dir, self._filters, rsync_rules=self._rsync_rules)
+        return {rel_path: (local_file.size, local_file.mtime) for rel_path, local_file in local_files.items()}
+
+    def wait_changes(self, debounce_secs: float = 0.2, max_delay_secs: float = 2,
+                     timeout: float = None) -> FileChanges:
+        """Blocks until some of the files are changed or deleted.
+
+        Changes that come in bursts are grouped together: the method returns once there
+        were no new changes for "debounce_secs" seconds, but not later than "max_delay_secs"
+        seconds after the first change. If the timeout is set and there were no changes,
+        empty changes are returned.
+        """
+        while True:
+            rel_paths = self._wait_paths(timeout=timeout)
+            if not rel_paths:
+                return FileChanges([], [])
+
+            start_time = time.time()
+            while True:
+                timeout = min(debounce_secs, max_delay_secs - (time.time() - start_time))
+                new_paths = self._wait_paths(timeout=timeout) if timeout > 0 else None
+                if not new_paths:
+                    break
+
+                rel_paths |= new_paths
+
+            changes = self._get_changes(rel_paths)
+            if changes.changed or changes.deleted or (timeout is not None):
+                return changes
+
+    def _get_changes(self, rel_paths: set) -> FileChanges:
+        """Checks which of the paths were changed or deleted and updates the known files.
+
+        "None" in the paths means that the whole directory should be rescanned.
+        """
+        if None in rel_paths:
+            files = self._get_files()
+            changed = [rel_path for rel_path, file_info in files.items() if self._files.get(rel_path) != file_info]
+            deleted = [rel_path for rel_path in self._files if rel_path not in files]
+            self._files = files
+
+            return FileChanges(sorted(changed), sorted(deleted))
+
+        changed = set()
+        deleted = set()
+        for rel_path in rel_paths:
+            path = os.path.join(self._local_dir, rel_path)
+            if os.path.isdir(path):
+                # a directory was created or moved to the project, all its files are new
+                for dir_rel_path, local_file in get_local_files(path).items():
+                    file_rel_path = rel_path + '/' + dir_rel_path
+                    if is_path_included(file_rel_path, self._filters, rsync_rules=self._rsync_rules):
+                        changed.add(file_rel_path)
+                        self._files[file_rel_path] = (local_file.size, local_file.mtime)
+            elif os.path.isfile(path):
+                if is_path_included(rel_path, self._filters, rsync_rules=self._rsync_rules):
+                    stat = os.stat(path)
+                    changed.add(rel_path)
+                    self._files[rel_path] = (stat.st_size, stat.st_mtime)
+            else:
+                # a file or a whole directory was deleted, only known files are deleted on the instance,
+                # so excluded files in the deleted directories will stay untouched
+                dir_prefix = rel_path + '/'
+                for known_rel_path in list(self._files):
+                    if known_rel_path == rel_path or known_rel_path.startswith(dir_prefix):
+                        deleted.add(known_rel_path)
+                        del self._files[known_rel_path]
+
+        return FileChanges(sorted(changed - deleted), sorted(deleted))
+
+    @abstractmethod
+    def _wait_paths(self, timeout: float = None) -> set:
+        """Waits for file system events and returns relative paths that might be changed.
+
+        Returns an empty set if there were no events during the timeout.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class PollingFileWatcher(AbstractFileWatcher):
+
+    def __init__(self, local_dir: str, filters: list = None, interval_secs: float = 1, rsync_rules: bool = False):
+        super().__init__(local_dir, filters, rsync_rules=rsync_rules)
+        self._interval_secs = interval_secs
+        self._snapshot = dict(self._files)
+
+    def _wait_paths(self, timeout: float = None) -> set:
+        start_time = time.time()
+        while True:
+            files = self._get_files()
+            rel_paths = {rel_path for rel_path, file_info in files.items() if self._snapshot.get(rel_path) != file_info}
+            rel_paths |= {rel_path for rel_path in self._snapshot if rel_path not in files}
+            self._snapshot = files
+
+            if rel_paths:
+                return rel_paths
+
+            if timeout is not None and time.time() - start_time >= timeout:
+                return set()
+
+            sleep_secs = self._interval_secs
+            if timeout is not None:
+                sleep_secs = min(sleep_secs, max(timeout - (time.time() - start_time), 0))
+
+            time.sleep(sleep_secs)
+
+
+class InotifyFileWatcher(AbstractFileWatcher):
+
+    IN_ATTRIB = 0x4
+    IN_CLOSE_WRITE = 0x8
+    IN_MOVED_FROM = 0x40
+    IN_MOVED_TO = 0x80
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_Q_OVERFLOW = 0x4000
+    IN_IGNORED = 0x8000
+    IN_ISDIR = 0x40000000
+
+    WATCH_MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, local_dir: str, filters: list = None, rsync_rules: bool = False):
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError('inotify is not supported')
+
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+
+        # watch descriptors of the directories and the directory paths relative to the project
+        self._watches = {}
+
+        # the directories are watched before the initial scan, so the changes are not missed
+        try:
+            self._add_watches(local_dir, '')
+        except OSError:
+            os.close(self._fd)
+            raise
+
+        super().__init__(local_dir, filters, rsync_rules=rsync_rules)
+
+    def _add_watches(self, dir_path: str, rel_dir_path: str):
+        """Recursively adds watches for the directory and its subdirectories."""
+        for root, _, _ in os.walk(dir_path, followlinks=True):
+            rel_root = os.path.relpath(root, dir_path).replace(os.sep, '/')
+            rel_root = rel_dir_path if rel_root == '.' else \
+                (rel_dir_path + '/' + rel_root if rel_dir_path else rel_root)
+
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(root), self.WATCH_MASK)
+            if wd < 0:
+                error_code = ctypes.get_errno()
+                if error_code in (errno.ENOENT, errno.ENOTDIR):
+                    # the directory was deleted during the walk
+                    continue
+
+                raise OSError(error_code, os.strerror(error_code))
+
+            self._watches[wd] = rel_root
+
+    def _wait_paths(self, timeout: float = None) -> set:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        data = os.read(self._fd, 64 * 1024)
+
+        rel_paths = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_len = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + name_len].rstrip(b'\0'))
+            offset += name_len
+
+            if mask & self.IN_Q_OVERFLOW:
+                # some events were lost, the directory will be rescanned
+                self._add_watches(self._local_dir, '')
+                rel_paths.add(None)
+                continue
+
+            if mask & self.IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            rel_dir_path = self._watches.get(wd)
+            if rel_dir_path is None or not name:
+                continue
+
+            # attributes of a directory don't affect its files
+            if (mask & self.IN_ISDIR) and (mask & self.IN_ATTRIB):
+                continue
+
+            rel_path = (rel_dir_path + '/' + name) if rel_dir_path else name
+            rel_paths.add(rel_path)
+
+            # watch new directories
+            if (mask & self.IN_ISDIR) and (mask & (self.IN_CREATE | self.IN_MOVED_TO)):
+                self._add_watches(os.path.join(self._local_dir, rel_path), rel_path)
+
+        return rel_paths
+
+    def close(self):
+        os.close(self._fd)
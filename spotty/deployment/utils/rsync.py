@@ -1,6 +1,8 @@
+import re
 from shutil import which
 from typing import List
 from spotty.deployment.utils.cli import shlex_join
+from spotty.deployment.utils.commands import get_ssh_control_options
 
 
 def check_rsync_installed():
@@ -10,7 +12,8 @@ def check_rsync_installed():
 
 
 def get_upload_command(local_dir: str, remote_dir: str, ssh_user: str, ssh_host: str, ssh_port: int,
-                       ssh_key_path: str, filters: List[dict] = None, use_sudo: bool = False, dry_run: bool = False):
+                       ssh_key_path: str, filters: List[dict] = None, use_sudo: bool = False, dry_run: bool = False,
+                       ssh_control_path: str = None):
     # make sure there is only one list of exclude filters
     if (len(filters) > 1) or (len(filters[0]) > 1) or ('include' in filters[0]):
         raise ValueError('At the moment "remote" provider supports only one list of exclude filters.')
@@ -18,39 +21,64 @@ def get_upload_command(local_dir: str, remote_dir: str, ssh_user: str, ssh_host:
     remote_path = '%s@%s:%s' % (ssh_user, ssh_host, remote_dir)
 
     return _get_rsync_command(local_dir, remote_path, ssh_port, ssh_key_path, filters, mkdir=remote_dir,
-                              use_sudo=use_sudo, dry_run=dry_run)
+                              use_sudo=use_sudo, dry_run=dry_run, ssh_control_path=ssh_control_path)
 
 
 def get_download_command(remote_dir: str, local_dir: str, ssh_user: str, ssh_host: str, ssh_port: int,
-                         ssh_key_path: str, filters: List[dict] = None, use_sudo: bool = False, dry_run: bool = False):
+                         ssh_key_path: str, filters: List[dict] = None, use_sudo: bool = False, dry_run: bool = False,
+                         ssh_control_path: str = None, stats: bool = False):
     filters = filters[::-1]
     remote_path = '%s@%s:%s' % (ssh_user, ssh_host, remote_dir)
 
     return _get_rsync_command(remote_path, local_dir, ssh_port, ssh_key_path, filters, use_sudo=use_sudo,
-                              dry_run=dry_run)
+                              dry_run=dry_run, ssh_control_path=ssh_control_path, stats=stats)
+
+
+def get_transferred_size(rsync_stats_output: str) -> int:
+    """Returns the size of files to transfer from the output of the rsync command with the "--stats" flag
+    or None if the size wasn't found."""
+    match = re.search(r'Total transferred file size: ([\d,.]+) bytes', rsync_stats_output)
+    if not match:
+        return None
+
+    return int(re.sub(r'[,.]', '', match.group(1)))
 
 
 def _get_rsync_command(src_path: str, dst_path: str, ssh_port: int, ssh_key_path: str, filters: List[dict] = None,
-                       mkdir: str = None, use_sudo: bool = False, dry_run: bool = False):
+                       mkdir: str = None, use_sudo: bool = False, dry_run: bool = False, ssh_control_path: str = None,
+                       stats: bool = False):
 
     sudo_str = 'sudo ' if use_sudo else ''
     remote_rsync_cmd = sudo_str + 'rsync'
     if mkdir:
         remote_rsync_cmd = '%smkdir -p \'%s\' && %s' % (sudo_str, mkdir, remote_rsync_cmd)
 
+    ssh_cmd = 'ssh -i \'%s\' -p %d -o StrictHostKeyChecking=no -o ConnectTimeout=10' % (ssh_key_path, ssh_port)
+    if ssh_control_path:
+        ssh_cmd += ' ' + get_ssh_control_options(ssh_control_path)
+
     rsync_cmd = 'rsync -av ' \
                 '--no-owner ' \
                 '--no-group ' \
                 '--prune-empty-dirs ' \
-                '-e "ssh -i \'%s\' -p %d -o StrictHostKeyChecking=no -o ConnectTimeout=10" ' \
+                '-e "%s" ' \
                 '--rsync-path="%s"'  \
-                % (ssh_key_path, ssh_port, remote_rsync_cmd)
+                % (ssh_cmd, remote_rsync_cmd)
 
     if dry_run:
         rsync_cmd += ' --dry-run'
 
+    if stats:
+        rsync_cmd += ' --stats'
+
     if filters:
         args = []
+
+        # rsync doesn't descend into excluded directories, so all directories should be included
+        # to find the files that match include filters (empty directories will be pruned)
+        if any(('include' in sync_filter) for sync_filter in filters):
+            args += ['--include', '*/']
+
         for sync_filter in filters:
             if 'exclude' in sync_filter:
                 for path in sync_filter['exclude']:
@@ -0,0 +1,93 @@
+import os
+from collections import namedtuple
+from fnmatch import fnmatch
+from typing import Dict
+
+
+LocalFile = namedtuple('LocalFile', ['path', 'size', 'mtime'])
+
+
+def check_sync_filters(filters: list):
+    """Checks that each filter contains either the "exclude" or the "include" key."""
+    for sync_filter in filters or []:
+        if ('exclude' in sync_filter) == ('include' in sync_filter):
+            raise ValueError('Sync filter has wrong format.')
+
+
+def is_path_included(rel_path: str, filters: list, rsync_rules: bool = False) -> bool:
+    """Checks if a relative path passes the filters.
+
+    The filters have the same semantics as the filters of the "aws s3 sync" command:
+    all files are included by default, the filters are applied in order, and the
+    latest matching filter takes precedence.
+
+    With "rsync_rules", a file is also excluded if one of its parent directories is
+    excluded, because rsync doesn't descend into excluded directories. It's not the case
+    if there are include filters: then all the directories are included explicitly.
+    """
+    if _excludes_dirs(filters, rsync_rules):
+        parts = rel_path.split('/')
+        for i in range(1, len(parts)):
+            if not _is_path_included('/'.join(parts[:i]), filters):
+                return False
+
+    return _is_path_included(rel_path, filters)
+
+
+def _excludes_dirs(filters: list, rsync_rules: bool) -> bool:
+    return rsync_rules and not any(('include' in sync_filter) for sync_filter in filters or [])
+
+
+def _is_path_included(rel_path: str, filters: list) -> bool:
+    included = True
+    for sync_filter in filters or []:
+        if 'exclude' in sync_filter:
+            if included and any(fnmatch(rel_path, pattern) for pattern in sync_filter['exclude']):
+                included = False
+        elif not included and any(fnmatch(rel_path, pattern) for pattern in sync_filter['include']):
+            included = True
+
+    return included
+
+
+def get_local_files(local_dir: str, filters: list = None, rsync_rules: bool = False) -> Dict[str, LocalFile]:
+    """Returns files from a local directory that pass the filters.
+
+    Args:
+        local_dir: A directory to list the files from.
+        filters: Sync filters.
+        rsync_rules: Exclude filters that match a directory exclude all its files (see "is_path_included").
+
+    Returns:
+        A dictionary where keys are paths relative to the directory (with "/" as
+        a separator) and values are LocalFile tuples.
+    """
+    check_sync_filters(filters)
+
+    excludes_dirs = _excludes_dirs(filters, rsync_rules)
+
+    files = {}
+    for root, dirs, filenames in os.walk(local_dir, followlinks=True):
+        rel_root = os.path.relpath(root, local_dir).replace(os.sep, '/')
+        rel_root = '' if rel_root == '.' else rel_root + '/'
+
+        # don't descend into excluded directories, the parent directories were already checked
+        if excludes_dirs:
+            dirs[:] = [dir_name for dir_name in dirs if _is_path_included(rel_root + dir_name, filters)]
+
+        dirs.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(root, filename)
+            rel_path = rel_root + filename
+            if not _is_path_included(rel_path, filters):
+                continue
+
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # broken symlink or the file was removed during the walk
+                continue
+
+            files[rel_path] = LocalFile(path, stat.st_size, stat.st_mtime)
+
+    return files
@@ -0,0 +1,26 @@
+import os
+import tarfile
+
+
+def write_tar_archive(fileobj, local_dir: str, rel_paths: list, compress: bool = False, mtimes: dict = None):
+    """Writes the files to a tar stream.
+
+    Args:
+        fileobj: A file-like object to write the archive to. It doesn't have to be seekable.
+        local_dir: A directory the relative paths are resolved against.
+        rel_paths: Relative paths of the files, they are used as the names of the archive members.
+        compress: Compress the archive with gzip.
+        mtimes: Modification times that should be set for the archive members instead of the local ones.
+    """
+    with tarfile.open(fileobj=fileobj, mode='w|gz' if compress else 'w|', dereference=True) as tar:
+        for rel_path in rel_paths:
+            try:
+                tar_info = tar.gettarinfo(os.path.join(local_dir, rel_path), arcname=rel_path)
+                if mtimes and rel_path in mtimes:
+                    tar_info.mtime = mtimes[rel_path]
+
+                with open(os.path.join(local_dir, rel_path), 'rb') as f:
+                    tar.addfile(tar_info, f)
+            except FileNotFoundError:
+                # the file was deleted after the list of the files was obtained
+                pass
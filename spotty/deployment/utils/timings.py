@@ -0,0 +1,89 @@
+import json
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from spotty.utils import render_table
+
+
+Span = namedtuple('Span', ['name', 'start_time', 'end_time', 'depth', 'remote', 'instance_name'])
+
+
+class Timings(object):
+    """Collects durations of the deployment phases."""
+
+    def __init__(self):
+        self._spans = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def spans(self):
+        return list(self._spans)
+
+    @contextmanager
+    def span(self, name: str):
+        """Measures the time spent inside the context. Nested spans are indented in the report."""
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        start_time = time.time()
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            self.add_span(name, start_time, time.time(), depth=depth)
+
+    @contextmanager
+    def instance(self, instance_name: str):
+        """Spans that are added by the current thread inside the context belong to the instance.
+        It's used when several instances are started concurrently."""
+        self._local.instance_name = instance_name
+        try:
+            yield
+        finally:
+            self._local.instance_name = None
+
+    def add_span(self, name: str, start_time: float, end_time: float, depth: int = None, remote: bool = False):
+        """Adds a span with known start and end times (for example, a stage executed on the instance)."""
+        if depth is None:
+            depth = getattr(self._local, 'depth', 0)
+
+        instance_name = getattr(self._local, 'instance_name', None)
+
+        with self._lock:
+            self._spans.append(Span(name, start_time, end_time, depth, remote, instance_name))
+
+    def render_report(self) -> str:
+        """Renders a table with the spans in the chronological order. If the spans belong
+        to several instances, they are grouped by instance."""
+        spans = self._sorted_spans()
+        with_instances = any(span.instance_name for span in spans)
+
+        table = [('Instance', 'Phase', 'Duration') if with_instances else ('Phase', 'Duration')]
+        for span in spans:
+            name = '  ' * span.depth + span.name + (' (instance)' if span.remote else '')
+            row = (name, '%.1fs' % (span.end_time - span.start_time))
+            table.append((span.instance_name or '',) + row if with_instances else row)
+
+        return render_table(table, separate_title=True)
+
+    def save_json(self, path: str):
+        """Exports the spans to a JSON file."""
+        data = [{
+            'name': span.name,
+            'start_time': span.start_time,
+            'duration': span.end_time - span.start_time,
+            'depth': span.depth,
+            'remote': span.remote,
+            'instance_name': span.instance_name,
+        } for span in self._sorted_spans()]
+
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+    def _sorted_spans(self):
+        return sorted(self._spans, key=lambda x: (x.instance_name or '', x.start_time, x.depth))
+
+
+# timings of the current Spotty command
+timings = Timings()
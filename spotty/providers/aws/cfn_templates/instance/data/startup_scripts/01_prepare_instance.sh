@@ -2,14 +2,23 @@
 
 cfn-signal -e 0 --stack ${AWS::StackName} --region ${AWS::Region} --resource PreparingInstanceSignal
 
-# install AWS CLI
 update-locale LANG=en_US.UTF-8 LC_ALL=en_US.UTF-8
-apt-get update && apt-get install -y python3-pip
-pip3 install -U awscli
-aws configure set default.region ${AWS::Region}
 
-# install jq
-apt-get install -y jq
+# install AWS CLI and jq if they are not preinstalled on the AMI (see the "spotty aws create-ami" command)
+if ! command -v aws &> /dev/null || ! command -v jq &> /dev/null; then
+  apt-get -o Acquire::Retries=3 update
+fi
+
+if ! command -v aws &> /dev/null; then
+  apt-get -o Acquire::Retries=3 install -y python3-pip
+  pip3 install -U awscli
+fi
+
+if ! command -v jq &> /dev/null; then
+  apt-get -o Acquire::Retries=3 install -y jq
+fi
+
+aws configure set default.region ${AWS::Region}
 
 # create an alias to connect to the docker container
 CONTAINER_BASH_ALIAS=container
@@ -26,6 +26,10 @@ do
   mount $DEVICE $MOUNT_DIR
   chmod 777 $MOUNT_DIR
   resize2fs $DEVICE
+
+  # mount the volume automatically if the instance is restarted
+  DEVICE_UUID=$(blkid -o value -s UUID $DEVICE)
+  echo "UUID=$DEVICE_UUID $MOUNT_DIR ext4 defaults,nofail 0 2" >> /etc/fstab
 done
 
 # create directories for temporary container volumes
@@ -12,5 +12,13 @@ if [ -n "${HostProjectDirectory}" ]; then
   fi
 fi
 
+{{#EXTRACT_ARCHIVE_CMD}}
+# extract the project archive to an empty project directory, it's much faster
+# than downloading thousands of small files one by one
+if [ -n "${HostProjectDirectory}" ] && [ -z "$(ls -A ${HostProjectDirectory} | grep -vx lost+found)" ]; then
+  {{{EXTRACT_ARCHIVE_CMD}}} || echo "Failed to extract the project archive."
+fi
+
+{{/EXTRACT_ARCHIVE_CMD}}
 # sync project files from S3 bucket to the instance
 {{{SYNC_PROJECT_CMD}}}
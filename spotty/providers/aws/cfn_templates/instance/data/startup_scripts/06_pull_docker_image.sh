@@ -0,0 +1,9 @@
+#!/bin/bash -x
+
+cfn-signal -e 0 --stack ${AWS::StackName} --region ${AWS::Region} --resource PullingDockerImageSignal
+
+{{#PULL_IMAGE_CMD}}
+# the image is pulled while the project is syncing, the container startup script
+# will pull it again if it failed here (for example, if a registry login is done by the startup commands)
+{{{PULL_IMAGE_CMD}}} || echo 'Failed to pull the image.'
+{{/PULL_IMAGE_CMD}}
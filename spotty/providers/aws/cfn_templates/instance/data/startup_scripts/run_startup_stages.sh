@@ -0,0 +1,53 @@
+#!/bin/bash
+
+# Runs the startup stages. Each stage is started as soon as all the stages
+# it depends on are finished, so independent stages run concurrently.
+
+LOGS_DIR={{LOGS_DIR}}
+
+rm -rf $LOGS_DIR
+mkdir -p $LOGS_DIR
+
+run_stage() {
+  local STAGE_NAME=$1
+  local STAGE_SCRIPT=$2
+  shift 2
+
+  # wait for the dependencies
+  for DEPENDENCY in "$@"; do
+    while [ ! -f "$LOGS_DIR/$DEPENDENCY.exit_code" ]; do
+      sleep 1
+    done
+
+    if [ "$(cat "$LOGS_DIR/$DEPENDENCY.exit_code")" -ne 0 ]; then
+      echo "Skipped: the \"$DEPENDENCY\" stage failed." > "$LOGS_DIR/$STAGE_NAME.log"
+      echo 1 > "$LOGS_DIR/$STAGE_NAME.exit_code"
+      return
+    fi
+  done
+
+  local EXIT_CODE=0
+  $STAGE_SCRIPT > "$LOGS_DIR/$STAGE_NAME.log" 2>&1 || EXIT_CODE=$?
+
+  # the exit code file is created atomically, because other stages are waiting for it
+  echo $EXIT_CODE > "$LOGS_DIR/$STAGE_NAME.exit_code.tmp"
+  mv "$LOGS_DIR/$STAGE_NAME.exit_code.tmp" "$LOGS_DIR/$STAGE_NAME.exit_code"
+}
+
+{{#STAGES}}
+run_stage {{NAME}} {{{SCRIPT_PATH}}} {{DEPENDENCIES}} &
+{{/STAGES}}
+
+wait
+
+# print the logs of the stages and fail if one of them failed
+EXIT_CODE=0
+{{#STAGES}}
+echo '=== Stage "{{NAME}}" ==='
+cat "$LOGS_DIR/{{NAME}}.log"
+if [ "$(cat "$LOGS_DIR/{{NAME}}.exit_code")" -ne 0 ]; then
+  EXIT_CODE=1
+fi
+{{/STAGES}}
+
+exit $EXIT_CODE
@@ -3,7 +3,7 @@
 cd /root || exit 1
 
 # install CloudFormation tools if they are not installed yet
-if [ ! -e /usr/local/bin/cfn-init ]; then
+if ! command -v cfn-init &> /dev/null; then
   apt-get update
   apt-get install -y python-setuptools
   mkdir -p aws-cfn-bootstrap-latest
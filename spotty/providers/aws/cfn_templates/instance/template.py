@@ -1,5 +1,6 @@
 from typing import List
 import os
+import shlex
 import chevron
 import yaml
 from cfn_tools import CfnYamlLoader, CfnYamlDumper
@@ -9,21 +10,22 @@ from spotty.config.validation import is_subdir
 from spotty.config.abstract_instance_volume import AbstractInstanceVolume
 from spotty.deployment.container.docker.docker_commands import DockerCommands
 from spotty.deployment.container.docker.scripts.container_bash_script import ContainerBashScript
+from spotty.deployment.container.docker.scripts.start_container_script import ImageCacheCommands
 from spotty.deployment.abstract_cloud_instance.file_structure import INSTANCE_SPOTTY_TMP_DIR, \
-    CONTAINER_BASH_SCRIPT_PATH, \
-    INSTANCE_STARTUP_SCRIPTS_DIR, CONTAINERS_TMP_DIR
+    CONTAINER_BASH_SCRIPT_PATH, INSTANCE_STARTUP_SCRIPTS_DIR, INSTANCE_STARTUP_LOGS_DIR, CONTAINERS_TMP_DIR
 from spotty.providers.aws.cfn_templates.instance.start_container_script import StartContainerScriptWithCfnSignals
 from spotty.providers.aws.helpers.ami import get_ami
 from spotty.providers.aws.helpers.vpc import get_vpc_id
-from spotty.providers.aws.resources.snapshot import Snapshot
-from spotty.providers.aws.resources.volume import Volume
 from spotty.providers.aws.config.instance_config import InstanceConfig
 from spotty.providers.aws.config.ebs_volume import EbsVolume
+from spotty.providers.aws.helpers.ebs_inventory import EbsInventory
 from spotty.providers.aws.helpers.logs import get_logs_s3_path
 
 
-def prepare_instance_template(ec2, instance_config: InstanceConfig, docker_commands: DockerCommands,
-                              availability_zone: str, sync_project_cmd: str, output: AbstractOutputWriter):
+def prepare_instance_template(ebs_inventory: EbsInventory, instance_config: InstanceConfig,
+                              docker_commands: DockerCommands, availability_zone: str, sync_project_cmd: str,
+                              output: AbstractOutputWriter, image_cache: ImageCacheCommands = None,
+                              extract_archive_cmd: str = None):
     """Prepares CloudFormation template to run a Spot Instance."""
 
     # read and update CF template
@@ -31,7 +33,7 @@ def prepare_instance_template(ec2, instance_config: InstanceConfig, docker_comma
         template = yaml.load(f, Loader=CfnYamlLoader)
 
     # get volume resources and updated availability zone
-    volume_resources = _get_volume_resources(ec2, instance_config.volumes, output)
+    volume_resources = _get_volume_resources(ebs_inventory, instance_config.volumes, output)
 
     # add volume resources to the template
     template['Resources'].update(volume_resources)
@@ -95,14 +97,40 @@ def prepare_instance_template(ec2, instance_config: InstanceConfig, docker_comma
     # run sync command as a non-root user
     if instance_config.container_config.run_as_host_user:
         sync_project_cmd = 'sudo -u %s %s' % (instance_config.user, sync_project_cmd)
+        if extract_archive_cmd:
+            extract_archive_cmd = 'sudo -u %s sh -c %s' % (instance_config.user, shlex.quote(extract_archive_cmd))
+
+    startup_stages = _get_startup_stages(instance_config, docker_commands, sync_project_cmd, image_cache,
+                                         extract_archive_cmd)
+
+    # cfn-init runs a single script that runs the startup stages
+    template['Resources']['InstanceLaunchTemplate']['Metadata']['AWS::CloudFormation::Init']['configSets'] = {
+        'init': ['startup'],
+    }
+
+    template['Resources']['InstanceLaunchTemplate']['Metadata']['AWS::CloudFormation::Init']['startup'] = {
+        'files': _get_startup_stages_files(startup_stages),
+        'commands': {
+            'run_startup_stages': {
+                'command': INSTANCE_STARTUP_SCRIPTS_DIR + '/run_startup_stages.sh',
+            },
+        },
+    }
+
+    return yaml.dump(template, Dumper=CfnYamlDumper)
+
+
+def _get_startup_stages(instance_config: InstanceConfig, docker_commands: DockerCommands, sync_project_cmd: str,
+                        image_cache: ImageCacheCommands = None, extract_archive_cmd: str = None) -> List[dict]:
+    """Returns the startup stages, a stage is started once all its dependencies are finished."""
 
     # get mount directories
     mount_dirs = [volume.mount_dir for volume in instance_config.volumes if isinstance(volume, EbsVolume)]
 
-    # set CloudFormation configs
-    cfn_init_configs = [
+    return [
         {
             'name': 'prepare_instance',
+            'depends_on': [],
             'files': {
                 INSTANCE_STARTUP_SCRIPTS_DIR + '/01_prepare_instance.sh': {
                     'owner': 'ubuntu',
@@ -135,6 +163,7 @@ def prepare_instance_template(ec2, instance_config: InstanceConfig, docker_comma
         },
         {
             'name': 'mount_volumes',
+            'depends_on': ['prepare_instance'],
             'files': {
                 INSTANCE_STARTUP_SCRIPTS_DIR + '/02_mount_volumes.sh': {
                     'owner': 'ubuntu',
@@ -153,6 +182,7 @@ def prepare_instance_template(ec2, instance_config: InstanceConfig, docker_comma
         },
         {
             'name': 'set_docker_root',
+            'depends_on': ['mount_volumes'],
             'files': {
                 INSTANCE_STARTUP_SCRIPTS_DIR + '/03_set_docker_root.sh': {
                     'owner': 'ubuntu',
@@ -167,6 +197,7 @@ def prepare_instance_template(ec2, instance_config: InstanceConfig, docker_comma
         },
         {
             'name': 'sync_project',
+            'depends_on': ['mount_volumes'],
             'files': {
                 INSTANCE_STARTUP_SCRIPTS_DIR + '/04_sync_project.sh': {
                     'owner': 'ubuntu',
@@ -174,6 +205,7 @@ def prepare_instance_template(ec2, instance_config: InstanceConfig, docker_comma
                     'mode': '000755',
                     'content': {
                         'Fn::Sub': _read_template_file(os.path.join('startup_scripts', '04_sync_project.sh'), {
+                            'EXTRACT_ARCHIVE_CMD': extract_archive_cmd,
                             'SYNC_PROJECT_CMD': sync_project_cmd,
                         }),
                     },
@@ -183,6 +215,8 @@ def prepare_instance_template(ec2, instance_config: InstanceConfig, docker_comma
         },
         {
             'name': 'run_instance_startup_commands',
+            # user commands can use Docker, so they run only after the Docker data root is moved
+            'depends_on': ['sync_project', 'set_docker_root'],
             'files': {
                 INSTANCE_STARTUP_SCRIPTS_DIR + '/05_run_instance_startup_commands.sh': {
                     'owner': 'ubuntu',
@@ -204,37 +238,72 @@ def prepare_instance_template(ec2, instance_config: InstanceConfig, docker_comma
             },
             'command': INSTANCE_STARTUP_SCRIPTS_DIR + '/05_run_instance_startup_commands.sh',
         },
+        {
+            'name': 'pull_docker_image',
+            'depends_on': ['set_docker_root'],
+            'files': {
+                INSTANCE_STARTUP_SCRIPTS_DIR + '/06_pull_docker_image.sh': {
+                    'owner': 'ubuntu',
+                    'group': 'ubuntu',
+                    'mode': '000755',
+                    'content': {
+                        'Fn::Sub': _read_template_file(os.path.join('startup_scripts', '06_pull_docker_image.sh'), {
+                            'PULL_IMAGE_CMD': docker_commands.pull() if not instance_config.dockerfile_path else '',
+                        }),
+                    },
+                },
+            },
+            'command': INSTANCE_STARTUP_SCRIPTS_DIR + '/06_pull_docker_image.sh',
+        },
         {
             'name': 'start_container',
+            'depends_on': ['run_instance_startup_commands', 'pull_docker_image'],
             'files': {
-                INSTANCE_STARTUP_SCRIPTS_DIR + '/06_start_container.sh': {
+                INSTANCE_STARTUP_SCRIPTS_DIR + '/07_start_container.sh': {
                     'owner': 'ubuntu',
                     'group': 'ubuntu',
                     'mode': '000755',
                     'content': {
-                        'Fn::Sub': StartContainerScriptWithCfnSignals(docker_commands).render(print_trace=True),
+                        'Fn::Sub': StartContainerScriptWithCfnSignals(docker_commands, image_cache).render(
+                            print_trace=True),
                     },
                 },
             },
-            'command': INSTANCE_STARTUP_SCRIPTS_DIR + '/06_start_container.sh',
+            'command': INSTANCE_STARTUP_SCRIPTS_DIR + '/07_start_container.sh',
         },
     ]
 
-    template['Resources']['InstanceLaunchTemplate']['Metadata']['AWS::CloudFormation::Init']['configSets'] = {
-        'init': [config['name'] for config in cfn_init_configs],
-    }
 
-    for config in cfn_init_configs:
-        template['Resources']['InstanceLaunchTemplate']['Metadata']['AWS::CloudFormation::Init'][config['name']] = {
-            'files': config.get('files', {}),
-            'commands': {
-                config['name']: {
-                    'command': config['command'],
-                }
-            },
-        }
+def _get_startup_stages_files(startup_stages: List[dict]) -> dict:
+    """Returns files of the startup stages and a script that runs the stages."""
+    files = {}
+    stage_names = set()
+    for stage in startup_stages:
+        # a stage can depend only on the previous stages, so the dependencies don't have cycles
+        for dependency in stage['depends_on']:
+            if dependency not in stage_names:
+                raise ValueError('Startup stage "%s" depends on unknown stage "%s".' % (stage['name'], dependency))
+
+        stage_names.add(stage['name'])
+        files.update(stage.get('files', {}))
+
+    files[INSTANCE_STARTUP_SCRIPTS_DIR + '/run_startup_stages.sh'] = {
+        'owner': 'root',
+        'group': 'root',
+        'mode': '000755',
+        'content': {
+            'Fn::Sub': _read_template_file(os.path.join('startup_scripts', 'run_startup_stages.sh'), {
+                'LOGS_DIR': INSTANCE_STARTUP_LOGS_DIR,
+                'STAGES': [{
+                    'NAME': stage['name'],
+                    'SCRIPT_PATH': stage['command'],
+                    'DEPENDENCIES': ' '.join(stage['depends_on']),
+                } for stage in startup_stages],
+            }),
+        },
+    }
 
-    return yaml.dump(template, Dumper=CfnYamlDumper)
+    return files
 
 
 def _read_template_file(filename: str, params: dict = None):
@@ -264,7 +333,7 @@ def _get_volume_attachment_resource(volume_id, device_name):
     return attachment_resource
 
 
-def _get_volume_resource(ec2, volume: EbsVolume, output: AbstractOutputWriter):
+def _get_volume_resource(ebs_inventory: EbsInventory, volume: EbsVolume, output: AbstractOutputWriter):
     # new volume will be created
     volume_resource = {
         'Type': 'AWS::EC2::Volume',
@@ -280,7 +349,7 @@ def _get_volume_resource(ec2, volume: EbsVolume, output: AbstractOutputWriter):
     }
 
     # check if the snapshot exists and restore the volume from it
-    snapshot = Snapshot.get_by_name(ec2, volume.ec2_volume_name)
+    snapshot = ebs_inventory.get_snapshot(volume.ec2_volume_name)
     if snapshot:
         # volume will be restored from the snapshot
         # check size of the volume
@@ -311,7 +380,8 @@ def _get_volume_resource(ec2, volume: EbsVolume, output: AbstractOutputWriter):
     return volume_resource
 
 
-def _get_volume_resources(ec2, volumes: List[AbstractInstanceVolume], output: AbstractOutputWriter):
+def _get_volume_resources(ebs_inventory: EbsInventory, volumes: List[AbstractInstanceVolume],
+                          output: AbstractOutputWriter):
     resources = {}
 
     # ending letters for the devices (see: https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/device_naming.html)
@@ -322,7 +392,7 @@ def _get_volume_resources(ec2, volumes: List[AbstractInstanceVolume], output: Ab
         if isinstance(volume, EbsVolume):
             device_letter = device_letters[i]
 
-            ec2_volume = Volume.get_by_name(ec2, volume.ec2_volume_name)
+            ec2_volume = ebs_inventory.get_volume(volume.ec2_volume_name)
             if ec2_volume:
                 # check if the volume is available
                 if not ec2_volume.is_available():
@@ -340,7 +410,7 @@ def _get_volume_resources(ec2, volumes: List[AbstractInstanceVolume], output: Ab
             else:
                 # create Volume resource
                 vol_resource_name = 'Volume' + device_letter.upper()
-                vol_resource = _get_volume_resource(ec2, volume, output)
+                vol_resource = _get_volume_resource(ebs_inventory, volume, output)
                 resources[vol_resource_name] = vol_resource
 
                 volume_id = {'Ref': vol_resource_name}
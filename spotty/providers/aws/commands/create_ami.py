@@ -0,0 +1,127 @@
+from argparse import ArgumentParser, Namespace
+import os
+from time import sleep
+from botocore.exceptions import ClientError
+from spotty.commands.abstract_command import AbstractCommand
+from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
+from spotty.providers.aws.config.instance_config import DEFAULT_AMI_NAME
+from spotty.providers.aws.helpers.ami import get_deep_learning_ami
+from spotty.providers.aws.helpers.boto3_client import get_client
+from spotty.providers.aws.resources.image import Image
+from spotty.providers.aws.resources.instance import Instance
+
+
+class CreateAmiCommand(AbstractCommand):
+
+    name = 'create-ami'
+    description = 'Create an AMI with preinstalled tools that are required to start Spotty instances'
+
+    # the "bake_ami.sh" script writes one of them to the console before it stops the instance
+    SUCCESS_MARKER = 'SPOTTY_BAKE_AMI_SUCCEEDED'
+    FAILURE_MARKER = 'SPOTTY_BAKE_AMI_FAILED'
+
+    # the console output of a stopped instance can be empty for several minutes
+    CONSOLE_OUTPUT_DELAY_SECS = 15
+    CONSOLE_OUTPUT_MAX_ATTEMPTS = 60
+
+    def configure(self, parser: ArgumentParser):
+        super().configure(parser)
+        parser.add_argument('-r', '--region', type=str, required=True, help='AWS region')
+        parser.add_argument('-n', '--ami-name', type=str, default=DEFAULT_AMI_NAME,
+                            help='Name of the new AMI (default: "%s")' % DEFAULT_AMI_NAME)
+        parser.add_argument('--base-ami-id', type=str,
+                            help='ID of the base AMI (default: the latest AWS Deep Learning AMI)')
+        parser.add_argument('-t', '--instance-type', type=str, default='t3.medium',
+                            help='Type of the instance that is used to bake the AMI')
+        parser.add_argument('--subnet-id', type=str, help='Subnet ID for the instance')
+
+    def run(self, args: Namespace, output: AbstractOutputWriter):
+        ec2 = get_client('ec2', region_name=args.region)
+
+        if Image.get_by_name(ec2, args.ami_name):
+            raise ValueError('AMI with the name "%s" already exists.' % args.ami_name)
+
+        # get the base AMI
+        if args.base_ami_id:
+            base_image = Image.get_by_id(ec2, args.base_ami_id)
+            if not base_image:
+                raise ValueError('AMI with ID=%s not found.' % args.base_ami_id)
+        else:
+            base_image = get_deep_learning_ami(ec2)
+
+        output.write('Base AMI: %s (%s)' % (base_image.name, base_image.image_id))
+
+        # launch an instance that installs the tools and shuts itself down
+        with open(os.path.join(os.path.dirname(__file__), 'data', 'bake_ami.sh')) as f:
+            user_data = f.read()
+
+        run_params = {
+            'ImageId': base_image.image_id,
+            'InstanceType': args.instance_type,
+            'MinCount': 1,
+            'MaxCount': 1,
+            'UserData': user_data,
+            'InstanceInitiatedShutdownBehavior': 'stop',
+            'TagSpecifications': [{
+                'ResourceType': 'instance',
+                'Tags': [{'Key': 'Name', 'Value': 'spotty-create-ami-%s' % args.ami_name}],
+            }],
+        }
+        if args.subnet_id:
+            run_params['SubnetId'] = args.subnet_id
+
+        res = ec2.run_instances(**run_params)
+        instance_id = res['Instances'][0]['InstanceId']
+
+        try:
+            output.write('Installing the tools on the instance %s...' % instance_id)
+            waiter = ec2.get_waiter('instance_stopped')
+            waiter.wait(InstanceIds=[instance_id], WaiterConfig={'Delay': 15, 'MaxAttempts': 80})
+
+            # the instance is stopped even if the script failed
+            output.write('Checking the result...')
+            if not self._wait_bake_result(ec2, instance_id):
+                raise ValueError('Failed to install the tools on the instance. See the system log of the '
+                                 'instance %s for details.' % instance_id)
+
+            output.write('Creating the AMI...')
+            res = ec2.create_image(InstanceId=instance_id, Name=args.ami_name,
+                                   Description='Spotty AMI based on "%s"' % base_image.name)
+            image_id = res['ImageId']
+
+            waiter = ec2.get_waiter('image_available')
+            waiter.wait(ImageIds=[image_id], WaiterConfig={'Delay': 15, 'MaxAttempts': 120})
+        finally:
+            output.write('Terminating the instance...')
+            instance = Instance(ec2, {'InstanceId': instance_id})
+            instance.terminate(wait=False)
+
+        output.write('AMI "%s" (%s) was created.' % (args.ami_name, image_id))
+
+    def _wait_bake_result(self, ec2, instance_id: str) -> bool:
+        """Waits until the script result appears in the console output of the stopped instance.
+        Returns True if the tools were installed successfully."""
+        for i in range(self.CONSOLE_OUTPUT_MAX_ATTEMPTS):
+            if i:
+                sleep(self.CONSOLE_OUTPUT_DELAY_SECS)
+
+            console_output = self._get_console_output(ec2, instance_id)
+            if self.FAILURE_MARKER in console_output:
+                return False
+
+            if self.SUCCESS_MARKER in console_output:
+                return True
+
+        raise ValueError('The result of the tools installation was not found in the system log of the instance %s.'
+                         % instance_id)
+
+    @staticmethod
+    def _get_console_output(ec2, instance_id: str) -> str:
+        """Returns the console output of the stopped instance or an empty string if it's not available."""
+        try:
+            res = ec2.get_console_output(InstanceId=instance_id, Latest=True)
+        except ClientError:
+            # the latest output is not supported by some of the instance types
+            res = ec2.get_console_output(InstanceId=instance_id)
+
+        return res.get('Output', '')
@@ -0,0 +1,37 @@
+#!/bin/bash -xe
+
+# installs the tools that the Spotty startup scripts need, so the instances
+# that use the baked AMI don't have to download them on every boot
+
+# the instance is stopped even if the script fails, so it doesn't keep running until
+# the command times out, the result is reported to the console output
+on_exit() {
+  if [ $? -eq 0 ]; then
+    echo "SPOTTY_BAKE_AMI_SUCCEEDED" > /dev/console || true
+  else
+    echo "SPOTTY_BAKE_AMI_FAILED" > /dev/console || true
+  fi
+
+  shutdown -h now
+}
+trap on_exit EXIT
+
+export DEBIAN_FRONTEND=noninteractive
+
+apt-get -o Acquire::Retries=3 update
+apt-get -o Acquire::Retries=3 install -y python-setuptools python3-pip jq
+
+# install AWS CLI
+pip3 install -U awscli
+
+# install CloudFormation helper scripts
+if ! command -v cfn-init &> /dev/null; then
+  mkdir -p /tmp/aws-cfn-bootstrap-latest
+  curl https://s3.amazonaws.com/cloudformation-examples/aws-cfn-bootstrap-latest.tar.gz | tar xz -C /tmp/aws-cfn-bootstrap-latest --strip-components 1
+  python2 -m easy_install /tmp/aws-cfn-bootstrap-latest
+  rm -rf /tmp/aws-cfn-bootstrap-latest
+fi
+
+apt-get clean
+
+# the image is created once the instance is stopped by the exit trap
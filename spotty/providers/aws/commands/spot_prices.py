@@ -2,7 +2,8 @@ from argparse import ArgumentParser, Namespace
 import boto3
 from spotty.commands.abstract_command import AbstractCommand
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
-from spotty.providers.aws.helpers.instance_prices import get_spot_prices
+from spotty.providers.aws.helpers.instance_prices import get_regions_spot_prices
+from spotty.providers.aws.helpers.prices_cache import PricesCache
 
 
 class SpotPricesCommand(AbstractCommand):
@@ -14,6 +15,13 @@ class SpotPricesCommand(AbstractCommand):
         super().configure(parser)
         parser.add_argument('-i', '--instance-type', type=str, required=True, help='Instance type')
         parser.add_argument('-r', '--region', type=str, help='AWS region')
+        parser.add_argument('-s', '--sort', action='store_true', help='Wait for all the regions and sort '
+                                                                      'availability zones by price')
+        parser.add_argument('--timeout', type=int, default=10, help='Timeout for requests to a region in seconds')
+        parser.add_argument('--cache-ttl', type=int, default=PricesCache.DEFAULT_TTL,
+                            help='Use cached prices that are not older than this number of seconds '
+                                 '(0 disables the cache)')
+        parser.add_argument('--refresh', action='store_true', help='Ignore cached prices and update the cache')
 
     def run(self, args: Namespace, output: AbstractOutputWriter):
         # get all regions
@@ -29,17 +37,40 @@ class SpotPricesCommand(AbstractCommand):
         output.write('Getting spot instance prices for "%s"...\n' % instance_type)
 
         prices = []
-        for region in regions:
-            ec2 = boto3.client('ec2', region_name=region)
-            res = get_spot_prices(ec2, instance_type)
-            prices += [(price, zone) for zone, price in res.items()]
+        failed_regions = []
+        header_printed = False
+        prices_cache = PricesCache(ttl=args.cache_ttl, refresh=args.refresh)
+        for region, region_prices, error in get_regions_spot_prices(instance_type, regions,
+                                                                    region_timeout=args.timeout,
+                                                                    prices_cache=prices_cache):
+            if error:
+                failed_regions.append((region, error))
+                continue
 
-        # sort availability zones by price
-        prices.sort(key=lambda x: x[0])
+            region_prices = sorted([(price, zone) for zone, price in region_prices.items()], key=lambda x: x[0])
+            prices += region_prices
+
+            # print the prices as soon as a region responds
+            if not args.sort and region_prices:
+                if not header_printed:
+                    output.write('Price  Zone')
+                    header_printed = True
+
+                for price, zone in region_prices:
+                    output.write('%.04f %s' % (price, zone))
+
+        if args.sort and prices:
+            # sort availability zones by price
+            prices.sort(key=lambda x: x[0])
 
-        if prices:
             output.write('Price  Zone')
             for price, zone in prices:
                 output.write('%.04f %s' % (price, zone))
-        else:
+
+        if not prices:
             output.write('Spot instances of this type are not available.')
+
+        if failed_regions:
+            output.write('\nFailed to get prices for the following regions:')
+            for region, error in failed_regions:
+                output.write('  %s: %s' % (region, str(error)))
@@ -7,6 +7,9 @@ from spotty.providers.aws.config.ebs_volume import EbsVolume
 
 DEFAULT_AMI_NAME = 'SpottyAMI'
 
+# the "availabilityZone" value to run a spot instance in the availability zone with the lowest price
+CHEAPEST_AVAILABILITY_ZONE = 'cheapest'
+
 
 class InstanceConfig(AbstractInstanceConfig):
 
@@ -79,3 +82,7 @@ class InstanceConfig(AbstractInstanceConfig):
     @property
     def instance_profile_arn(self) -> str:
         return self._params['instanceProfileArn']
+
+    @property
+    def cache_docker_image(self) -> bool:
+        return self._params['cacheDockerImage']
@@ -5,6 +5,7 @@ from spotty.config.validation import validate_config, get_instance_parameters_sc
 
 def validate_instance_parameters(params: dict):
     from spotty.providers.aws.config.ebs_volume import EbsVolume
+    from spotty.providers.aws.config.instance_config import CHEAPEST_AVAILABILITY_ZONE
 
     instance_parameters = {
         'region': And(str, Regex(r'^[a-z0-9-]+$')),
@@ -30,6 +31,7 @@ def validate_instance_parameters(params: dict):
                                              ),
         Optional('managedPolicyArns', default=[]): [str],
         Optional('instanceProfileArn', default=None): str,
+        Optional('cacheDockerImage', default=False): bool,
     }
 
     volumes_checks = [
@@ -44,6 +46,9 @@ def validate_instance_parameters(params: dict):
             error='"maxPrice" can be specified only for spot instances.'),
         And(lambda x: not (x['amiName'] and x['amiId']),
             error='"amiName" and "amiId" parameters cannot be used together.'),
+        And(lambda x: not ((x['availabilityZone'] == CHEAPEST_AVAILABILITY_ZONE) and x['subnetId']),
+            error='The "%s" availability zone cannot be used together with the "subnetId" parameter.'
+                  % CHEAPEST_AVAILABILITY_ZONE),
     ]
 
     schema = get_instance_parameters_schema(instance_parameters, EbsVolume.TYPE_NAME, instance_checks, volumes_checks)
@@ -1,11 +1,24 @@
+import hashlib
 import logging
 import subprocess
+import tempfile
+from botocore.exceptions import ClientError
 from spotty.deployment.abstract_cloud_instance.abstract_data_transfer import AbstractDataTransfer
+from spotty.deployment.container.docker.scripts.start_container_script import ImageCacheCommands
+from spotty.deployment.utils.sync_filters import get_local_files
+from spotty.deployment.utils.tar_archive import write_tar_archive
+from spotty.providers.aws.helpers.boto3_client import get_client
 from spotty.providers.aws.helpers.s3_sync import get_s3_sync_command, check_aws_installed
+from spotty.providers.aws.helpers.s3_uploader import S3Uploader
 
 
 class DataTransfer(AbstractDataTransfer):
 
+    # the project is staged in the bucket as a single archive only if it has many files
+    ARCHIVE_MIN_FILES = 1000
+    ARCHIVE_MAX_SIZE = 512 * 1024 * 1024
+    ARCHIVE_KEY = 'project-archive.tar.gz'
+
     def __init__(self, local_project_dir: str, host_project_dir: str, sync_filters: list, instance_name: str,
                  region: str):
         super().__init__(local_project_dir, host_project_dir, sync_filters, instance_name)
@@ -18,18 +31,59 @@ class DataTransfer(AbstractDataTransfer):
 
     def upload_local_to_bucket(self, bucket_name: str, dry_run: bool = False):
         """Uploads files from local to the bucket."""
-        # check AWS CLI is installed
-        check_aws_installed()
-
         # sync the project with S3, deleted files will be deleted from S3
-        local_cmd = get_s3_sync_command(self._local_project_dir, self._get_bucket_project_path(bucket_name),
-                                        region=self._region, filters=self._sync_filters, delete=True, dry_run=dry_run)
+        s3 = get_client('s3', region_name=self._region, config=S3Uploader.get_client_config())
+        uploader = S3Uploader(s3, bucket_name, prefix='project')
+        uploader.sync(self._local_project_dir, filters=self._sync_filters, delete=True, dry_run=dry_run)
 
-        # execute the command locally
-        logging.debug('Local sync command: ' + local_cmd)
-        exit_code = subprocess.call(local_cmd, shell=True)
-        if exit_code != 0:
-            raise ValueError('Failed to upload the project files to the S3 bucket.')
+    def upload_archive_to_bucket(self, bucket_name: str, dry_run: bool = False) -> bool:
+        """Uploads the project files that are already in the bucket as a single archive, so a new
+        instance downloads one object instead of thousands of small ones.
+
+        Returns True if the archive is in the bucket. Should be called after the project was
+        uploaded to the bucket.
+        """
+        s3 = get_client('s3', region_name=self._region)
+
+        # the archive is worth it only for projects with many small files
+        local_files = get_local_files(self._local_project_dir, self._sync_filters)
+        total_size = sum(local_file.size for local_file in local_files.values())
+        if len(local_files) < self.ARCHIVE_MIN_FILES or total_size > self.ARCHIVE_MAX_SIZE:
+            if not dry_run:
+                s3.delete_object(Bucket=bucket_name, Key=self.ARCHIVE_KEY)
+
+            return False
+
+        # files in the archive get modification times of the bucket objects, so the incremental
+        # "aws s3 sync" command that runs after the extraction considers them as synced
+        objects = S3Uploader(s3, bucket_name, prefix='project').list_objects()
+        rel_paths = [rel_path for rel_path, local_file in local_files.items()
+                     if rel_path in objects and objects[rel_path]['Size'] == local_file.size]
+        mtimes = {rel_path: int(objects[rel_path]['LastModified'].timestamp()) for rel_path in rel_paths}
+
+        # don't upload the archive again if the project wasn't changed
+        digest = hashlib.sha1()
+        for rel_path in rel_paths:
+            digest.update(('%s:%d:%d\n' % (rel_path, objects[rel_path]['Size'], mtimes[rel_path])).encode())
+
+        files_hash = digest.hexdigest()
+        try:
+            res = s3.head_object(Bucket=bucket_name, Key=self.ARCHIVE_KEY)
+            if res['Metadata'].get('files-hash') == files_hash:
+                return True
+        except ClientError as e:
+            if e.response['Error']['Code'] not in ('404', 'NoSuchKey'):
+                raise
+
+        if dry_run:
+            return False
+
+        with tempfile.TemporaryFile() as f:
+            write_tar_archive(f, self._local_project_dir, rel_paths, compress=True, mtimes=mtimes)
+            f.seek(0)
+            s3.upload_fileobj(f, bucket_name, self.ARCHIVE_KEY, ExtraArgs={'Metadata': {'files-hash': files_hash}})
+
+        return True
 
     def download_bucket_to_local(self, bucket_name: str, download_filters: list):
         """Downloads files from the bucket to local."""
@@ -55,6 +109,12 @@ class DataTransfer(AbstractDataTransfer):
 
         return remote_cmd
 
+    def get_extract_archive_to_instance_command(self, bucket_name: str) -> str:
+        """A remote command to download the project archive from the bucket and to extract it
+        to the project directory."""
+        return 'aws s3 cp --only-show-errors --region %s s3://%s/%s - | tar -xz -f - -C %s' \
+               % (self._region, bucket_name, self.ARCHIVE_KEY, self._host_project_dir)
+
     def get_upload_instance_to_bucket_command(self, bucket_name: str, download_filters: list, use_sudo: bool = False,
                                               dry_run: bool = False) -> str:
         """A remote command to upload files from the instance to the bucket.
@@ -72,3 +132,12 @@ class DataTransfer(AbstractDataTransfer):
             remote_cmd = 'sudo ' + remote_cmd
 
         return remote_cmd
+
+    def get_image_cache_commands(self, bucket_name: str) -> ImageCacheCommands:
+        """Remote commands to download a saved Docker image from the bucket and to upload it back."""
+        image_path = self._get_bucket_image_cache_path(bucket_name)
+
+        return ImageCacheCommands(
+            download_cmd='aws s3 cp --only-show-errors --region %s %s -' % (self._region, image_path),
+            upload_cmd='aws s3 cp --only-show-errors --region %s - %s' % (self._region, image_path),
+        )
@@ -1,9 +1,11 @@
+from time import sleep
 from typing import List
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
 from spotty.config.abstract_instance_volume import AbstractInstanceVolume
 from spotty.providers.aws.resources.snapshot import Snapshot
 from spotty.providers.aws.resources.volume import Volume
 from spotty.providers.aws.config.ebs_volume import EbsVolume
+from spotty.providers.aws.helpers.ebs_inventory import EbsInventory
 
 
 def apply_deletion_policies(ec2, volumes: List[AbstractInstanceVolume], output: AbstractOutputWriter):
@@ -17,12 +19,15 @@ def apply_deletion_policies(ec2, volumes: List[AbstractInstanceVolume], output:
         output.write('- no EBS volumes configured')
         return
 
+    # get existing volumes and snapshots
+    ebs_inventory = EbsInventory(ec2, ebs_volumes)
+
     # apply deletion policies
     wait_snapshots = []
     for volume in ebs_volumes:
         # get EC2 volume
         try:
-            ec2_volume = Volume.get_by_name(ec2, volume.ec2_volume_name)
+            ec2_volume = ebs_inventory.get_volume(volume.ec2_volume_name)
         except Exception as e:
             output.write('- volume "%s" not found. Error: %s' % (volume.ec2_volume_name, str(e)))
             continue
@@ -49,7 +54,7 @@ def apply_deletion_policies(ec2, volumes: List[AbstractInstanceVolume], output:
                 or volume.deletion_policy == EbsVolume.DP_UPDATE_SNAPSHOT:
             try:
                 # rename a previous snapshot
-                prev_snapshot = Snapshot.get_by_name(ec2, volume.ec2_volume_name)
+                prev_snapshot = ebs_inventory.get_snapshot(volume.ec2_volume_name)
                 if prev_snapshot:
                     prev_snapshot.rename('%s-%d' % (prev_snapshot.name, prev_snapshot.creation_time))
 
@@ -73,20 +78,44 @@ def apply_deletion_policies(ec2, volumes: List[AbstractInstanceVolume], output:
             raise ValueError('Unsupported deletion policy: "%s".' % volume.deletion_policy)
 
     # wait until all snapshots will be created
-    for resources in wait_snapshots:
+    if wait_snapshots:
+        _wait_snapshots(ec2, wait_snapshots, output)
+
+
+def _wait_snapshots(ec2, wait_snapshots: List[dict], output: AbstractOutputWriter, delay_secs: int = 15):
+    """Waits for all the snapshots at once and deletes resources for each volume
+    as soon as its snapshot is completed."""
+    pending_snapshots = {resources['new_snapshot'].snapshot_id: resources for resources in wait_snapshots}
+    while True:
         try:
-            resources['new_snapshot'].wait_snapshot_completed()
-            output.write('- snapshot for the volume "%s" was created' % resources['new_snapshot'].name)
+            snapshots = Snapshot.get_by_ids(ec2, list(pending_snapshots))
         except Exception as e:
-            output.write('- snapshot "%s" was not created. Error: %s' % (resources['new_snapshot'].name, str(e)))
-            continue
+            for resources in pending_snapshots.values():
+                output.write('- snapshot "%s" was not created. Error: %s'
+                             % (resources['new_snapshot'].name, str(e)))
+            return
+
+        for snapshot in snapshots:
+            resources = pending_snapshots[snapshot.snapshot_id]
+            if snapshot.state == 'completed':
+                del pending_snapshots[snapshot.snapshot_id]
+                output.write('- snapshot for the volume "%s" was created' % snapshot.name)
+
+                # delete a previous snapshot if it's the "update_snapshot" deletion policy
+                if (resources['deletion_policy'] == EbsVolume.DP_UPDATE_SNAPSHOT) and resources['prev_snapshot']:
+                    _delete_snapshot(resources['prev_snapshot'], output)
+
+                # delete the EBS volume
+                _delete_ec2_volume(resources['ec2_volume'], output)
+
+            elif snapshot.state == 'error':
+                del pending_snapshots[snapshot.snapshot_id]
+                output.write('- snapshot "%s" was not created. Error: %s' % (snapshot.name, snapshot.state_message))
 
-        # delete a previous snapshot if it's the "update_snapshot" deletion policy
-        if (resources['deletion_policy'] == EbsVolume.DP_UPDATE_SNAPSHOT) and resources['prev_snapshot']:
-            _delete_snapshot(resources['prev_snapshot'], output)
+        if not pending_snapshots:
+            break
 
-        # delete the EBS volume
-        _delete_ec2_volume(resources['ec2_volume'], output)
+        sleep(delay_secs)
 
 
 def _delete_ec2_volume(ec2_volume: Volume, output: AbstractOutputWriter):
@@ -1,15 +1,18 @@
 from typing import List
 from spotty.config.abstract_instance_volume import AbstractInstanceVolume
 from spotty.providers.aws.config.ebs_volume import EbsVolume
-from spotty.providers.aws.resources.volume import Volume
+from spotty.providers.aws.helpers.ebs_inventory import EbsInventory
+from spotty.providers.aws.helpers.instance_prices import get_region_spot_prices
+from spotty.providers.aws.helpers.subnet import get_default_subnet_availability_zones
 
 
-def update_availability_zone(ec2, availability_zone: str, volumes: List[AbstractInstanceVolume]):
+def update_availability_zone(ebs_inventory: EbsInventory, availability_zone: str,
+                             volumes: List[AbstractInstanceVolume]):
     """Checks that existing volumes located in the same AZ and the AZ from the
     config file matches volumes AZ.
 
     Args:
-        ec2: EC2 boto3 client
+        ebs_inventory: EC2 volumes and snapshots of the instance.
         availability_zone: Availability Zone from the configuration.
         volumes: List of volume objects.
 
@@ -24,7 +27,7 @@ def update_availability_zone(ec2, availability_zone: str, volumes: List[Abstract
     availability_zone = availability_zone
     for volume in volumes:
         if isinstance(volume, EbsVolume):
-            ec2_volume = Volume.get_by_name(ec2, volume.ec2_volume_name)
+            ec2_volume = ebs_inventory.get_volume(volume.ec2_volume_name)
             if ec2_volume:
                 if availability_zone and (availability_zone != ec2_volume.availability_zone):
                     raise ValueError(
@@ -36,3 +39,21 @@ def update_availability_zone(ec2, availability_zone: str, volumes: List[Abstract
                 availability_zone = ec2_volume.availability_zone
 
     return availability_zone
+
+
+def get_cheapest_availability_zone(ec2, instance_type: str) -> str:
+    """Returns an availability zone with the lowest Spot price for the instance type.
+    Only availability zones with default subnets are considered.
+
+    Raises:
+        ValueError: Spot prices for the availability zones with default subnets not found.
+    """
+    spot_prices = get_region_spot_prices(ec2, instance_type)
+    default_azs = get_default_subnet_availability_zones(ec2)
+
+    prices = sorted((price, zone) for zone, price in spot_prices.items() if zone in default_azs)
+    if not prices:
+        raise ValueError('Spot prices for the "%s" instance type in the availability zones with default subnets '
+                         'not found.' % instance_type)
+
+    return prices[0][1]
@@ -0,0 +1,19 @@
+import threading
+import boto3
+
+
+_local = threading.local()
+
+
+def get_client(service_name: str, *args, **kwargs):
+    """Returns a new client that is created from a session of the current thread.
+
+    Creating clients from the default session is not thread-safe, so commands that are
+    run for several instances concurrently would fail randomly otherwise. The clients
+    themselves can be shared between threads.
+    """
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = _local.session = boto3.session.Session()
+
+    return session.client(service_name, *args, **kwargs)
@@ -0,0 +1,52 @@
+from collections import defaultdict
+from typing import List
+from spotty.config.abstract_instance_volume import AbstractInstanceVolume
+from spotty.providers.aws.config.ebs_volume import EbsVolume
+from spotty.providers.aws.resources.snapshot import Snapshot
+from spotty.providers.aws.resources.volume import Volume
+
+
+class EbsInventory(object):
+    """EC2 volumes and snapshots for the instance volumes.
+
+    All the volumes and all the snapshots are fetched with a single paginated
+    request per resource type when they are accessed for the first time.
+    """
+
+    def __init__(self, ec2, volumes: List[AbstractInstanceVolume]):
+        self._ec2 = ec2
+        self._volume_names = [volume.ec2_volume_name for volume in volumes if isinstance(volume, EbsVolume)]
+        self._ec2_volumes = None
+        self._snapshots = None
+
+    def get_volume(self, volume_name: str) -> Volume:
+        """Returns an EC2 volume by its name."""
+        if self._ec2_volumes is None:
+            self._ec2_volumes = self._group_by_name(Volume.get_by_names(self._ec2, self._volume_names)) \
+                if self._volume_names else {}
+
+        ec2_volumes = self._ec2_volumes.get(volume_name, [])
+        if len(ec2_volumes) > 1:
+            raise ValueError('Several volumes with Name=%s found.' % volume_name)
+
+        return ec2_volumes[0] if ec2_volumes else None
+
+    def get_snapshot(self, snapshot_name: str) -> Snapshot:
+        """Returns a snapshot by its name."""
+        if self._snapshots is None:
+            self._snapshots = self._group_by_name(Snapshot.get_by_names(self._ec2, self._volume_names)) \
+                if self._volume_names else {}
+
+        snapshots = self._snapshots.get(snapshot_name, [])
+        if len(snapshots) > 1:
+            raise ValueError('Several snapshots with Name=%s found.' % snapshot_name)
+
+        return snapshots[0] if snapshots else None
+
+    @staticmethod
+    def _group_by_name(resources: list) -> dict:
+        res = defaultdict(list)
+        for resource in resources:
+            res[resource.name].append(resource)
+
+        return res
@@ -1,8 +1,22 @@
 import datetime
 import json
 import logging
-import boto3
-from pkg_resources import resource_filename
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+import botocore
+from botocore.config import Config
+from spotty.providers.aws.helpers.boto3_client import get_client
+from spotty.providers.aws.helpers.prices_cache import PricesCache
+
+
+_ec2_clients = {}
+_ec2_clients_lock = threading.Lock()
+
+# a request to a region with a timeout is made at most this number of times, including the first attempt
+REGION_MAX_ATTEMPTS = 3
 
 
 def get_spot_prices(ec2, instance_type: str):
@@ -21,11 +35,90 @@ def get_spot_prices(ec2, instance_type: str):
     return prices_by_zone
 
 
-def get_current_spot_price(ec2, instance_type, availability_zone=''):
+def get_ec2_client(region: str, timeout: int = None):
+    """Returns a cached EC2 client for the region."""
+    with _ec2_clients_lock:
+        if (region, timeout) not in _ec2_clients:
+            config = Config(connect_timeout=timeout, read_timeout=timeout,
+                            retries={'total_max_attempts': REGION_MAX_ATTEMPTS}) \
+                if timeout else None
+            _ec2_clients[(region, timeout)] = get_client('ec2', region_name=region, config=config)
+
+        return _ec2_clients[(region, timeout)]
+
+
+def get_regions_spot_prices(instance_type: str, regions: List[str], region_timeout: int = 10,
+                            max_workers: int = 16, prices_cache: PricesCache = None) \
+        -> Iterator[Tuple[str, dict, Exception]]:
+    """Fetches Spot Instance prices for several regions concurrently.
+
+    Yields:
+        (region, prices_by_zone, error) tuples in the order the regions respond.
+        If a region failed or didn't respond in time, "prices_by_zone" is None
+        and "error" contains the exception.
+    """
+    if prices_cache is None:
+        prices_cache = PricesCache()
+
+    # return cached prices first
+    uncached_regions = []
+    for region in regions:
+        prices_by_zone = prices_cache.get_spot_prices(region, instance_type)
+        if prices_by_zone is not None:
+            yield region, prices_by_zone, None
+        else:
+            uncached_regions.append(region)
+
+    if not uncached_regions:
+        return
+
+    regions = uncached_regions
+
+    # clients are created in the main thread as creating clients from the same session is not thread-safe
+    clients = {region: get_ec2_client(region, region_timeout) for region in regions}
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(regions))))
+    futures = {executor.submit(get_spot_prices, clients[region], instance_type): region for region in regions}
+    try:
+        # a region will be reported as failed if it doesn't respond within REGION_MAX_ATTEMPTS attempts
+        for future in as_completed(futures, timeout=region_timeout * REGION_MAX_ATTEMPTS):
+            region = futures.pop(future)
+            try:
+                prices_by_zone = future.result()
+            except Exception as e:
+                yield region, None, e
+                continue
+
+            prices_cache.set_spot_prices(region, instance_type, prices_by_zone)
+            yield region, prices_by_zone, None
+    except TimeoutError:
+        for region in futures.values():
+            yield region, None, TimeoutError('Request timed out.')
+    finally:
+        executor.shutdown(wait=False)
+
+
+def get_region_spot_prices(ec2, instance_type: str, prices_cache: PricesCache = None) -> dict:
+    """Returns Spot prices by availability zone for the region of the "ec2" client
+    using the cached prices if they are available.
+    """
+    region, spot_prices, error = next(get_regions_spot_prices(instance_type, [ec2.meta.region_name],
+                                                              prices_cache=prices_cache))
+    if error:
+        raise ValueError('Couldn\'t get the Spot price for the "%s" region: %s' % (region, str(error)))
+
+    if not spot_prices:
+        raise ValueError('Spot instances of the "%s" type are not available in the "%s" region.'
+                         % (instance_type, region))
+
+    return spot_prices
+
+
+def get_current_spot_price(ec2, instance_type, availability_zone='', prices_cache: PricesCache = None):
     """Returns the current Spot price for an availability zone.
     If an availability zone is not specified, returns the minimum price for the region.
     """
-    spot_prices = get_spot_prices(ec2, instance_type)
+    spot_prices = get_region_spot_prices(ec2, instance_type, prices_cache)
     if availability_zone:
         if availability_zone not in spot_prices:
             raise ValueError('Spot price for the "%s" availability zone not found.' % availability_zone)
@@ -37,8 +130,15 @@ def get_current_spot_price(ec2, instance_type, availability_zone=''):
     return current_price
 
 
-def get_on_demand_price(instance_type: str, region: str):
-    client = boto3.client('pricing', region_name='us-east-1')  # the API available only in "us-east-1"
+def get_on_demand_price(instance_type: str, region: str, prices_cache: PricesCache = None):
+    if prices_cache is None:
+        prices_cache = PricesCache()
+
+    price = prices_cache.get_on_demand_price(region, instance_type)
+    if price is not None:
+        return price
+
+    client = get_client('pricing', region_name='us-east-1')  # the API available only in "us-east-1"
 
     try:
         response = client.get_products(
@@ -58,11 +158,15 @@ def get_on_demand_price(instance_type: str, region: str):
         logging.debug('Couldn\'t find a price for the instance: ' + str(e))
         price = None
 
+    if price is not None:
+        prices_cache.set_on_demand_price(region, instance_type, price)
+
     return price
 
 
+@lru_cache()
 def _get_region_name(region: str):
-    endpoint_file = resource_filename('botocore', 'data/endpoints.json')
+    endpoint_file = os.path.join(os.path.dirname(botocore.__file__), 'data', 'endpoints.json')
     try:
         with open(endpoint_file, 'r') as f:
             data = json.load(f)
@@ -0,0 +1,81 @@
+import json
+import os
+import threading
+import time
+from spotty.configuration import get_spotty_cache_dir
+
+
+class PricesCache(object):
+    """Keeps instance prices on disk for a limited period of time.
+
+    Args:
+        ttl: Number of seconds a price stays valid. Zero disables the cache.
+        refresh: Ignore cached prices, but save the new ones.
+    """
+
+    DEFAULT_TTL = 3600
+
+    # entries are removed from the cache after this number of seconds regardless of the TTL
+    # of the current caller, because other callers can use a longer TTL
+    MAX_ENTRY_AGE = 7 * 24 * 3600
+
+    _lock = threading.Lock()
+
+    def __init__(self, ttl: int = DEFAULT_TTL, refresh: bool = False):
+        self._ttl = ttl
+        self._refresh = refresh
+        self._path = os.path.join(get_spotty_cache_dir('aws'), 'prices.json')
+
+    def get_spot_prices(self, region: str, instance_type: str) -> dict:
+        """Returns cached Spot prices by availability zone."""
+        return self._get('spot:%s:%s' % (region, instance_type))
+
+    def set_spot_prices(self, region: str, instance_type: str, prices_by_zone: dict):
+        self._set('spot:%s:%s' % (region, instance_type), prices_by_zone)
+
+    def get_on_demand_price(self, region: str, instance_type: str) -> float:
+        """Returns a cached On-demand price."""
+        return self._get('on-demand:%s:%s' % (region, instance_type))
+
+    def set_on_demand_price(self, region: str, instance_type: str, price: float):
+        self._set('on-demand:%s:%s' % (region, instance_type), price)
+
+    def _get(self, key: str):
+        if self._refresh or not self._ttl:
+            return None
+
+        with self._lock:
+            entry = self._load().get(key)
+
+        if not entry or (entry['timestamp'] + self._ttl < time.time()):
+            return None
+
+        return entry['value']
+
+    def _set(self, key: str, value):
+        if not self._ttl:
+            return
+
+        with self._lock:
+            data = self._load()
+            data[key] = {'timestamp': time.time(), 'value': value}
+
+            # remove old entries
+            max_age = max(self.MAX_ENTRY_AGE, self._ttl)
+            data = {key: entry for key, entry in data.items() if entry['timestamp'] + max_age >= time.time()}
+
+            tmp_path = '%s.%d.tmp' % (self._path, os.getpid())
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+
+            os.replace(tmp_path, self._path)
+
+    def _load(self) -> dict:
+        if not os.path.isfile(self._path):
+            return {}
+
+        try:
+            with open(self._path) as f:
+                return json.load(f)
+        except ValueError:
+            return {}
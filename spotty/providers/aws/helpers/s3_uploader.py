@@ -0,0 +1,129 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timezone
+from typing import Dict
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
+from spotty.commands.writers.output_writrer import OutputWriter
+from spotty.deployment.utils.sync_filters import get_local_files, is_path_included
+
+
+class S3Uploader(object):
+    """Synchronizes a local directory with an S3 prefix using a pool of threads.
+
+    It mirrors the behaviour of the "aws s3 sync --delete" command: a file is
+    uploaded if it doesn't exist in the bucket, if its size is different or if the
+    local file is newer than the object. Objects that don't have a corresponding
+    local file (and pass the filters) are deleted.
+    """
+
+    MAX_WORKERS = 16
+    MAX_CONCURRENCY = 4
+    MULTIPART_THRESHOLD = 16 * 1024 * 1024
+    MULTIPART_CHUNK_SIZE = 16 * 1024 * 1024
+    DELETE_BATCH_SIZE = 1000
+
+    def __init__(self, s3, bucket_name: str, prefix: str, output: AbstractOutputWriter = None,
+                 max_workers: int = MAX_WORKERS):
+        self._s3 = s3
+        self._bucket_name = bucket_name
+        self._prefix = prefix.strip('/')
+        self._output = output if output else OutputWriter()
+        self._max_workers = max_workers
+        self._output_lock = threading.Lock()
+        self._transfer_config = TransferConfig(multipart_threshold=self.MULTIPART_THRESHOLD,
+                                               multipart_chunksize=self.MULTIPART_CHUNK_SIZE,
+                                               max_concurrency=self.MAX_CONCURRENCY)
+
+    @classmethod
+    def get_client_config(cls, max_workers: int = MAX_WORKERS) -> Config:
+        """Returns a config for the S3 client that has enough connections for all the upload threads.
+        Otherwise, the connections are discarded and reopened once the default pool is exhausted."""
+        return Config(max_pool_connections=max_workers * cls.MAX_CONCURRENCY)
+
+    def sync(self, local_dir: str, filters: list = None, delete: bool = False, dry_run: bool = False):
+        """Uploads new and changed files to the bucket."""
+        # list the local files and the bucket objects at the same time
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            remote_objects_future = executor.submit(self.list_objects)
+            local_files = get_local_files(local_dir, filters)
+            remote_objects = remote_objects_future.result()
+
+        upload_files = []
+        for rel_path, local_file in local_files.items():
+            remote_object = remote_objects.get(rel_path)
+            if not remote_object or (remote_object['Size'] != local_file.size) \
+                    or (remote_object['LastModified'].replace(tzinfo=timezone.utc).timestamp() < local_file.mtime):
+                upload_files.append((rel_path, local_file.path))
+
+        delete_keys = []
+        if delete:
+            delete_keys = [self._get_key(rel_path) for rel_path in sorted(remote_objects)
+                           if rel_path not in local_files and is_path_included(rel_path, filters)]
+
+        self._upload_files(upload_files, dry_run)
+        self._delete_objects(delete_keys, dry_run)
+
+    def _get_key(self, rel_path: str) -> str:
+        return '%s/%s' % (self._prefix, rel_path) if self._prefix else rel_path
+
+    def _get_s3_path(self, key: str) -> str:
+        return 's3://%s/%s' % (self._bucket_name, key)
+
+    def list_objects(self) -> Dict[str, dict]:
+        """Returns objects under the prefix, keys of the dictionary are relative paths."""
+        prefix = (self._prefix + '/') if self._prefix else ''
+        paginator = self._s3.get_paginator('list_objects_v2')
+
+        objects = {}
+        for page in paginator.paginate(Bucket=self._bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                rel_path = obj['Key'][len(prefix):]
+                if rel_path and not rel_path.endswith('/'):
+                    objects[rel_path] = obj
+
+        return objects
+
+    def _write(self, msg: str):
+        with self._output_lock:
+            self._output.write(msg)
+
+    def _upload_files(self, files: list, dry_run: bool):
+        if dry_run:
+            for rel_path, local_path in files:
+                self._write('(dryrun) upload: %s to %s' % (os.path.relpath(local_path),
+                                                             self._get_s3_path(self._get_key(rel_path))))
+            return
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [executor.submit(self._upload_file, rel_path, local_path) for rel_path, local_path in files]
+            for future in as_completed(futures):
+                # re-raise the first error
+                future.result()
+
+    def _upload_file(self, rel_path: str, local_path: str):
+        key = self._get_key(rel_path)
+        self._s3.upload_file(local_path, self._bucket_name, key, Config=self._transfer_config)
+        self._write('upload: %s to %s' % (os.path.relpath(local_path), self._get_s3_path(key)))
+
+    def _delete_objects(self, keys: list, dry_run: bool):
+        if dry_run:
+            for key in keys:
+                self._write('(dryrun) delete: %s' % self._get_s3_path(key))
+            return
+
+        for i in range(0, len(keys), self.DELETE_BATCH_SIZE):
+            batch = keys[i:i + self.DELETE_BATCH_SIZE]
+            res = self._s3.delete_objects(Bucket=self._bucket_name, Delete={
+                'Objects': [{'Key': key} for key in batch],
+                'Quiet': True,
+            })
+
+            if res.get('Errors'):
+                raise ValueError('Failed to delete "%s" from the S3 bucket: %s'
+                                 % (res['Errors'][0]['Key'], res['Errors'][0]['Message']))
+
+            for key in batch:
+                self._write('delete: %s' % self._get_s3_path(key))
@@ -31,10 +31,14 @@ def check_az_and_subnet(ec2, region: str, availability_zone: str, subnet_id: str
         if subnet_id:
             raise ValueError('An availability zone should be specified if a custom subnet is used.')
         else:
-            default_subnets = Subnet.get_default_subnets(ec2)
-            default_azs = {subnet.availability_zone for subnet in default_subnets}
+            default_azs = get_default_subnet_availability_zones(ec2)
             zones_wo_subnet = [zone_name for zone_name in zone_names if zone_name not in default_azs]
             if zones_wo_subnet:
                 raise ValueError('Default subnets for the following availability zones were not found: %s.\n'
                                  'Use "subnetId" and "availabilityZone" parameters or create missing default '
                                  'subnets.' % ', '.join(zones_wo_subnet))
+
+
+def get_default_subnet_availability_zones(ec2) -> set:
+    """Returns availability zones that have default subnets."""
+    return {subnet.availability_zone for subnet in Subnet.get_default_subnets(ec2)}
@@ -1,16 +1,24 @@
-import boto3
+import shlex
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
+from spotty.config.tmp_dir_volume import TmpDirVolume
+from spotty.deployment.abstract_cloud_instance.file_structure import INSTANCE_SPOTTY_TMP_DIR, CONTAINERS_TMP_DIR
 from spotty.deployment.abstract_cloud_instance.abstract_instance_deployment import AbstractInstanceDeployment
 from spotty.deployment.container.docker.docker_commands import DockerCommands
+from spotty.deployment.utils.commands import get_script_command
+from spotty.deployment.utils.timings import timings
 from spotty.providers.aws.cfn_templates.instance.template import prepare_instance_template, get_template_parameters
 from spotty.providers.aws.data_transfer import DataTransfer
-from spotty.providers.aws.helpers.availability_zone import update_availability_zone
+from spotty.providers.aws.helpers.boto3_client import get_client
+from spotty.providers.aws.helpers.availability_zone import update_availability_zone, \
+    get_cheapest_availability_zone
+from spotty.providers.aws.helpers.ebs_inventory import EbsInventory
 from spotty.providers.aws.helpers.instance_prices import check_max_spot_price
 from spotty.providers.aws.helpers.subnet import check_az_and_subnet
 from spotty.providers.aws.resource_managers.key_pair_manager import KeyPairManager
 from spotty.deployment.utils.print_info import render_volumes_info_table
 from spotty.providers.aws.resources.instance import Instance
-from spotty.providers.aws.config.instance_config import InstanceConfig
+from spotty.providers.aws.config.ebs_volume import EbsVolume
+from spotty.providers.aws.config.instance_config import InstanceConfig, CHEAPEST_AVAILABILITY_ZONE
 from spotty.providers.aws.deletion_policies import apply_deletion_policies
 from spotty.providers.aws.resource_managers.instance_profile_stack_manager import InstanceProfileStackManager
 from spotty.providers.aws.helpers.logs import download_logs
@@ -25,7 +33,7 @@ class InstanceDeployment(AbstractInstanceDeployment):
         super().__init__(instance_config)
 
         self._project_name = instance_config.project_config.project_name
-        self._ec2 = boto3.client('ec2', region_name=instance_config.region)
+        self._ec2 = get_client('ec2', region_name=instance_config.region)
 
     @property
     def stack_manager(self) -> InstanceStackManager:
@@ -40,60 +48,93 @@ class InstanceDeployment(AbstractInstanceDeployment):
 
     def deploy(self, container_commands: DockerCommands, bucket_name: str,
                data_transfer: DataTransfer, output: AbstractOutputWriter, dry_run: bool = False):
-        # get deployment availability zone
-        availability_zone = update_availability_zone(self._ec2, self.instance_config.availability_zone,
-                                                     self.instance_config.volumes)
-
-        # check availability zone and subnet configuration
-        check_az_and_subnet(self._ec2, self.instance_config.region, availability_zone, self.instance_config.subnet_id)
-
-        # check the maximum price for a spot instance
-        check_max_spot_price(self._ec2, self.instance_config.instance_type, self.instance_config.is_spot_instance,
-                             self.instance_config.max_price, availability_zone)
-
-        # sync the project with the S3 bucket
+        with timings.span('checking availability zone and price'):
+            # get existing volumes and snapshots for the instance
+            ebs_inventory = EbsInventory(self._ec2, self.instance_config.volumes)
+
+            # get deployment availability zone
+            is_cheapest_az = self.instance_config.availability_zone == CHEAPEST_AVAILABILITY_ZONE
+            availability_zone = update_availability_zone(
+                ebs_inventory, '' if is_cheapest_az else self.instance_config.availability_zone,
+                self.instance_config.volumes)
+
+            # choose an availability zone with the lowest price if the instance is not bound to existing volumes
+            if is_cheapest_az and not availability_zone and self.instance_config.is_spot_instance:
+                availability_zone = get_cheapest_availability_zone(self._ec2, self.instance_config.instance_type)
+                output.write('Availability zone with the lowest Spot price: %s' % availability_zone)
+
+            # check availability zone and subnet configuration
+            check_az_and_subnet(self._ec2, self.instance_config.region, availability_zone,
+                                self.instance_config.subnet_id)
+
+            # check the maximum price for a spot instance
+            check_max_spot_price(self._ec2, self.instance_config.instance_type,
+                                 self.instance_config.is_spot_instance, self.instance_config.max_price,
+                                 availability_zone)
+
+        # sync the project with the S3 bucket, if several instances are started at the same time,
+        # the first deployment uploads the files and others find the bucket already synced
         if bucket_name is not None:
             output.write('Syncing the project with the S3 bucket...')
-            data_transfer.upload_local_to_bucket(bucket_name, dry_run=dry_run)
+            with self.shared_resources_lock:
+                with timings.span('uploading the project to the bucket'):
+                    data_transfer.upload_local_to_bucket(bucket_name, dry_run=dry_run)
+
+                with timings.span('uploading the project archive to the bucket'):
+                    is_archive_uploaded = data_transfer.upload_archive_to_bucket(bucket_name, dry_run=dry_run)
+        else:
+            is_archive_uploaded = False
 
         # create or update instance profile
         if not dry_run:
-            instance_profile_stack_manager = InstanceProfileStackManager(
-                self._project_name, self.instance_config.name, self.instance_config.region)
-            if not self.instance_config.instance_profile_arn:
-                instance_profile_arn = instance_profile_stack_manager.create_or_update_stack(
-                    self.instance_config.managed_policy_arns, output=output)
-            else:
-                instance_profile_arn = self.instance_config.instance_profile_arn
+            with timings.span('creating the instance profile'):
+                instance_profile_stack_manager = InstanceProfileStackManager(
+                    self._project_name, self.instance_config.name, self.instance_config.region)
+                if not self.instance_config.instance_profile_arn:
+                    instance_profile_arn = instance_profile_stack_manager.create_or_update_stack(
+                        self.instance_config.managed_policy_arns, output=output)
+                else:
+                    instance_profile_arn = self.instance_config.instance_profile_arn
         else:
             instance_profile_arn = None
 
         # create a key pair if it doesn't exist
         if not dry_run:
-            self.key_pair_manager.maybe_create_key()
+            with timings.span('creating the key pair'), self.shared_resources_lock:
+                self.key_pair_manager.maybe_create_key()
+
+        # commands to restore the built Docker image from the bucket
+        image_cache = None
+        if self.instance_config.cache_docker_image and bucket_name:
+            image_cache = data_transfer.get_image_cache_commands(bucket_name)
 
         output.write('Preparing CloudFormation template...')
 
         # prepare CloudFormation template
         with output.prefix('  '):
-            template = prepare_instance_template(
-                ec2=self._ec2,
-                instance_config=self.instance_config,
-                docker_commands=container_commands,
-                availability_zone=availability_zone,
-                sync_project_cmd=data_transfer.get_download_bucket_to_instance_command(bucket_name=bucket_name),
-                output=output,
-            )
+            with timings.span('preparing the template'):
+                template = prepare_instance_template(
+                    ebs_inventory=ebs_inventory,
+                    instance_config=self.instance_config,
+                    docker_commands=container_commands,
+                    availability_zone=availability_zone,
+                    sync_project_cmd=data_transfer.get_download_bucket_to_instance_command(bucket_name=bucket_name),
+                    image_cache=image_cache,
+                    extract_archive_cmd=(data_transfer.get_extract_archive_to_instance_command(bucket_name)
+                                         if is_archive_uploaded else None),
+                    output=output,
+                )
 
             # get parameters for the template
-            parameters = get_template_parameters(
-                ec2=self._ec2,
-                instance_config=self.instance_config,
-                instance_profile_arn=instance_profile_arn,
-                bucket_name=bucket_name,
-                key_pair_name=self.key_pair_manager.key_name,
-                output=output,
-            )
+            with timings.span('getting the template parameters (AMI lookup)'):
+                parameters = get_template_parameters(
+                    ec2=self._ec2,
+                    instance_config=self.instance_config,
+                    instance_profile_arn=instance_profile_arn,
+                    bucket_name=bucket_name,
+                    key_pair_name=self.key_pair_manager.key_name,
+                    output=output,
+                )
 
         # print information about the volumes
         output.write('\nVolumes:\n%s\n'
@@ -101,7 +142,9 @@ class InstanceDeployment(AbstractInstanceDeployment):
 
         # create stack
         if not dry_run:
-            stack = self.stack_manager.create_or_update_stack(template, parameters, self.instance_config, output)
+            with timings.span('creating the stack'):
+                stack = self.stack_manager.create_or_update_stack(template, parameters, self.instance_config,
+                                                                  output)
             if stack.status != 'CREATE_COMPLETE':
                 logs_str = 'Please, see CloudFormation logs for the details.'
 
@@ -119,6 +162,27 @@ class InstanceDeployment(AbstractInstanceDeployment):
 
                 raise ValueError('Stack "%s" was not created.\n%s' % (stack.name, logs_str))
 
+    def get_resume_instance_command(self) -> str:
+        # EBS volumes are mounted from fstab when the instance boots, temporary directories should be recreated
+        mount_dirs = [volume.mount_dir for volume in self.instance_config.volumes if isinstance(volume, EbsVolume)]
+        tmp_dirs = [INSTANCE_SPOTTY_TMP_DIR, CONTAINERS_TMP_DIR] + \
+                   [volume.host_path for volume in self.instance_config.volumes if isinstance(volume, TmpDirVolume)]
+
+        script_lines = ['set -e']
+        for mount_dir in mount_dirs:
+            script_lines.append('mountpoint -q %s || { echo %s; exit 1; }'
+                                % (shlex.quote(mount_dir), shlex.quote('Volume is not mounted: ' + mount_dir)))
+
+        tmp_dirs_str = ' '.join(shlex.quote(tmp_dir) for tmp_dir in tmp_dirs)
+        script_lines.append('mkdir -p %s' % tmp_dirs_str)
+        script_lines.append('chmod 777 %s' % tmp_dirs_str)
+
+        return 'sudo ' + get_script_command('resume-instance', '\n'.join(script_lines))
+
+    def is_deployed_with_current_config(self) -> bool:
+        # stacks created by older versions don't have the tag, so they're considered outdated
+        return self.stack_manager.get_config_hash() == self.instance_config.params_hash
+
     def delete(self, output: AbstractOutputWriter):
         # terminate the instance
         instance = self.get_instance()
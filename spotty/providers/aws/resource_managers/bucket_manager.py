@@ -1,37 +1,77 @@
-import boto3
+import logging
 import re
+from botocore.exceptions import ClientError
 from spotty.deployment.abstract_cloud_instance.abstract_bucket_manager import AbstractBucketManager
 from spotty.deployment.abstract_cloud_instance.errors.bucket_not_found import BucketNotFoundError
+from spotty.providers.aws.helpers.boto3_client import get_client
 from spotty.providers.aws.resources.bucket import Bucket
 from spotty.utils import random_string
 
 
+# the tag is used to find the project bucket without listing all the buckets in the account
+PROJECT_TAG_KEY = 'spotty:project'
+
+
 class BucketManager(AbstractBucketManager):
 
     def __init__(self, project_name: str, region: str):
-        super().__init__(project_name)
+        super().__init__(project_name, region)
 
-        self._s3 = boto3.client('s3', region_name=region)
-        self._region = region
+        self._s3 = get_client('s3', region_name=region)
         self._bucket_prefix = 'spotty-%s' % project_name.lower()
+        self._bucket_regex = re.compile('-'.join([self._bucket_prefix, '[a-z0-9]{12}', self._region]))
+
+    @property
+    def provider_name(self) -> str:
+        return 'aws'
+
+    def _get_bucket_by_name(self, bucket_name: str) -> Bucket:
+        try:
+            self._s3.head_bucket(Bucket=bucket_name)
+        except ClientError as e:
+            logging.debug('Bucket "%s" is not available: %s' % (bucket_name, str(e)))
+            return None
+
+        return Bucket({'Name': bucket_name})
+
+    def _find_bucket(self) -> Bucket:
+        # find the bucket by the project tag
+        bucket_names = self._find_tagged_bucket_names()
 
-    def get_bucket(self) -> Bucket:
-        res = self._s3.list_buckets()
-        regex = re.compile('-'.join([self._bucket_prefix, '[a-z0-9]{12}', self._region]))
-        buckets = [bucket for bucket in res['Buckets'] if regex.match(bucket['Name']) is not None]
+        # buckets that were created by older versions of Spotty don't have tags
+        if not bucket_names:
+            res = self._s3.list_buckets()
+            bucket_names = [bucket['Name'] for bucket in res['Buckets']
+                            if self._bucket_regex.match(bucket['Name']) is not None]
 
-        if len(buckets) > 1:
-            raise ValueError('Found several buckets in the same region: %s.'
-                             % ', '.join(bucket['Name'] for bucket in buckets))
+        if len(bucket_names) > 1:
+            raise ValueError('Found several buckets in the same region: %s.' % ', '.join(bucket_names))
 
-        if not len(buckets):
+        if not len(bucket_names):
             raise BucketNotFoundError
 
-        bucket = Bucket(buckets[0])
+        return Bucket({'Name': bucket_names[0]})
+
+    def _find_tagged_bucket_names(self) -> list:
+        """Returns names of the buckets with the project tag or an empty list if tags cannot be read."""
+        tagging = get_client('resourcegroupstaggingapi', region_name=self._region)
 
-        return bucket
+        bucket_names = []
+        try:
+            paginator = tagging.get_paginator('get_resources')
+            for page in paginator.paginate(TagFilters=[{'Key': PROJECT_TAG_KEY, 'Values': [self.project_name]}],
+                                           ResourceTypeFilters=['s3']):
+                for resource in page['ResourceTagMappingList']:
+                    bucket_name = resource['ResourceARN'].split(':')[-1]
+                    if self._bucket_regex.match(bucket_name) is not None:
+                        bucket_names.append(bucket_name)
+        except ClientError as e:
+            logging.debug('Couldn\'t find the bucket by tags: ' + str(e))
+            return []
 
-    def create_bucket(self) -> Bucket:
+        return bucket_names
+
+    def _create_bucket(self) -> Bucket:
         bucket_name = '-'.join([self._bucket_prefix, random_string(12), self._region])
 
         # a fix for the boto3 issue: https://github.com/boto/boto3/issues/125
@@ -41,6 +81,10 @@ class BucketManager(AbstractBucketManager):
             self._s3.create_bucket(ACL='private', Bucket=bucket_name,
                                    CreateBucketConfiguration={'LocationConstraint': self._region})
 
+        self._s3.put_bucket_tagging(Bucket=bucket_name, Tagging={
+            'TagSet': [{'Key': PROJECT_TAG_KEY, 'Value': self.project_name}],
+        })
+
         return Bucket({'Name': bucket_name})
 
     def delete_bucket(self):
@@ -1,6 +1,6 @@
-import boto3
 from botocore.exceptions import ClientError, WaiterError
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
+from spotty.providers.aws.helpers.boto3_client import get_client
 from spotty.providers.aws.cfn_templates.instance_profile.template import prepare_instance_profile_template
 from spotty.providers.aws.resources.stack import Stack
 
@@ -8,7 +8,7 @@ from spotty.providers.aws.resources.stack import Stack
 class InstanceProfileStackManager(object):
 
     def __init__(self, project_name: str, instance_name: str, region: str):
-        self._cf = boto3.client('cloudformation', region_name=region)
+        self._cf = get_client('cloudformation', region_name=region)
         self._region = region
         self._stack_name = 'spotty-instance-profile-%s-%s' % (project_name.lower(), instance_name.lower())
 
@@ -17,7 +17,7 @@ class InstanceProfileStackManager(object):
         It was moved to a separate stack because creating of an instance profile resource takes 2 minutes.
         """
         # check that policies exist
-        iam = boto3.client('iam', region_name=self._region)
+        iam = get_client('iam', region_name=self._region)
         for policy_arn in managed_policy_arns:
             # if the policy doesn't exist, an error will be raised
             iam.get_policy(PolicyArn=policy_arn)
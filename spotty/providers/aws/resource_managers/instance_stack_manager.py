@@ -1,14 +1,19 @@
-import boto3
+from typing import List
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
+from spotty.deployment.utils.timings import timings
+from spotty.providers.aws.helpers.boto3_client import get_client
 from spotty.providers.aws.resources.stack import Stack, Task
 from spotty.providers.aws.config.instance_config import InstanceConfig
 
 
 class InstanceStackManager(object):
 
+    # the tag keeps a hash of the instance parameters the stack was created with
+    CONFIG_HASH_TAG = 'spotty:config-hash'
+
     def __init__(self, project_name: str, instance_name: str, region: str):
-        self._cf = boto3.client('cloudformation', region_name=region)
-        self._ec2 = boto3.client('ec2', region_name=region)
+        self._cf = get_client('cloudformation', region_name=region)
+        self._ec2 = get_client('ec2', region_name=region)
         self._region = region
         self._stack_name = 'spotty-instance-%s-%s' % (project_name.lower(), instance_name.lower())
 
@@ -16,6 +21,14 @@ class InstanceStackManager(object):
     def name(self):
         return self._stack_name
 
+    def get_config_hash(self):
+        """Returns a hash of the instance parameters the existing stack was created with."""
+        stack = Stack.get_by_name(self._cf, self._stack_name)
+        if not stack:
+            return None
+
+        return stack.tags.get(self.CONFIG_HASH_TAG)
+
     def create_or_update_stack(self, template: str, parameters: dict, instance_config: InstanceConfig,
                                output: AbstractOutputWriter):
         """Runs CloudFormation template."""
@@ -32,11 +45,13 @@ class InstanceStackManager(object):
             TemplateBody=template,
             Parameters=[{'ParameterKey': key, 'ParameterValue': value} for key, value in parameters.items()],
             Capabilities=['CAPABILITY_IAM'],
+            Tags=[{'Key': self.CONFIG_HASH_TAG, 'Value': instance_config.params_hash}],
             OnFailure='DO_NOTHING',
         )
 
         output.write('Waiting for the stack to be created...')
 
+        # the Docker image is pulled while the project is syncing and the instance startup commands are running
         tasks = [
             Task(
                 message='launching the instance',
@@ -59,7 +74,7 @@ class InstanceStackManager(object):
             Task(
                 message='setting Docker data root',
                 start_resource='SettingDockerRootSignal',
-                finish_resource='SyncingProjectSignal',
+                finish_resource='PullingDockerImageSignal',
                 enabled=bool(instance_config.docker_data_root),
             ),
             Task(
@@ -74,6 +89,12 @@ class InstanceStackManager(object):
                 finish_resource='BuildingDockerImageSignal',
                 enabled=bool(instance_config.commands),
             ),
+            Task(
+                message='pulling Docker image',
+                start_resource='PullingDockerImageSignal',
+                finish_resource='BuildingDockerImageSignal',
+                enabled=not instance_config.dockerfile_path,
+            ),
             Task(
                 message='building Docker image',
                 start_resource='BuildingDockerImageSignal',
@@ -100,8 +121,25 @@ class InstanceStackManager(object):
                              output=output)
             stack = stack.wait_status_changed(stack_waiting_status='CREATE_IN_PROGRESS', output=output)
 
+        # durations of the stages on the instance
+        self._add_tasks_timings(stack, tasks, resource_success_status='CREATE_COMPLETE')
+
         return stack
 
+    @staticmethod
+    def _add_tasks_timings(stack: Stack, tasks: List[Task], resource_success_status: str):
+        """Adds durations of the finished tasks to the timings report using the timestamps of the stack events."""
+        tracker = stack.events_tracker
+        for task in tasks:
+            if not task.enabled:
+                continue
+
+            start_time = tracker.get_resource_timestamp(task.start_resource, resource_success_status) \
+                if task.start_resource else tracker.get_stack_timestamp('CREATE_IN_PROGRESS')
+            end_time = tracker.get_resource_timestamp(task.finish_resource, resource_success_status)
+            if start_time and end_time:
+                timings.add_span(task.message, start_time.timestamp(), end_time.timestamp(), remote=True)
+
     def delete_stack(self, output: AbstractOutputWriter, no_wait=False):
         stack = Stack.get_by_name(self._cf, self._stack_name)
         if not stack:
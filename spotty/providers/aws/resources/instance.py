@@ -11,16 +11,16 @@ class Instance(AbstractInstance):
 
     @staticmethod
     def get_by_stack_name(ec2, stack_name):
-        """Returns the running instance by its stack name
-           or None if the instance is not running.
+        """Returns the running or stopped instance by its stack name
+           or None if the instance doesn't exist.
         """
         res = ec2.describe_instances(Filters=[
             {'Name': 'tag:aws:cloudformation:stack-name', 'Values': [stack_name]},
-            {'Name': 'instance-state-name', 'Values': ['running']},
+            {'Name': 'instance-state-name', 'Values': ['pending', 'running', 'stopping', 'stopped']},
         ])
 
         if len(res['Reservations']) > 1:
-            raise ValueError('Several running instances for the stack "%s" are found.' % stack_name)
+            raise ValueError('Several instances for the stack "%s" are found.' % stack_name)
 
         if not len(res['Reservations']):
             return None
@@ -75,6 +75,12 @@ class Instance(AbstractInstance):
         """Get On-demand Instance price for the same instance in the us-east-1 region."""
         return get_on_demand_price(self.instance_type, 'us-east-1')
 
+    def start(self, wait: bool = True):
+        self._ec2.start_instances(InstanceIds=[self.instance_id])
+        if wait:
+            waiter = self._ec2.get_waiter('instance_running')
+            waiter.wait(InstanceIds=[self.instance_id])
+
     def terminate(self, wait: bool = True):
         self._ec2.terminate_instances(InstanceIds=[self.instance_id])
         if wait:
@@ -82,6 +88,10 @@ class Instance(AbstractInstance):
             waiter.wait(InstanceIds=[self.instance_id])
 
     def stop(self, wait: bool = True):
+        if self.lifecycle == 'spot':
+            raise ValueError('Spot Instances cannot be stopped, use the "spotty stop" command without the '
+                             '"--only-shutdown" flag to terminate the instance.')
+
         self._ec2.stop_instances(InstanceIds=[self.instance_id])
         if wait:
             waiter = self._ec2.get_waiter('instance_stopped')
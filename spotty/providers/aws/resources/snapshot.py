@@ -1,4 +1,5 @@
 import time
+from typing import List
 
 
 class Snapshot(object):
@@ -22,6 +23,23 @@ class Snapshot(object):
 
         return Snapshot(ec2, res['Snapshots'][0])
 
+    @staticmethod
+    def get_by_names(ec2, snapshot_names: List[str]) -> List['Snapshot']:
+        """Returns all snapshots with the given names."""
+        paginator = ec2.get_paginator('describe_snapshots')
+        pages = paginator.paginate(Filters=[
+            {'Name': 'tag:Name', 'Values': snapshot_names},
+        ])
+
+        return [Snapshot(ec2, snapshot_info) for page in pages for snapshot_info in page['Snapshots']]
+
+    @staticmethod
+    def get_by_ids(ec2, snapshot_ids: List[str]) -> List['Snapshot']:
+        """Returns snapshots by their IDs."""
+        res = ec2.describe_snapshots(SnapshotIds=snapshot_ids)
+
+        return [Snapshot(ec2, snapshot_info) for snapshot_info in res['Snapshots']]
+
     @property
     def name(self) -> str:
         snapshot_name = [tag['Value'] for tag in self._snapshot_info['Tags'] if tag['Key'] == 'Name']
@@ -38,6 +56,14 @@ class Snapshot(object):
     def size(self) -> int:
         return self._snapshot_info['VolumeSize']
 
+    @property
+    def state(self) -> str:
+        return self._snapshot_info['State']
+
+    @property
+    def state_message(self) -> str:
+        return self._snapshot_info.get('StateMessage', '')
+
     @property
     def creation_time(self) -> int:
         return int(time.mktime(self._snapshot_info['StartTime'].timetuple()))
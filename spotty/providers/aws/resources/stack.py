@@ -1,9 +1,9 @@
 from collections import namedtuple
 from time import sleep
-from typing import List, Dict
+from typing import List
 from botocore.exceptions import EndpointConnectionError, ClientError
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
-import logging
+from spotty.providers.aws.resources.stack_events_tracker import StackEventsTracker
 
 
 Task = namedtuple('Task', ['message', 'start_resource', 'finish_resource', 'enabled'])
@@ -14,6 +14,7 @@ class Stack(object):
     def __init__(self, cf, stack_info):
         self._cf = cf
         self._stack_info = stack_info
+        self._events_tracker = None
 
     @staticmethod
     def get_by_name(cf, stack_name: str):
@@ -55,6 +56,10 @@ class Stack(object):
     def name(self) -> str:
         return self._stack_info['StackName']
 
+    @property
+    def tags(self) -> dict:
+        return {tag['Key']: tag['Value'] for tag in self._stack_info.get('Tags', [])}
+
     @property
     def status(self) -> str:
         return self._stack_info['StackStatus']
@@ -78,35 +83,52 @@ class Stack(object):
         waiter = self._cf.get_waiter('stack_delete_complete')
         waiter.wait(StackName=self.stack_id, WaiterConfig={'Delay': delay_secs})
 
-    def wait_status_changed(self, stack_waiting_status: str, output: AbstractOutputWriter, delay_secs: int = 5):
-        stack = None
+    @property
+    def events_tracker(self) -> StackEventsTracker:
+        """Tracks statuses of the stack resources using stack events."""
+        if not self._events_tracker:
+            self._events_tracker = StackEventsTracker(self._cf, self.stack_id)
+
+        return self._events_tracker
+
+    def wait_status_changed(self, stack_waiting_status: str, output: AbstractOutputWriter, delay_secs: int = 2):
+        while True:
+            self.events_tracker.poll()
+            stack_status = self.events_tracker.stack_status
+            if stack_status and (stack_status != stack_waiting_status):
+                break
+
+            sleep(delay_secs)
+
+        # get the latest information about the stack
         while True:
-            # get the latest status of the stack
             try:
                 stack = self.get_by_name(self._cf, self.stack_id)
+                break
             except EndpointConnectionError as e:
                 output.write(str(e))
-                continue
+                sleep(delay_secs)
 
-            if stack.status != stack_waiting_status:
-                break
-
-            sleep(delay_secs)
+        # keep the events that were already received, they are used to get timings of the stack resources
+        if stack:
+            stack._events_tracker = self._events_tracker
 
         return stack
 
     def wait_tasks(self, tasks: List[Task], resource_success_status: str, resource_fail_status: str,
-                   output: AbstractOutputWriter, delay_secs: int = 5):
-        resource_statuses = self._get_resource_statuses()
+                   output: AbstractOutputWriter, min_delay_secs: float = 1, max_delay_secs: float = 5):
+        tracker = self.events_tracker
+        tracker.poll()
 
+        delay_secs = min_delay_secs
         for task in tasks:
             if not task.enabled:
                 continue
 
             task_started = task_finished = False
             while not task_finished:
-                start_status = resource_statuses.get(task.start_resource)
-                finish_status = resource_statuses.get(task.finish_resource)
+                start_status = tracker.get_resource_status(task.start_resource)
+                finish_status = tracker.get_resource_status(task.finish_resource)
 
                 if not task_started and (not task.start_resource or (start_status == resource_success_status)):
                     task_started = True
@@ -116,25 +138,14 @@ class Stack(object):
                     output.write('DONE')
                 else:
                     sleep(delay_secs)
-                    resource_statuses = self._get_resource_statuses()
+                    new_events = tracker.poll()
 
-                    # check that the stack is not failed
-                    for status in resource_statuses.values():
-                        if status == resource_fail_status:
-                            if task_started and not task_finished:
-                                output.write('')
-                            return
-
-    def _get_resource_statuses(self) -> Dict[str, str]:
-        stack_resources = None
-        try:
-            stack_resources = self._cf.list_stack_resources(StackName=self.stack_id)
-        except Exception as e:
-            logging.warning(str(e))
+                    # signals usually come one after another, so poll more often right after
+                    # the stack made progress and back off while it's idle
+                    delay_secs = min_delay_secs if new_events else min(delay_secs * 1.5, max_delay_secs)
 
-        resource_statuses = {}
-        if stack_resources:
-            resource_statuses = {row['LogicalResourceId']: row['ResourceStatus']
-                                 for row in stack_resources['StackResourceSummaries']}
-
-        return resource_statuses
+                    # check that the stack is not failed
+                    if tracker.has_resource_status(resource_fail_status):
+                        if task_started and not task_finished:
+                            output.write('')
+                        return
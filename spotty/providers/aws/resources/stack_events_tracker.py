@@ -0,0 +1,80 @@
+import logging
+from datetime import datetime
+from typing import List
+
+
+class StackEventsTracker(object):
+    """Tracks statuses of the stack and its resources using stack events.
+
+    Events are returned by the API in reverse chronological order, so each poll
+    reads pages only until it reaches the latest event from the previous poll.
+    """
+
+    def __init__(self, cf, stack_id: str):
+        self._cf = cf
+        self._stack_id = stack_id
+        self._last_event_id = None
+        self._resource_statuses = {}
+        self._stack_status = None
+        self._timestamps = {}
+
+    @property
+    def stack_status(self) -> str:
+        """The latest known status of the stack."""
+        return self._stack_status
+
+    def get_resource_status(self, logical_resource_id: str) -> str:
+        """Returns the latest known status of a resource."""
+        return self._resource_statuses.get(logical_resource_id)
+
+    def get_resource_timestamp(self, logical_resource_id: str, status: str) -> datetime:
+        """Returns the time when a resource got the status."""
+        return self._timestamps.get((logical_resource_id, status))
+
+    def get_stack_timestamp(self, status: str) -> datetime:
+        """Returns the time when the stack got the status."""
+        return self._timestamps.get((None, status))
+
+    def has_resource_status(self, status: str) -> bool:
+        """Checks if any of the resources has the status."""
+        return status in self._resource_statuses.values()
+
+    def poll(self) -> List[dict]:
+        """Fetches new events and updates the statuses. Returns new events in chronological order."""
+        try:
+            new_events = self._get_new_events()
+        except Exception as e:
+            logging.warning(str(e))
+            return []
+
+        for event in new_events:
+            if event['PhysicalResourceId'] == self._stack_id:
+                self._stack_status = event['ResourceStatus']
+                self._timestamps[(None, event['ResourceStatus'])] = event['Timestamp']
+            else:
+                self._resource_statuses[event['LogicalResourceId']] = event['ResourceStatus']
+                self._timestamps[(event['LogicalResourceId'], event['ResourceStatus'])] = event['Timestamp']
+
+        if new_events:
+            self._last_event_id = new_events[-1]['EventId']
+
+        return new_events
+
+    def _get_new_events(self) -> List[dict]:
+        new_events = []
+        next_token = None
+        while True:
+            params = {'StackName': self._stack_id}
+            if next_token:
+                params['NextToken'] = next_token
+
+            res = self._cf.describe_stack_events(**params)
+            for event in res['StackEvents']:
+                if event['EventId'] == self._last_event_id:
+                    return new_events[::-1]
+
+                new_events.append(event)
+
+            next_token = res.get('NextToken')
+            if not next_token:
+                return new_events[::-1]
@@ -1,3 +1,4 @@
+from typing import List
 from spotty.providers.aws.resources.snapshot import Snapshot
 
 
@@ -22,6 +23,16 @@ class Volume(object):
 
         return Volume(ec2, res['Volumes'][0])
 
+    @staticmethod
+    def get_by_names(ec2, volume_names: List[str]) -> List['Volume']:
+        """Returns all volumes with the given names."""
+        paginator = ec2.get_paginator('describe_volumes')
+        pages = paginator.paginate(Filters=[
+            {'Name': 'tag:Name', 'Values': volume_names},
+        ])
+
+        return [Volume(ec2, volume_info) for page in pages for volume_info in page['Volumes']]
+
     @property
     def name(self) -> str:
         volume_name = [tag['Value'] for tag in self._volume_info['Tags'] if tag['Key'] == 'Name']
@@ -73,3 +73,7 @@ class InstanceConfig(AbstractInstanceConfig):
     @property
     def image_uri(self) -> str:
         return self._params['imageUri']
+
+    @property
+    def cache_docker_image(self) -> bool:
+        return self._params['cacheDockerImage']
@@ -25,6 +25,7 @@ def validate_instance_parameters(params: dict):
                                                            'not be specified.'),
                                                  ),
         Optional('ports', default=[]): [And(int, lambda x: 0 < x < 65536)],
+        Optional('cacheDockerImage', default=False): bool,
     }
 
     instance_checks = [
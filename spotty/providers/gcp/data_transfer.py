@@ -1,6 +1,9 @@
 import logging
 import subprocess
 from spotty.deployment.abstract_cloud_instance.abstract_data_transfer import AbstractDataTransfer
+from spotty.deployment.container.docker.scripts.start_container_script import ImageCacheCommands
+from spotty.providers.gcp.helpers.gs_client import GSClient
+from spotty.providers.gcp.helpers.gs_downloader import GSDownloader
 from spotty.providers.gcp.helpers.gsutil_rsync import check_gsutil_installed, get_rsync_command
 
 
@@ -27,7 +30,8 @@ class DataTransfer(AbstractDataTransfer):
 
     def download_bucket_to_local(self, bucket_name: str, download_filters: list):
         """Downloads files from the bucket to local."""
-        raise NotImplementedError
+        downloader = GSDownloader(GSClient(), bucket_name, prefix=self._get_bucket_downloads_prefix())
+        downloader.download(self._local_project_dir, filters=download_filters)
 
     def get_download_bucket_to_instance_command(self, bucket_name: str, use_sudo: bool = False) -> str:
         """A remote command to download files from the bucket to the instance."""
@@ -46,4 +50,19 @@ class DataTransfer(AbstractDataTransfer):
         directory keeps all downloaded from the instance files to sync only changed
         files with local.
         """
-        raise NotImplementedError
+        remote_cmd = get_rsync_command(self._host_project_dir, self._get_bucket_downloads_path(bucket_name),
+                                       filters=download_filters, delete=True, checksum=True,
+                                       parallel_composite_upload=True, dry_run=dry_run)
+        if use_sudo:
+            remote_cmd = 'sudo ' + remote_cmd
+
+        return remote_cmd
+
+    def get_image_cache_commands(self, bucket_name: str) -> ImageCacheCommands:
+        """Remote commands to download a saved Docker image from the bucket and to upload it back."""
+        image_path = self._get_bucket_image_cache_path(bucket_name)
+
+        return ImageCacheCommands(
+            download_cmd='gsutil -q cp %s -' % image_path,
+            upload_cmd='gsutil -q cp - %s' % image_path,
+        )
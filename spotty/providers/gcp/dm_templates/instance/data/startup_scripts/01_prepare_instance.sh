@@ -1,7 +1,10 @@
 #!/bin/bash -xe
 
-# install jq
-apt-get install -y jq
+# install jq if it's not preinstalled on the image
+if ! command -v jq &> /dev/null; then
+  apt-get -o Acquire::Retries=3 update
+  apt-get -o Acquire::Retries=3 install -y jq
+fi
 
 # create tmux config
 echo "bind-key x kill-pane" > /home/{{SSH_USERNAME}}/.tmux.conf
@@ -7,7 +7,8 @@ from spotty.config.validation import is_subdir
 from spotty.config.abstract_instance_volume import AbstractInstanceVolume
 from spotty.deployment.container.docker.docker_commands import DockerCommands
 from spotty.deployment.container.docker.scripts.container_bash_script import ContainerBashScript
-from spotty.deployment.container.docker.scripts.start_container_script import StartContainerScript
+from spotty.deployment.container.docker.scripts.start_container_script import StartContainerScript, \
+    ImageCacheCommands
 from spotty.deployment.abstract_cloud_instance.file_structure import CONTAINER_BASH_SCRIPT_PATH, \
     INSTANCE_STARTUP_SCRIPTS_DIR, CONTAINERS_TMP_DIR, INSTANCE_SPOTTY_TMP_DIR
 from spotty.providers.gcp.config.disk_volume import DiskVolume
@@ -16,7 +17,8 @@ from spotty.providers.gcp.config.instance_config import InstanceConfig
 
 def prepare_instance_template(instance_config: InstanceConfig, docker_commands: DockerCommands, image_link: str,
                               bucket_name: str, sync_project_cmd: str, public_key_value: str,
-                              service_account_email: str, output: AbstractOutputWriter):
+                              service_account_email: str, output: AbstractOutputWriter,
+                              image_cache: ImageCacheCommands = None):
     """Prepares deployment template to run an instance."""
 
     # get disk attachments
@@ -83,7 +85,7 @@ def prepare_instance_template(instance_config: InstanceConfig, docker_commands:
 
     startup_scripts_content.append({
         'filename': '06_start_container.sh',
-        'content': StartContainerScript(docker_commands).render(print_trace=True),
+        'content': StartContainerScript(docker_commands, image_cache).render(print_trace=True),
     })
 
     # render the main startup script
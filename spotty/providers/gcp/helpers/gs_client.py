@@ -1,6 +1,6 @@
 from typing import List
 from google.cloud import storage
-from google.cloud.storage import Bucket
+from google.cloud.storage import Blob, Bucket
 
 
 class GSClient(object):
@@ -9,10 +9,14 @@ class GSClient(object):
     def __init__(self):
         self._client = storage.Client()
 
-    def list_buckets(self) -> List[Bucket]:
-        res = list(self._client.list_buckets())
+    def list_buckets(self, prefix: str = None) -> List[Bucket]:
+        res = list(self._client.list_buckets(prefix=prefix))
         return res
 
+    def get_bucket(self, bucket_name: str) -> Bucket:
+        """Returns the bucket or None if it doesn't exist."""
+        return self._client.lookup_bucket(bucket_name)
+
     def create_bucket(self, bucket_name: str, region: str) -> Bucket:
         bucket = Bucket(self._client, name=bucket_name)
         bucket.create(location=region)
@@ -23,3 +27,9 @@ class GSClient(object):
         bucket = Bucket(self._client, name=bucket_name)
         blob = bucket.blob(path.rstrip('/') + '/')
         blob.upload_from_string('')
+
+    def list_blobs(self, bucket_name: str, prefix: str) -> List[Blob]:
+        bucket = Bucket(self._client, name=bucket_name)
+        res = list(self._client.list_blobs(bucket, prefix=prefix))
+
+        return res
@@ -0,0 +1,133 @@
+import base64
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import google_crc32c
+from google.cloud.storage import Blob
+from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
+from spotty.commands.writers.output_writrer import OutputWriter
+from spotty.deployment.utils.sync_filters import is_path_included
+from spotty.providers.gcp.helpers.gs_client import GSClient
+
+
+class GSDownloader(object):
+    """Downloads blobs with a prefix to a local directory using a pool of threads.
+
+    A blob is downloaded only if there is no local file with the same size and
+    CRC32C checksum. Big blobs are split into ranges that are downloaded at the
+    same time, the checksum of the assembled file is verified at the end.
+    """
+
+    MAX_WORKERS = 16
+    CHUNK_SIZE = 32 * 1024 * 1024
+    TMP_FILE_SUFFIX = '.spotty-download'
+
+    def __init__(self, gs: GSClient, bucket_name: str, prefix: str, output: AbstractOutputWriter = None,
+                 max_workers: int = MAX_WORKERS):
+        self._gs = gs
+        self._bucket_name = bucket_name
+        self._prefix = prefix.strip('/')
+        self._output = output if output else OutputWriter()
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+
+    def download(self, local_dir: str, filters: list = None, dry_run: bool = False):
+        """Downloads new and changed blobs to the local directory."""
+        prefix = self._prefix + '/'
+
+        blobs = []
+        for blob in self._gs.list_blobs(self._bucket_name, prefix):
+            rel_path = blob.name[len(prefix):]
+            if not rel_path or rel_path.endswith('/') or not is_path_included(rel_path, filters):
+                continue
+
+            local_path = os.path.join(local_dir, *rel_path.split('/'))
+            if not _is_same_file(local_path, blob):
+                blobs.append((blob, local_path))
+
+        if dry_run:
+            for blob, local_path in blobs:
+                self._write('(dryrun) download: %s to %s' % (self._get_gs_path(blob), os.path.relpath(local_path)))
+            return
+
+        # split the blobs into ranges, the last downloaded range of the blob finalizes the file
+        chunks = []
+        remaining_chunks = {}
+        for blob, local_path in blobs:
+            tmp_path = self._create_tmp_file(local_path, blob.size)
+            blob_chunks = [(blob, local_path, tmp_path, start, min(start + self.CHUNK_SIZE, blob.size) - 1)
+                           for start in range(0, blob.size, self.CHUNK_SIZE)]
+            if blob_chunks:
+                chunks += blob_chunks
+                remaining_chunks[tmp_path] = len(blob_chunks)
+            else:
+                # empty blob
+                self._finalize_file(blob, local_path, tmp_path)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                futures = [executor.submit(self._download_chunk, *chunk, remaining_chunks) for chunk in chunks]
+                for future in as_completed(futures):
+                    # re-raise the first error
+                    future.result()
+        finally:
+            # remove temporary files that were not finalized
+            for _, local_path in blobs:
+                if os.path.isfile(local_path + self.TMP_FILE_SUFFIX):
+                    os.unlink(local_path + self.TMP_FILE_SUFFIX)
+
+    def _get_gs_path(self, blob: Blob) -> str:
+        return 'gs://%s/%s' % (self._bucket_name, blob.name)
+
+    def _write(self, msg: str):
+        with self._lock:
+            self._output.write(msg)
+
+    def _create_tmp_file(self, local_path: str, size: int) -> str:
+        local_dir = os.path.dirname(local_path)
+        if not os.path.isdir(local_dir):
+            os.makedirs(local_dir, exist_ok=True)
+
+        tmp_path = local_path + self.TMP_FILE_SUFFIX
+        with open(tmp_path, 'wb') as f:
+            f.truncate(size)
+
+        return tmp_path
+
+    def _download_chunk(self, blob: Blob, local_path: str, tmp_path: str, start: int, end: int,
+                        remaining_chunks: dict):
+        with open(tmp_path, 'r+b') as f:
+            f.seek(start)
+            blob.download_to_file(f, start=start, end=end, raw_download=True)
+
+        with self._lock:
+            remaining_chunks[tmp_path] -= 1
+            is_last_chunk = not remaining_chunks[tmp_path]
+
+        if is_last_chunk:
+            self._finalize_file(blob, local_path, tmp_path)
+
+    def _finalize_file(self, blob: Blob, local_path: str, tmp_path: str):
+        if blob.crc32c and (_get_file_crc32c(tmp_path) != blob.crc32c):
+            raise ValueError('Checksum mismatch for the downloaded file "%s".' % self._get_gs_path(blob))
+
+        os.replace(tmp_path, local_path)
+        self._write('download: %s to %s' % (self._get_gs_path(blob), os.path.relpath(local_path)))
+
+
+def _is_same_file(local_path: str, blob: Blob) -> bool:
+    """Checks if the local file has the same content as the blob."""
+    if not os.path.isfile(local_path) or (os.path.getsize(local_path) != blob.size):
+        return False
+
+    return _get_file_crc32c(local_path) == blob.crc32c
+
+
+def _get_file_crc32c(path: str) -> str:
+    """Returns a base64-encoded CRC32C checksum of the file in the format used by Google Storage."""
+    checksum = google_crc32c.Checksum()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            checksum.update(chunk)
+
+    return base64.b64encode(checksum.digest()).decode('utf-8')
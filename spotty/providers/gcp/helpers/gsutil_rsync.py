@@ -13,31 +13,61 @@ def check_gsutil_installed():
 
 
 def get_rsync_command(from_path: str, to_path: str, filters: List[dict] = None, delete: bool = False,
-                      quiet: bool = False, dry_run: bool = False):
+                      quiet: bool = False, dry_run: bool = False, checksum: bool = False,
+                      parallel_composite_upload: bool = False):
     args = ['gsutil', '-m']
     if quiet:
         args.append('-q')
 
+    if parallel_composite_upload:
+        # upload big files in parts at the same time
+        args += ['-o', 'GSUtil:parallel_composite_upload_threshold=150M']
+
     args += ['rsync', '-r']
 
     if filters:
-        if (len(filters) > 1) or (len(filters[0]) > 1) or ('include' in filters[0]):
-            raise ValueError('At the moment GCP provider supports only one list of exclude filters.')
-
-        path_regs = []
-        for path in filters[0]['exclude']:
-            path = path.replace('/', os.sep)  # fix for Windows machines
-            path_regs.append(fnmatch.translate(path)[4:-3])
-
-        filter_regex = '^(%s)$' % '|'.join(path_regs)
-        args += ['-x', filter_regex]
+        args += ['-x', get_exclude_regex(filters)]
 
     if delete:
         args.append('-d')
 
+    if checksum:
+        args.append('-c')
+
     if dry_run:
         args.append('-n')
 
     args += [from_path, to_path]
 
     return shlex_join(args)
+
+
+def get_exclude_regex(filters: List[dict]) -> str:
+    """Converts a list of include and exclude filters to a single regular expression for the "-x" parameter.
+
+    A path is excluded if it matches an exclude filter and doesn't match any of the include filters
+    that go after it (later filters take precedence, like in the "aws s3 sync" command).
+    """
+    exclude_regs = []
+    for i, sync_filter in enumerate(filters):
+        if 'exclude' not in sync_filter:
+            continue
+
+        exclude_regex = '(?:%s)$' % _get_paths_regex(sync_filter['exclude'])
+
+        include_paths = [path for later_filter in filters[i + 1:] for path in later_filter.get('include', [])]
+        if include_paths:
+            exclude_regex = '(?!(?:%s)$)%s' % (_get_paths_regex(include_paths), exclude_regex)
+
+        exclude_regs.append(exclude_regex)
+
+    return '^(?:%s)' % '|'.join(exclude_regs)
+
+
+def _get_paths_regex(paths: List[str]) -> str:
+    path_regs = []
+    for path in paths:
+        path = path.replace('/', os.sep)  # fix for Windows machines
+        path_regs.append(fnmatch.translate(path)[4:-3])
+
+    return '|'.join(path_regs)
@@ -54,7 +54,8 @@ class InstanceDeployment(AbstractInstanceDeployment):
         # sync the project with the S3 bucket
         if bucket_name is not None:
             output.write('Syncing the project with the bucket...')
-            data_transfer.upload_local_to_bucket(bucket_name, dry_run=dry_run)
+            with self.shared_resources_lock:
+                data_transfer.upload_local_to_bucket(bucket_name, dry_run=dry_run)
 
         # create volumes
         if self.instance_config.volumes:
@@ -71,10 +72,15 @@ class InstanceDeployment(AbstractInstanceDeployment):
             image_link = get_image(self._ce, self.instance_config.image_uri, self.instance_config.image_name).self_link
 
             # get or create an SSH key
-            public_key_value = self.ssh_key_manager.get_public_key_value()
+            with self.shared_resources_lock:
+                public_key_value = self.ssh_key_manager.get_public_key_value()
 
             # prepare the deployment template
             sync_project_cmd = data_transfer.get_download_bucket_to_instance_command(bucket_name=bucket_name)
+            image_cache = None
+            if self.instance_config.cache_docker_image and bucket_name:
+                image_cache = data_transfer.get_image_cache_commands(bucket_name)
+
             template = prepare_instance_template(
                 instance_config=self.instance_config,
                 docker_commands=container_commands,
@@ -84,6 +90,7 @@ class InstanceDeployment(AbstractInstanceDeployment):
                 public_key_value=public_key_value,
                 service_account_email=self._credentials.service_account_email,
                 output=output,
+                image_cache=image_cache,
             )
 
         output.write('')
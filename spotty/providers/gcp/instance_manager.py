@@ -1,4 +1,3 @@
-from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
 from spotty.errors.instance_not_running import InstanceNotRunningError
 from spotty.deployment.abstract_cloud_instance.abstract_cloud_instance_manager import AbstractCloudInstanceManager
 from spotty.providers.gcp.config.instance_config import InstanceConfig
@@ -36,9 +35,6 @@ class InstanceManager(AbstractCloudInstanceManager):
         """Returns an instance deployment manager."""
         return InstanceDeployment(self.instance_config)
 
-    def download(self, download_filters: list, output: AbstractOutputWriter, dry_run=False):
-        raise NotImplementedError('GCP provider doesn\'t have an implementation of the "download" command yet.')
-
     def get_status_text(self) -> str:
         instance = self.instance_deployment.get_instance()
         if not instance:
@@ -9,14 +9,22 @@ from spotty.utils import random_string
 class BucketManager(AbstractBucketManager):
 
     def __init__(self, project_name: str, region: str):
-        super().__init__(project_name)
+        super().__init__(project_name, region)
 
         self._gs = GSClient()
-        self._region = region
         self._bucket_prefix = 'spotty-%s' % project_name.lower()
 
-    def get_bucket(self) -> Bucket:
-        buckets = self._gs.list_buckets()
+    @property
+    def provider_name(self) -> str:
+        return 'gcp'
+
+    def _get_bucket_by_name(self, bucket_name: str) -> Bucket:
+        bucket = self._gs.get_bucket(bucket_name)
+        return Bucket(bucket) if bucket else None
+
+    def _find_bucket(self) -> Bucket:
+        # the prefix is applied on the server side, so only the project buckets are listed
+        buckets = self._gs.list_buckets(prefix=self._bucket_prefix + '-')
 
         regex = re.compile('-'.join([self._bucket_prefix, '[a-z0-9]{12}', self._region]))
         buckets = [bucket for bucket in buckets if regex.match(bucket.name) is not None]
@@ -32,7 +40,7 @@ class BucketManager(AbstractBucketManager):
 
         return bucket
 
-    def create_bucket(self) -> Bucket:
+    def _create_bucket(self) -> Bucket:
         bucket_name = '-'.join([self._bucket_prefix, random_string(12), self._region])
         bucket = self._gs.create_bucket(bucket_name, self._region)
 
@@ -75,6 +75,18 @@ class Instance(AbstractInstance):
     def name(self) -> str:
         return self._data['name']
 
+    @property
+    def instance_id(self) -> str:
+        return self._data['id']
+
+    @property
+    def state(self) -> str:
+        return self.status
+
+    @property
+    def launch_time(self) -> datetime:
+        return self.creation_timestamp
+
     @property
     def is_running(self) -> bool:
         return self.status == 'RUNNING'
@@ -88,6 +100,10 @@ class Instance(AbstractInstance):
     def public_ip_address(self) -> str:
         return self._data['networkInterfaces'][0]['accessConfigs'][0].get('natIP')
 
+    @property
+    def private_ip_address(self) -> str:
+        return self._data['networkInterfaces'][0].get('networkIP')
+
     @property
     def status(self) -> str:
         return self._data['status']
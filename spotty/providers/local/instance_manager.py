@@ -21,5 +21,8 @@ class InstanceManager(AbstractDockerInstanceManager):
     def sync(self, output: AbstractOutputWriter, dry_run=False):
         raise NothingToDoError('Nothing to do. The project directory is mounted to the container.')
 
+    def watch(self, output: AbstractOutputWriter):
+        raise NothingToDoError('Nothing to do. The project directory is mounted to the container.')
+
     def download(self, download_filters: list, output: AbstractOutputWriter, dry_run=False):
         raise NothingToDoError('Nothing to do. The project directory is mounted to the container.')
@@ -3,13 +3,16 @@ import subprocess
 from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
 from spotty.deployment.abstract_ssh_instance_manager import AbstractSshInstanceManager
 from spotty.providers.remote.config.instance_config import InstanceConfig
-from spotty.providers.remote.helpers.rsync import get_upload_command, check_rsync_installed, get_download_command
+from spotty.deployment.utils.sync_filters import get_local_files
+from spotty.deployment.utils.rsync import get_upload_command, check_rsync_installed, get_download_command
 
 
 class InstanceManager(AbstractSshInstanceManager):
 
     instance_config: InstanceConfig
 
+    RSYNC_FILTER_RULES = True
+
     def _get_instance_config(self, instance_config: dict) -> InstanceConfig:
         """Validates the instance config and returns an InstanceConfig object."""
         return InstanceConfig(instance_config, self.project_config)
@@ -23,6 +26,15 @@ class InstanceManager(AbstractSshInstanceManager):
 
     def sync(self, output: AbstractOutputWriter, dry_run=False):
 
+        # upload the whole project as a single compressed stream if it's the first sync,
+        # negotiating every file with rsync is much slower for projects with many small files
+        if not dry_run and self.is_host_project_dir_empty():
+            output.write('Uploading the project to the instance...')
+            local_files = get_local_files(self.project_config.project_dir, self.project_config.sync_filters,
+                                          rsync_rules=self.RSYNC_FILTER_RULES)
+            self.upload_files(sorted(local_files), [], compress=True)
+            return
+
         output.write('Syncing files with the instance...')
 
         # check rsync is installed
@@ -39,6 +51,7 @@ class InstanceManager(AbstractSshInstanceManager):
             filters=self.project_config.sync_filters,
             use_sudo=(not self.instance_config.container_config.run_as_host_user),
             dry_run=dry_run,
+            ssh_control_path=self.ssh_control_path,
         )
 
         # execute the command locally
@@ -65,6 +78,7 @@ class InstanceManager(AbstractSshInstanceManager):
             filters=download_filters,
             use_sudo=(not self.instance_config.container_config.run_as_host_user),
             dry_run=dry_run,
+            ssh_control_path=self.ssh_control_path,
         )
 
         # execute the command locally
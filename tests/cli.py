@@ -0,0 +1,45 @@
+import json
+import subprocess
+import sys
+import unittest
+
+
+class TestCli(unittest.TestCase):
+
+    # modules that must not be imported to parse arguments of a single command
+    HEAVY_MODULES = ['boto3', 'googleapiclient', 'google.cloud.storage', 'cfn_tools', 'pkg_resources']
+
+    # generous limit for the import time of the CLI, in seconds
+    IMPORT_TIME_BUDGET = 1.0
+
+    def _run_python(self, code: str) -> dict:
+        output = subprocess.check_output([sys.executable, '-c', code])
+        return json.loads(output.decode())
+
+    def test_lazy_command_loading(self):
+        res = self._run_python(
+            'import json, sys, time\n'
+            'start_time = time.time()\n'
+            'from spotty.cli import get_parser\n'
+            'args = get_parser(["status", "-c", "spotty.yaml"]).parse_args(["status", "-c", "spotty.yaml"])\n'
+            'print(json.dumps({"duration": time.time() - start_time, "command": args.command.name,\n'
+            '                  "modules": [m for m in %r if m in sys.modules]}))' % self.HEAVY_MODULES,
+        )
+
+        self.assertEqual(res['command'], 'status')
+        self.assertEqual(res['modules'], [])
+        self.assertLess(res['duration'], self.IMPORT_TIME_BUDGET)
+
+    def test_all_commands(self):
+        res = self._run_python(
+            'import json\n'
+            'from spotty.cli import get_parser\n'
+            'parser = get_parser()\n'
+            'print(json.dumps(sorted(parser._subparsers._group_actions[0].choices)))',
+        )
+
+        self.assertEqual(res, sorted(['aws', 'download', 'exec', 'run', 'sh', 'start', 'status', 'stop', 'sync']))
+
+
+if __name__ == '__main__':
+    unittest.main()
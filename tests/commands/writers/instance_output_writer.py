@@ -0,0 +1,42 @@
+import threading
+import unittest
+from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
+from spotty.commands.writers.instance_output_writer import InstanceOutputWriter
+
+
+class ListOutputWriter(AbstractOutputWriter):
+
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def _write(self, msg: str, newline: bool = True):
+        self.lines.append(msg)
+
+
+class TestInstanceOutputWriter(unittest.TestCase):
+
+    def test_prefixed_lines(self):
+        output = ListOutputWriter()
+        instance_output = InstanceOutputWriter(output, '[instance-1] ', threading.Lock())
+
+        instance_output.write('Creating the stack... ', newline=False)
+        self.assertEqual(output.lines, [])
+
+        instance_output.write('DONE')
+        with instance_output.prefix('  '):
+            instance_output.write('line 1\n\nline 2')
+
+        instance_output.write('Waiting... ', newline=False)
+        instance_output.flush()
+
+        self.assertEqual(output.lines, [
+            '[instance-1] Creating the stack... DONE',
+            '[instance-1]   line 1',
+            '[instance-1]   line 2',
+            '[instance-1] Waiting... ',
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
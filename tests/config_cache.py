@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from spotty.config import config_utils
+from spotty.config.config_utils import load_config
+from spotty.providers.local.config.instance_config import InstanceConfig
+
+
+CONFIG = '''
+project:
+  name: my-project
+containers:
+  - projectDir: /workspace/project
+    image: ubuntu
+instances:
+  - name: local-1
+    provider: local
+'''
+
+
+class TestConfigCache(unittest.TestCase):
+
+    def setUp(self):
+        self._home_dir = tempfile.TemporaryDirectory()
+        self._project_dir = tempfile.TemporaryDirectory()
+        self._env_patcher = patch.dict(os.environ, {'HOME': self._home_dir.name})
+        self._env_patcher.start()
+
+        self._config_path = os.path.join(self._project_dir.name, 'spotty.yaml')
+        with open(self._config_path, 'w') as f:
+            f.write(CONFIG)
+
+    def tearDown(self):
+        self._env_patcher.stop()
+        self._home_dir.cleanup()
+        self._project_dir.cleanup()
+
+    def _load_config(self):
+        with patch.object(config_utils, 'validate_basic_config', wraps=config_utils.validate_basic_config) as mock:
+            project_config = load_config(self._config_path)
+
+        return project_config, mock.called
+
+    def test_cached_config(self):
+        project_config, validated = self._load_config()
+        self.assertTrue(validated)
+
+        project_config, validated = self._load_config()
+        self.assertFalse(validated)
+        self.assertEqual(project_config.project_name, 'my-project')
+        self.assertEqual(project_config.sync_filters, [])
+
+        # the cache is invalidated when the override config is created
+        with open(os.path.join(self._project_dir.name, 'spotty.override.yaml'), 'w') as f:
+            f.write('project:\n  name: other-project\n')
+
+        project_config, validated = self._load_config()
+        self.assertTrue(validated)
+        self.assertEqual(project_config.project_name, 'other-project')
+
+    def test_cached_instance_params(self):
+        project_config, _ = self._load_config()
+        instance_config = InstanceConfig(project_config.instances[0], project_config)
+
+        project_config, _ = self._load_config()
+        with patch.object(InstanceConfig, '_validate_instance_params') as mock:
+            cached_instance_config = InstanceConfig(project_config.instances[0], project_config)
+
+        self.assertFalse(mock.called)
+        self.assertEqual(cached_instance_config.container_name, instance_config.container_name)
+        self.assertEqual(cached_instance_config.volume_mounts, instance_config.volume_mounts)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from spotty.deployment.abstract_cloud_instance.bucket_name_cache import BucketNameCache
+
+
+class TestBucketNameCache(unittest.TestCase):
+
+    def setUp(self):
+        self._home_dir = tempfile.TemporaryDirectory()
+        self._home_patch = patch.dict(os.environ, {'HOME': self._home_dir.name})
+        self._home_patch.start()
+
+    def tearDown(self):
+        self._home_patch.stop()
+        self._home_dir.cleanup()
+
+    def test_cache(self):
+        cache = BucketNameCache('aws', 'my-project', 'us-east-1')
+        self.assertIsNone(cache.get())
+
+        cache.save('spotty-my-project-abc-us-east-1')
+        self.assertEqual(BucketNameCache('aws', 'my-project', 'us-east-1').get(), 'spotty-my-project-abc-us-east-1')
+        self.assertIsNone(BucketNameCache('aws', 'my-project', 'eu-west-1').get())
+
+        cache.delete()
+        self.assertIsNone(cache.get())
+
+    def test_concurrent_writes(self):
+        def save_bucket_name(i: int):
+            cache = BucketNameCache('aws', 'project-%d' % (i % 8), 'us-east-1')
+            cache.save('bucket-%d' % i)
+            cache.delete()
+            cache.save('bucket-%d' % (i % 8))
+
+        # instances of a fleet update the same cache file from different threads
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for future in [executor.submit(save_bucket_name, i) for i in range(200)]:
+                future.result()
+
+        for i in range(8):
+            self.assertEqual(BucketNameCache('aws', 'project-%d' % i, 'us-east-1').get(), 'bucket-%d' % i)
+
+
+if __name__ == '__main__':
+    unittest.main()
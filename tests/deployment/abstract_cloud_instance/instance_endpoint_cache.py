@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+from spotty.deployment.abstract_cloud_instance.instance_endpoint_cache import InstanceEndpointCache
+
+
+class TestInstanceEndpointCache(unittest.TestCase):
+
+    def setUp(self):
+        self._home_dir = tempfile.TemporaryDirectory()
+        self._home_patch = patch.dict(os.environ, {'HOME': self._home_dir.name})
+        self._home_patch.start()
+
+    def tearDown(self):
+        self._home_patch.stop()
+        self._home_dir.cleanup()
+
+    @staticmethod
+    def _get_instance(ip_address: str):
+        return SimpleNamespace(instance_id='i-1', public_ip_address=ip_address, private_ip_address='10.0.0.1',
+                               state='running', launch_time=datetime(2020, 1, 1, tzinfo=timezone.utc))
+
+    def test_cache(self):
+        cache = InstanceEndpointCache('my-project', 'instance-1', 'aws')
+        self.assertIsNone(cache.get())
+
+        cache.save(self._get_instance('1.2.3.4'))
+        self.assertEqual(cache.get().ip_address, '1.2.3.4')
+        self.assertIsNone(InstanceEndpointCache('my-project', 'instance-1', 'aws', ttl=-1).get())
+
+        cache.delete()
+        self.assertIsNone(cache.get())
+
+    def test_concurrent_writes(self):
+        cache = InstanceEndpointCache('my-project', 'instance-1', 'aws')
+
+        def save_endpoint(i: int):
+            cache.save(self._get_instance('1.2.3.%d' % i))
+            cache.delete()
+            cache.save(self._get_instance('1.2.3.4'))
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for future in [executor.submit(save_endpoint, i) for i in range(200)]:
+                future.result()
+
+        self.assertEqual(cache.get().ip_address, '1.2.3.4')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from spotty.commands.writers.null_output_writrer import NullOutputWriter
+from spotty.deployment.abstract_ssh_instance_manager import AbstractSshInstanceManager
+
+
+class LocalInstanceManager(AbstractSshInstanceManager):
+    """Executes the "remote" commands locally instead of using SSH."""
+
+    def __init__(self, host_container_dir: str, upload_error: bool = False):
+        self._host_container_dir = host_container_dir
+        self._upload_error = upload_error
+        self.uploads = 0
+
+    @property
+    def instance_config(self):
+        return SimpleNamespace(host_scripts_dir=self._host_container_dir + '/scripts',
+                               full_container_name='test-container',
+                               container_config=SimpleNamespace(working_dir='/workspace'))
+
+    def exec(self, command: str, tty: bool = True) -> int:
+        return subprocess.call(['bash', '-c', command])
+
+    def _exec_with_input(self, command: str, write_input):
+        self.uploads += 1
+        if self._upload_error:
+            raise ValueError('Failed to upload files to the instance.')
+
+        process = subprocess.Popen(['bash', '-c', command], stdin=subprocess.PIPE)
+        write_input(process.stdin)
+        process.stdin.close()
+        if process.wait() != 0:
+            raise ValueError('Failed to upload files to the instance.')
+
+
+# abstract methods are not used by the tests
+LocalInstanceManager.__abstractmethods__ = frozenset()
+
+
+class WatchInstanceManager(LocalInstanceManager):
+    """Fails to upload the first changes and stops watching once the changes are uploaded."""
+
+    WATCH_RETRY_DELAY_SECS = 0.2
+
+    def __init__(self, project_dir: str):
+        super().__init__(project_dir)
+        self._project_dir = project_dir
+        self.uploaded_changes = []
+
+    @property
+    def project_config(self):
+        return SimpleNamespace(project_dir=self._project_dir, sync_filters=[])
+
+    def upload_files(self, rel_paths: list, deleted_rel_paths: list, compress: bool = False):
+        self.uploaded_changes.append((rel_paths, deleted_rel_paths))
+        if len(self.uploaded_changes) == 1:
+            raise ValueError('Failed to upload files to the instance.')
+
+        raise KeyboardInterrupt
+
+
+
+
+class TestAbstractSshInstanceManager(unittest.TestCase):
+
+    SCRIPT = '#!/usr/bin/env bash\necho "test"\n'
+
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    def test_upload_script(self):
+        instance_manager = LocalInstanceManager(self._tmp_dir)
+
+        script_path = instance_manager.upload_script(self.SCRIPT)
+        self.assertTrue(script_path.startswith(self._tmp_dir + '/scripts/'))
+        self.assertEqual(oct(os.stat(self._tmp_dir + '/scripts').st_mode & 0o777), oct(0o777))
+        with open(script_path) as f:
+            self.assertEqual(f.read(), self.SCRIPT)
+
+        # the same script is not uploaded again
+        self.assertEqual(instance_manager.upload_script(self.SCRIPT), script_path)
+        self.assertEqual(instance_manager.uploads, 1)
+
+        command = instance_manager.get_script_exec_command('test', self.SCRIPT)
+        self.assertIn('docker cp', command)
+        self.assertNotIn('base64', command)
+
+    def test_upload_script_fallback(self):
+        instance_manager = LocalInstanceManager(self._tmp_dir, upload_error=True)
+        self.assertIsNone(instance_manager.upload_script(self.SCRIPT))
+
+        # the script is inlined into the command
+        command = instance_manager.get_script_exec_command('test', self.SCRIPT)
+        self.assertIn('base64', command)
+        self.assertNotIn('docker cp', command)
+
+    def test_watch_retry(self):
+        instance_manager = WatchInstanceManager(self._tmp_dir)
+
+        def write_file():
+            with open(os.path.join(self._tmp_dir, 'main.py'), 'w') as f:
+                f.write('print(1)')
+
+        # the file is changed once the watcher is started
+        timer = threading.Timer(0.5, write_file)
+        timer.start()
+
+        with self.assertRaises(KeyboardInterrupt):
+            instance_manager.watch(NullOutputWriter())
+
+        # the failed changes are uploaded again
+        self.assertEqual(instance_manager.uploaded_changes, [(['main.py'], []), (['main.py'], [])])
+
+
+if __name__ == '__main__':
+    unittest.main()
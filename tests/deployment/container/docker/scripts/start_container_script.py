@@ -0,0 +1,54 @@
+import subprocess
+import unittest
+from spotty.config.project_config import ProjectConfig
+from spotty.deployment.container.docker.docker_commands import DockerCommands
+from spotty.deployment.container.docker.scripts.start_container_script import StartContainerScript, \
+    ImageCacheCommands
+from spotty.providers.local.config.instance_config import InstanceConfig
+
+
+class TestStartContainerScript(unittest.TestCase):
+
+    def setUp(self):
+        project_config = ProjectConfig({
+            'project': {'name': 'my-project'},
+            'containers': [{'projectDir': '/workspace/project', 'file': 'Dockerfile'}],
+            'instances': [{'name': 'local-1', 'provider': 'local'}],
+        }, project_dir='/tmp/my-project')
+
+        instance_config = InstanceConfig(project_config.instances[0], project_config)
+        self._commands = DockerCommands(instance_config)
+
+    def test_without_image_cache(self):
+        script = StartContainerScript(self._commands).render()
+
+        self.assertIn('docker build', script)
+        self.assertNotIn('--cache-from', script)
+        self.assertNotIn('BUILDKIT_INLINE_CACHE', script)
+        self.assertNotIn('docker load', script)
+        self.assertNotIn('docker save', script)
+
+    def test_with_image_cache(self):
+        image_cache = ImageCacheCommands(download_cmd='aws s3 cp s3://bucket/image.tar -',
+                                         upload_cmd='aws s3 cp - s3://bucket/image.tar')
+        script = StartContainerScript(self._commands, image_cache).render()
+
+        # the cached image is built with inline cache metadata, so BuildKit can use it as a cache source
+        build_lines = [line for line in script.split('\n') if line.strip().startswith('docker build ')]
+        self.assertEqual(len(build_lines), 1)
+        self.assertIn(' --cache-from spotty-my-project-local-1-default:cache', build_lines[0])
+        self.assertIn(' --build-arg BUILDKIT_INLINE_CACHE=1', build_lines[0])
+
+        # the image is built even if it was restored from the cache, so a changed Dockerfile is never skipped
+        self.assertGreater(script.index('docker build '), script.index('CACHED_IMAGE_ID='))
+        self.assertIn('aws s3 cp s3://bucket/image.tar - | docker load', script)
+        self.assertIn('docker save spotty-my-project-local-1-default:cache | aws s3 cp - s3://bucket/image.tar',
+                      script)
+
+        # the script is a valid bash script
+        res = subprocess.run(['bash', '-n'], input=script.encode(), stderr=subprocess.PIPE)
+        self.assertEqual(res.returncode, 0, res.stderr.decode())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from spotty.commands.writers.null_output_writrer import NullOutputWriter
+from spotty.deployment.job_pool import JobPool, Job, read_params_file, JOB_LOST_EXIT_CODE
+from spotty.deployment.utils.commands import get_script_command
+from spotty.deployment.utils.user_scripts import render_script
+from spotty.errors.instance_not_running import InstanceNotRunningError
+
+
+class FakeInstanceConfig(object):
+
+    def __init__(self, name: str, host_jobs_dir: str):
+        self.name = name
+        self.host_jobs_dir = host_jobs_dir
+
+
+class FakeInstanceManager(object):
+    """Executes commands locally, an unavailable instance fails all the commands like SSH does."""
+
+    def __init__(self, name: str, tmp_dir: str, available: bool = True):
+        self.instance_config = FakeInstanceConfig(name, os.path.join(tmp_dir, 'jobs-' + name))
+        self._log_dir = os.path.join(tmp_dir, 'logs')
+        self._available = available
+
+    def get_script_exec_command(self, script_name: str, script_content: str, script_args: list = None,
+                                logging: bool = False, user: str = None) -> str:
+        # run the script on the host instead of a container
+        return get_script_command(script_name, script_content, script_args=script_args, logging=logging) \
+            .replace('/var/log/spotty/run', self._log_dir)
+
+    def exec(self, command: str, tty: bool = True) -> int:
+        if not self._available:
+            return 255
+
+        return subprocess.call(['bash', '-c', command])
+
+
+class TerminatedInstanceManager(FakeInstanceManager):
+    """Starts jobs, but the instance is terminated right after that."""
+
+    def exec(self, command: str, tty: bool = True) -> int:
+        if not self._available:
+            raise InstanceNotRunningError(self.instance_config.name)
+
+        self._available = False
+
+        return super().exec(command, tty=tty)
+
+
+class TestJobPool(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    def test_read_params_file(self):
+        file_path = os.path.join(self._tmp_dir, 'grid.jsonl')
+        with open(file_path, 'w') as f:
+            f.write('{"LR": 0.1, "MODEL": "resnet"}\n\n{"LR": 0.01, "MODEL": "vgg"}\n')
+
+        self.assertEqual(read_params_file(file_path), [
+            {'LR': '0.1', 'MODEL': 'resnet'},
+            {'LR': '0.01', 'MODEL': 'vgg'},
+        ])
+
+        with open(file_path, 'w') as f:
+            f.write('[1, 2]\n')
+
+        with self.assertRaises(ValueError):
+            read_params_file(file_path)
+
+    def test_run(self):
+        # the job with the "FAIL" parameter fails on every instance
+        params_list = [{'NAME': 'a'}, {'NAME': 'FAIL'}, {'NAME': 'b'}, {'NAME': 'c'}]
+        jobs = [Job(i + 1, params, render_script('[ "{{NAME}}" != "FAIL" ]', params))
+                for i, params in enumerate(params_list)]
+
+        instance_managers = [
+            FakeInstanceManager('instance-1', self._tmp_dir),
+            FakeInstanceManager('instance-2', self._tmp_dir),
+            FakeInstanceManager('instance-3', self._tmp_dir, available=False),
+        ]
+
+        job_pool = JobPool(instance_managers, 'train', max_attempts=2, poll_interval=0.2)
+        results = job_pool.run(jobs, NullOutputWriter())
+
+        self.assertEqual([result.exit_code for result in results], [0, 1, 0, 0])
+        self.assertEqual(results[1].attempts, 2)
+        self.assertNotIn('instance-3', [result.instance_name for result in results])
+
+    def test_no_available_instances(self):
+        jobs = [Job(1, {}, render_script('true', {}))]
+        job_pool = JobPool([FakeInstanceManager('instance-1', self._tmp_dir, available=False)], 'train',
+                           poll_interval=0)
+        results = job_pool.run(jobs, NullOutputWriter())
+
+        self.assertEqual(results[0].exit_code, JOB_LOST_EXIT_CODE)
+        self.assertEqual(results[0].attempts, 0)
+
+    def test_instance_terminated(self):
+        jobs = [Job(i + 1, {}, render_script('sleep 0.5', {})) for i in range(3)]
+        instance_managers = [
+            TerminatedInstanceManager('instance-1', self._tmp_dir),
+            TerminatedInstanceManager('instance-2', self._tmp_dir, available=False),
+            FakeInstanceManager('instance-3', self._tmp_dir),
+        ]
+
+        job_pool = JobPool(instance_managers, 'train', max_attempts=2, poll_interval=0.2)
+        results = job_pool.run(jobs, NullOutputWriter())
+
+        self.assertEqual([result.exit_code for result in results], [0, 0, 0])
+        self.assertEqual({result.instance_name for result in results}, {'instance-3'})
+
+
+if __name__ == '__main__':
+    unittest.main()
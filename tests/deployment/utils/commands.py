@@ -0,0 +1,34 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from spotty.deployment.utils.commands import get_script_command, get_script_file_command
+
+
+class TestCommands(unittest.TestCase):
+
+    SCRIPT = '#!/usr/bin/env bash\necho "$# args: $1"\n'
+
+    def test_script_command(self):
+        command = get_script_command('test', self.SCRIPT, script_args=['a b', 'c'])
+        self.assertEqual(subprocess.check_output(command, shell=True), b'2 args: a b\n')
+
+    def test_script_file_command(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            script_path = os.path.join(tmp_dir, 'spotty-script.sh')
+            with open(script_path, 'w') as f:
+                f.write(self.SCRIPT)
+
+            os.chmod(script_path, 0o755)
+
+            command = get_script_file_command('test', script_path, script_args=['a b', 'c'])
+            self.assertEqual(subprocess.check_output(command, shell=True), b'2 args: a b\n')
+            self.assertNotIn('base64', command)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from spotty.deployment.utils.file_watcher import PollingFileWatcher, InotifyFileWatcher, FileChanges
+
+
+class TestFileWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self._project_dir = tempfile.mkdtemp()
+        self._write_file('src/main.py')
+        self._write_file('data/train.csv')
+        self._write_file('data/readme.txt')
+
+    def tearDown(self):
+        shutil.rmtree(self._project_dir)
+
+    def _write_file(self, rel_path: str, content: str = ''):
+        path = os.path.join(self._project_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+
+    def _check_watcher(self, watcher):
+        try:
+            self._write_file('src/main.py', 'print(1)')
+            self._write_file('src/utils/helpers.py')
+            self._write_file('data/test.csv')
+            self.assertEqual(watcher.wait_changes(), FileChanges(['src/main.py', 'src/utils/helpers.py'], []))
+
+            # only the included files are deleted
+            shutil.rmtree(os.path.join(self._project_dir, 'data'))
+            self.assertEqual(watcher.wait_changes(), FileChanges([], ['data/readme.txt']))
+
+            # no changes during the timeout
+            self.assertEqual(watcher.wait_changes(timeout=0.3), FileChanges([], []))
+        finally:
+            watcher.close()
+
+    def test_polling_watcher(self):
+        filters = [{'exclude': ['*.csv']}]
+        self._check_watcher(PollingFileWatcher(self._project_dir, filters, interval_secs=0.1))
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), 'inotify is only available on Linux')
+    def test_inotify_watcher(self):
+        filters = [{'exclude': ['*.csv']}]
+        self._check_watcher(InotifyFileWatcher(self._project_dir, filters))
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), 'inotify is only available on Linux')
+    def test_rsync_rules(self):
+        self._write_file('.git/config')
+
+        # the directory is excluded with all its files like in the rsync command
+        watcher = InotifyFileWatcher(self._project_dir, [{'exclude': ['.git']}], rsync_rules=True)
+        try:
+            self._write_file('.git/config', 'changed')
+            self._write_file('.git/objects/1')
+            self._write_file('src/main.py', 'print(1)')
+            self.assertEqual(watcher.wait_changes(), FileChanges(['src/main.py'], []))
+        finally:
+            watcher.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
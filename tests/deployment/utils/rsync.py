@@ -0,0 +1,30 @@
+import unittest
+from spotty.deployment.utils.rsync import get_download_command, get_transferred_size
+
+
+class TestRsync(unittest.TestCase):
+
+    def test_download_filters(self):
+        filters = [
+            {'exclude': ['*']},
+            {'include': ['checkpoints/*']},
+        ]
+
+        rsync_cmd = get_download_command('/workspace/project', '/local/project', 'ubuntu', '1.2.3.4', 22,
+                                         '/keys/key', filters)
+
+        self.assertIn(" --include '*/' --include '/checkpoints/**' --exclude '/**' "
+                      "ubuntu@1.2.3.4:/workspace/project/ /local/project", rsync_cmd)
+
+    def test_get_transferred_size(self):
+        output = 'Number of files: 12 (reg: 10, dir: 2)\n' \
+                 'Number of regular files transferred: 3\n' \
+                 'Total file size: 3,145,728,000 bytes\n' \
+                 'Total transferred file size: 2,147,483,648 bytes\n'
+
+        self.assertEqual(get_transferred_size(output), 2147483648)
+        self.assertIsNone(get_transferred_size('rsync: connection unexpectedly closed'))
+
+
+if __name__ == '__main__':
+    unittest.main()
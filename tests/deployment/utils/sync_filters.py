@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from spotty.deployment.utils.sync_filters import is_path_included, get_local_files
+
+
+class TestSyncFilters(unittest.TestCase):
+
+    def test_is_path_included(self):
+        filters = [
+            {'exclude': ['.git/*', '*.pyc', 'data/*']},
+            {'include': ['data/config/*']},
+            {'exclude': ['data/config/secret.json']},
+        ]
+
+        self.assertTrue(is_path_included('train.py', filters))
+        self.assertTrue(is_path_included('models/model.py', filters))
+        self.assertFalse(is_path_included('.git/HEAD', filters))
+        self.assertFalse(is_path_included('models/model.pyc', filters))
+        self.assertFalse(is_path_included('data/images/1.jpg', filters))
+        self.assertTrue(is_path_included('data/config/params.json', filters))
+        self.assertFalse(is_path_included('data/config/secret.json', filters))
+
+        # all files are included if there are no filters
+        self.assertTrue(is_path_included('data/images/1.jpg', []))
+
+        # the download filters
+        download_filters = [{'exclude': ['*']}, {'include': ['checkpoints/*']}]
+        self.assertTrue(is_path_included('checkpoints/1/model.h5', download_filters))
+        self.assertFalse(is_path_included('train.py', download_filters))
+
+    def test_get_local_files(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for path in ['train.py', 'train.pyc', os.path.join('models', 'model.py')]:
+                os.makedirs(os.path.dirname(os.path.join(tmp_dir, path)), exist_ok=True)
+                with open(os.path.join(tmp_dir, path), 'w') as f:
+                    f.write('test')
+
+            files = get_local_files(tmp_dir, [{'exclude': ['*.pyc']}])
+
+            self.assertEqual(sorted(files), ['models/model.py', 'train.py'])
+            self.assertEqual(files['train.py'].size, 4)
+            self.assertEqual(files['train.py'].path, os.path.join(tmp_dir, 'train.py'))
+
+        with self.assertRaises(ValueError):
+            get_local_files('.', [{'exclude': ['*'], 'include': ['*']}])
+
+    def test_rsync_rules(self):
+        filters = [{'exclude': ['.git', 'data', '*.pyc']}]
+
+        # "aws s3 sync" rules: the patterns are matched against the file paths only
+        self.assertTrue(is_path_included('.git/config', filters))
+
+        # rsync rules: the directory is excluded with all its files
+        self.assertFalse(is_path_included('.git/config', filters, rsync_rules=True))
+        self.assertFalse(is_path_included('data/images/1.jpg', filters, rsync_rules=True))
+        self.assertFalse(is_path_included('models/model.pyc', filters, rsync_rules=True))
+        self.assertTrue(is_path_included('models/data.py', filters, rsync_rules=True))
+
+        # all directories are included if there are include filters
+        download_filters = [{'exclude': ['*']}, {'include': ['checkpoints/*']}]
+        self.assertTrue(is_path_included('checkpoints/1/model.h5', download_filters, rsync_rules=True))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for path in ['train.py', os.path.join('.git', 'config'), os.path.join('data', 'images', '1.jpg'),
+                         os.path.join('models', 'data', 'model.py')]:
+                os.makedirs(os.path.dirname(os.path.join(tmp_dir, path)), exist_ok=True)
+                with open(os.path.join(tmp_dir, path), 'w') as f:
+                    f.write('test')
+
+            self.assertEqual(sorted(get_local_files(tmp_dir, filters)),
+                             ['.git/config', 'data/images/1.jpg', 'models/data/model.py', 'train.py'])
+
+            # "data" is anchored to the project directory like in the rsync command
+            self.assertEqual(sorted(get_local_files(tmp_dir, filters, rsync_rules=True)),
+                             ['models/data/model.py', 'train.py'])
+
+
+if __name__ == '__main__':
+    unittest.main()
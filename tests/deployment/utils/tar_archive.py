@@ -0,0 +1,39 @@
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+from spotty.deployment.utils.tar_archive import write_tar_archive
+
+
+class TestTarArchive(unittest.TestCase):
+
+    def setUp(self):
+        self._project_dir = tempfile.mkdtemp()
+        for rel_path in ['src/main.py', 'data/train.csv']:
+            path = os.path.join(self._project_dir, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(rel_path)
+
+    def tearDown(self):
+        shutil.rmtree(self._project_dir)
+
+    def test_write_tar_archive(self):
+        fileobj = io.BytesIO()
+        write_tar_archive(fileobj, self._project_dir, ['src/main.py', 'data/train.csv', 'deleted.txt'],
+                          compress=True, mtimes={'data/train.csv': 1600000000})
+
+        fileobj.seek(0)
+        with tarfile.open(fileobj=fileobj, mode='r:gz') as tar:
+            members = {member.name: member for member in tar.getmembers()}
+            self.assertEqual(set(members), {'src/main.py', 'data/train.csv'})
+            self.assertEqual(members['data/train.csv'].mtime, 1600000000)
+            self.assertEqual(int(members['src/main.py'].mtime),
+                             int(os.stat(os.path.join(self._project_dir, 'src/main.py')).st_mtime))
+            self.assertEqual(tar.extractfile('src/main.py').read(), b'src/main.py')
+
+
+if __name__ == '__main__':
+    unittest.main()
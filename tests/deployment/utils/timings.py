@@ -0,0 +1,44 @@
+import threading
+import unittest
+from spotty.deployment.utils.timings import Timings
+
+
+class TestTimings(unittest.TestCase):
+
+    def test_instance_spans(self):
+        timings = Timings()
+
+        def start_instance(instance_name: str):
+            with timings.instance(instance_name):
+                with timings.span('starting the instance'):
+                    timings.add_span('pulling Docker image', 0, 10, remote=True)
+
+        threads = [threading.Thread(target=start_instance, args=(name,)) for name in ('instance-1', 'instance-2')]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        spans = sorted((span.instance_name, span.name, span.depth) for span in timings.spans)
+        self.assertEqual(spans, [
+            ('instance-1', 'pulling Docker image', 1),
+            ('instance-1', 'starting the instance', 0),
+            ('instance-2', 'pulling Docker image', 1),
+            ('instance-2', 'starting the instance', 0),
+        ])
+
+        report = timings.render_report()
+        self.assertIn('Instance', report)
+        self.assertIn('instance-2', report)
+
+    def test_report_without_instances(self):
+        timings = Timings()
+        with timings.span('starting the instance'):
+            pass
+
+        self.assertNotIn('Instance', timings.render_report())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import subprocess
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch, Mock
+from spotty.providers.aws.cfn_templates.instance.template import _read_template_file, _get_startup_stages
+
+
+class TestStartupStages(unittest.TestCase):
+
+    @staticmethod
+    def _get_all_dependencies(stages: list, stage_name: str) -> set:
+        """Returns the stages that are finished before the stage is started."""
+        depends_on = {stage['name']: stage['depends_on'] for stage in stages}
+        dependencies = set()
+        queue = list(depends_on[stage_name])
+        while queue:
+            dependency = queue.pop()
+            if dependency not in dependencies:
+                dependencies.add(dependency)
+                queue += depends_on[dependency]
+
+        return dependencies
+
+    @patch('spotty.providers.aws.cfn_templates.instance.template.StartContainerScriptWithCfnSignals')
+    @patch('spotty.providers.aws.cfn_templates.instance.template.ContainerBashScript')
+    def test_stages_order(self, *_):
+        instance_config = SimpleNamespace(volumes=[], commands='docker ps', dockerfile_path=None)
+        docker_commands = Mock(pull=Mock(return_value='docker pull ubuntu'))
+        stages = _get_startup_stages(instance_config, docker_commands, 'aws s3 sync')
+
+        # instance startup commands can use Docker, so they wait until the Docker data root is set
+        self.assertIn('set_docker_root', self._get_all_dependencies(stages, 'run_instance_startup_commands'))
+        self.assertIn('sync_project', self._get_all_dependencies(stages, 'run_instance_startup_commands'))
+
+        # the image is pulled while the project is syncing
+        self.assertNotIn('sync_project', self._get_all_dependencies(stages, 'pull_docker_image'))
+        self.assertNotIn('run_instance_startup_commands', self._get_all_dependencies(stages, 'pull_docker_image'))
+
+        self.assertTrue({'run_instance_startup_commands', 'pull_docker_image'}
+                        <= self._get_all_dependencies(stages, 'start_container'))
+
+
+class TestRunStartupStages(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _run_stages(self, stages: list) -> subprocess.CompletedProcess:
+        """Runs the stages, each stage is a tuple with a name, a script content and the dependencies."""
+        script_stages = []
+        for name, content, dependencies in stages:
+            script_path = os.path.join(self._tmp_dir.name, name + '.sh')
+            with open(script_path, 'w') as f:
+                f.write('#!/bin/bash -e\n' + content)
+            os.chmod(script_path, 0o755)
+
+            script_stages.append({
+                'NAME': name,
+                'SCRIPT_PATH': script_path,
+                'DEPENDENCIES': ' '.join(dependencies),
+            })
+
+        script = _read_template_file(os.path.join('startup_scripts', 'run_startup_stages.sh'), {
+            'LOGS_DIR': os.path.join(self._tmp_dir.name, 'logs'),
+            'STAGES': script_stages,
+        })
+
+        return subprocess.run(['bash', '-c', script], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              universal_newlines=True, cwd=self._tmp_dir.name, timeout=30)
+
+    def test_independent_stages_run_concurrently(self):
+        res = self._run_stages([
+            ('prepare', 'echo prepare', []),
+            # each of the stages waits until the other one is started
+            ('sync', 'touch sync.started; while [ ! -f pull.started ]; do sleep 0.1; done', ['prepare']),
+            ('pull', 'touch pull.started; while [ ! -f sync.started ]; do sleep 0.1; done', ['prepare']),
+            ('start', 'test -f sync.started && test -f pull.started && echo started', ['sync', 'pull']),
+        ])
+
+        self.assertEqual(res.returncode, 0, res.stdout + res.stderr)
+        self.assertIn('=== Stage "start" ===\nstarted\n', res.stdout)
+
+    def test_failed_stage(self):
+        res = self._run_stages([
+            ('prepare', 'echo failed; exit 3', []),
+            ('sync', 'echo synced', ['prepare']),
+            ('other', 'echo other', []),
+        ])
+
+        self.assertEqual(res.returncode, 1)
+        self.assertIn('=== Stage "prepare" ===\nfailed\n', res.stdout)
+        self.assertIn('Skipped: the "prepare" stage failed.', res.stdout)
+        self.assertIn('=== Stage "other" ===\nother\n', res.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from spotty.providers.aws.commands.create_ami import CreateAmiCommand
+
+
+class FakeEc2Client(object):
+    """Returns the console outputs one by one, the last one is returned once they run out."""
+
+    def __init__(self, console_outputs: list):
+        self._console_outputs = console_outputs
+
+    def get_console_output(self, InstanceId: str, Latest: bool = False):
+        console_output = self._console_outputs.pop(0) if len(self._console_outputs) > 1 else self._console_outputs[0]
+        return {'Output': console_output} if console_output else {}
+
+
+class TestCreateAmiCommand(unittest.TestCase):
+
+    def setUp(self):
+        self._command = CreateAmiCommand()
+        self._command.CONSOLE_OUTPUT_DELAY_SECS = 0
+        self._command.CONSOLE_OUTPUT_MAX_ATTEMPTS = 5
+
+    def test_wait_bake_result(self):
+        # the console output is empty for a while after the instance is stopped
+        ec2 = FakeEc2Client(['', '', 'cloud-init...\nSPOTTY_BAKE_AMI_SUCCEEDED\n'])
+        self.assertTrue(self._command._wait_bake_result(ec2, 'i-1'))
+
+        ec2 = FakeEc2Client(['', 'cloud-init...\nSPOTTY_BAKE_AMI_FAILED\n'])
+        self.assertFalse(self._command._wait_bake_result(ec2, 'i-1'))
+
+        # the result is not reported
+        with self.assertRaises(ValueError):
+            self._command._wait_bake_result(FakeEc2Client(['']), 'i-1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,7 @@ class TestBucketResource(unittest.TestCase):
             'amiId': None,
             'amiName': None,
             'availabilityZone': '',
+            'cacheDockerImage': False,
             'commands': '',
             'containerName': None,
             'dockerDataRoot': '',
@@ -0,0 +1,42 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from spotty.providers.aws.helpers.prices_cache import PricesCache
+
+
+class TestPricesCache(unittest.TestCase):
+
+    def setUp(self):
+        self._home_dir = tempfile.TemporaryDirectory()
+        self._home_patch = patch.dict(os.environ, {'HOME': self._home_dir.name})
+        self._home_patch.start()
+
+    def tearDown(self):
+        self._home_patch.stop()
+        self._home_dir.cleanup()
+
+    def test_short_ttl_keeps_entries(self):
+        PricesCache().set_spot_prices('us-east-1', 'p2.xlarge', {'us-east-1a': 0.3})
+
+        # a caller with a short TTL doesn't remove the entries that are still valid for other callers
+        with patch('time.time', return_value=time.time() + 120):
+            short_ttl_cache = PricesCache(ttl=60)
+            self.assertIsNone(short_ttl_cache.get_spot_prices('us-east-1', 'p2.xlarge'))
+            short_ttl_cache.set_on_demand_price('us-east-1', 'p2.xlarge', 0.9)
+
+            self.assertEqual(PricesCache().get_spot_prices('us-east-1', 'p2.xlarge'), {'us-east-1a': 0.3})
+
+    def test_old_entries_removed(self):
+        cache = PricesCache()
+        cache.set_spot_prices('us-east-1', 'p2.xlarge', {'us-east-1a': 0.3})
+
+        with patch('time.time', return_value=time.time() + PricesCache.MAX_ENTRY_AGE + 1):
+            cache.set_on_demand_price('us-east-1', 'p2.xlarge', 0.9)
+
+        self.assertIsNone(PricesCache(ttl=PricesCache.MAX_ENTRY_AGE * 2).get_spot_prices('us-east-1', 'p2.xlarge'))
+
+
+if __name__ == '__main__':
+    unittest.main()
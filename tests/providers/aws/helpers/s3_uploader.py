@@ -0,0 +1,142 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+from spotty.commands.writers.abstract_output_writrer import AbstractOutputWriter
+from spotty.providers.aws.helpers.s3_uploader import S3Uploader
+
+
+class ListOutputWriter(AbstractOutputWriter):
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def _write(self, msg: str, newline: bool = True):
+        self.messages.append(msg)
+
+
+class FakePaginator(object):
+
+    def __init__(self, objects: dict):
+        self._objects = objects
+
+    def paginate(self, Bucket: str, Prefix: str):
+        yield {'Contents': [obj for key, obj in sorted(self._objects.items()) if key.startswith(Prefix)]}
+
+
+class FakeS3Client(object):
+    """Keeps the objects of a single bucket in memory."""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploaded_keys = []
+        self.deleted_keys = []
+        self._lock = threading.Lock()
+
+    def put_object(self, key: str, size: int, last_modified: float):
+        self.objects[key] = {'Key': key, 'Size': size,
+                             'LastModified': datetime.fromtimestamp(last_modified, timezone.utc)}
+
+    def get_paginator(self, operation_name: str):
+        return FakePaginator(self.objects)
+
+    def upload_file(self, local_path: str, bucket_name: str, key: str, Config=None):
+        with self._lock:
+            self.put_object(key, os.path.getsize(local_path), time.time())
+            self.uploaded_keys.append(key)
+
+    def delete_objects(self, Bucket: str, Delete: dict):
+        for obj in Delete['Objects']:
+            del self.objects[obj['Key']]
+            self.deleted_keys.append(obj['Key'])
+
+        return {}
+
+
+class TestS3Uploader(unittest.TestCase):
+
+    def setUp(self):
+        self._project_dir = tempfile.mkdtemp()
+        self._s3 = FakeS3Client()
+
+    def tearDown(self):
+        shutil.rmtree(self._project_dir)
+
+    def _write_file(self, rel_path: str, content: str = '', mtime: float = None):
+        path = os.path.join(self._project_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+
+        if mtime:
+            os.utime(path, (mtime, mtime))
+
+    def test_sync(self):
+        now = time.time()
+        self._write_file('unchanged.py', 'print(1)', mtime=now - 100)
+        self._write_file('resized.py', 'print(12)', mtime=now - 100)
+        self._write_file('newer.py', 'print(1)', mtime=now - 10)
+        self._write_file('new.py', 'print(1)')
+
+        self._s3.put_object('project/unchanged.py', 8, now - 50)
+        self._s3.put_object('project/resized.py', 8, now - 50)
+        self._s3.put_object('project/newer.py', 8, now - 50)
+
+        S3Uploader(self._s3, 'bucket', prefix='project', output=ListOutputWriter()).sync(self._project_dir)
+
+        self.assertEqual(sorted(self._s3.uploaded_keys), ['project/new.py', 'project/newer.py', 'project/resized.py'])
+
+    def test_delete(self):
+        self._write_file('main.py')
+        self._s3.put_object('project/main.py', 0, time.time() + 100)
+        self._s3.put_object('project/deleted.py', 0, time.time())
+        self._s3.put_object('project/data/train.csv', 0, time.time())
+        self._s3.put_object('other/file.py', 0, time.time())
+
+        # excluded objects and objects outside the prefix are kept
+        filters = [{'exclude': ['data/*']}]
+        uploader = S3Uploader(self._s3, 'bucket', prefix='project', output=ListOutputWriter())
+
+        uploader.sync(self._project_dir, filters=filters)
+        self.assertEqual(self._s3.deleted_keys, [])
+
+        uploader.sync(self._project_dir, filters=filters, delete=True)
+        self.assertEqual(self._s3.deleted_keys, ['project/deleted.py'])
+        self.assertEqual(self._s3.uploaded_keys, [])
+
+    def test_filters(self):
+        self._write_file('main.py')
+        self._write_file('data/train.csv')
+
+        filters = [{'exclude': ['data/*']}]
+        S3Uploader(self._s3, 'bucket', prefix='project', output=ListOutputWriter()) \
+            .sync(self._project_dir, filters=filters)
+
+        self.assertEqual(self._s3.uploaded_keys, ['project/main.py'])
+
+    def test_dry_run(self):
+        self._write_file('main.py')
+        self._s3.put_object('project/deleted.py', 0, time.time())
+
+        output = ListOutputWriter()
+        S3Uploader(self._s3, 'bucket', prefix='project', output=output) \
+            .sync(self._project_dir, delete=True, dry_run=True)
+
+        self.assertEqual(self._s3.uploaded_keys, [])
+        self.assertEqual(self._s3.deleted_keys, [])
+        self.assertEqual(len(output.messages), 2)
+        self.assertTrue(output.messages[0].startswith('(dryrun) upload: '))
+        self.assertTrue(output.messages[0].endswith(' to s3://bucket/project/main.py'))
+        self.assertEqual(output.messages[1], '(dryrun) delete: s3://bucket/project/deleted.py')
+
+    def test_client_config(self):
+        config = S3Uploader.get_client_config()
+        self.assertEqual(config.max_pool_connections, S3Uploader.MAX_WORKERS * S3Uploader.MAX_CONCURRENCY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from spotty.commands.writers.null_output_writrer import NullOutputWriter
+from spotty.deployment.utils.timings import timings
+from spotty.providers.aws.resource_managers.instance_stack_manager import InstanceStackManager
+
+
+STACK_ID = 'arn:aws:cloudformation:us-east-1:123456789012:stack/spotty-instance-test-instance-1/uuid'
+
+
+class FakeCloudFormationClient(object):
+    """Returns a created stack with all the events at once."""
+
+    def __init__(self, events: list):
+        self._events = events
+        self._created = False
+        self._tags = []
+
+    def create_stack(self, **kwargs):
+        self._created = True
+        self._tags = kwargs.get('Tags', [])
+        return {'StackId': STACK_ID}
+
+    def describe_stacks(self, StackName: str):
+        if not self._created:
+            return {'Stacks': []}
+
+        return {'Stacks': [{
+            'StackId': STACK_ID,
+            'StackName': 'spotty-instance-test-instance-1',
+            'StackStatus': 'CREATE_COMPLETE',
+            'Tags': self._tags,
+        }]}
+
+    def describe_stack_events(self, StackName: str):
+        # events are returned in reverse chronological order
+        return {'StackEvents': self._events[::-1]}
+
+
+def get_stack_events() -> list:
+    """Events of a created stack, the resources are created in the order of the startup stages."""
+    start_time = datetime(2020, 1, 1)
+    resource_events = [
+        ('Instance', 30),
+        ('MountingVolumesSignal', 50),
+        ('SettingDockerRootSignal', 51),
+        ('SyncingProjectSignal', 52),
+        ('RunningInstanceStartupCommandsSignal', 60),
+        ('PullingDockerImageSignal', 61),
+        ('BuildingDockerImageSignal', 100),
+        ('StartingContainerSignal', 101),
+        ('RunningContainerStartupCommandsSignal', 105),
+        ('DockerReadyWaitCondition', 106),
+    ]
+
+    events = [{'EventId': 'stack-start', 'PhysicalResourceId': STACK_ID, 'LogicalResourceId': 'stack',
+               'ResourceStatus': 'CREATE_IN_PROGRESS', 'Timestamp': start_time}]
+    events += [{'EventId': resource_name, 'PhysicalResourceId': resource_name, 'LogicalResourceId': resource_name,
+                'ResourceStatus': 'CREATE_COMPLETE', 'Timestamp': start_time + timedelta(seconds=seconds)}
+               for resource_name, seconds in resource_events]
+    events += [{'EventId': 'stack-finish', 'PhysicalResourceId': STACK_ID, 'LogicalResourceId': 'stack',
+                'ResourceStatus': 'CREATE_COMPLETE', 'Timestamp': start_time + timedelta(seconds=110)}]
+
+    return events
+
+
+class TestInstanceStackManager(unittest.TestCase):
+
+    def test_config_hash(self):
+        stack_manager = InstanceStackManager('test', 'instance-1', 'us-east-1')
+        stack_manager._cf = FakeCloudFormationClient(get_stack_events())
+        self.assertIsNone(stack_manager.get_config_hash())
+
+        instance_config = SimpleNamespace(volumes=[], docker_data_root=None, commands=None, dockerfile_path=None,
+                                          container_config=SimpleNamespace(commands=None), params_hash='abc')
+
+        stack_manager.create_or_update_stack('', {}, instance_config, NullOutputWriter())
+        self.assertEqual(stack_manager.get_config_hash(), 'abc')
+
+    def test_tasks_timings(self):
+        stack_manager = InstanceStackManager('test', 'instance-1', 'us-east-1')
+        stack_manager._cf = FakeCloudFormationClient(get_stack_events())
+
+        instance_config = SimpleNamespace(volumes=[], docker_data_root=None, commands=None, dockerfile_path=None,
+                                          container_config=SimpleNamespace(commands=None), params_hash='abc')
+
+        num_spans = len(timings.spans)
+        stack = stack_manager.create_or_update_stack('', {}, instance_config, NullOutputWriter())
+        self.assertEqual(stack.status, 'CREATE_COMPLETE')
+
+        spans = {span.name: span.end_time - span.start_time for span in timings.spans[num_spans:] if span.remote}
+        self.assertEqual(spans, {
+            'launching the instance': 30,
+            'preparing the instance': 20,
+            'syncing project files': 8,
+            'pulling Docker image': 39,
+            'starting container': 4,
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
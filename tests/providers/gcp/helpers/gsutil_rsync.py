@@ -0,0 +1,37 @@
+import re
+import unittest
+from spotty.providers.gcp.helpers.gsutil_rsync import get_exclude_regex
+
+
+class TestGsutilRsync(unittest.TestCase):
+
+    def test_exclude_regex(self):
+        filters = [
+            {'exclude': ['*']},
+            {'include': ['checkpoints/*', 'logs/*.txt']},
+        ]
+
+        regex = get_exclude_regex(filters)
+
+        self.assertIsNone(re.match(regex, 'checkpoints/model/1.pt'))
+        self.assertIsNone(re.match(regex, 'logs/train.txt'))
+        self.assertIsNotNone(re.match(regex, 'logs/train.bin'))
+        self.assertIsNotNone(re.match(regex, 'train.py'))
+
+    def test_exclude_after_include(self):
+        filters = [
+            {'exclude': ['data/*']},
+            {'include': ['data/config/*']},
+            {'exclude': ['data/config/secret.json']},
+        ]
+
+        regex = get_exclude_regex(filters)
+
+        self.assertIsNone(re.match(regex, 'train.py'))
+        self.assertIsNone(re.match(regex, 'data/config/config.json'))
+        self.assertIsNotNone(re.match(regex, 'data/config/secret.json'))
+        self.assertIsNotNone(re.match(regex, 'data/images/1.jpg'))
+
+
+if __name__ == '__main__':
+    unittest.main()
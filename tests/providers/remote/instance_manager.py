@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from spotty.commands.writers.null_output_writrer import NullOutputWriter
+from spotty.providers.remote.instance_manager import InstanceManager
+
+
+class FirstSyncInstanceManager(InstanceManager):
+    """Uploads the project to an empty project directory and keeps the uploaded paths."""
+
+    def __init__(self, project_dir: str, sync_filters: list):
+        super().__init__(SimpleNamespace(project_dir=project_dir, sync_filters=sync_filters), {})
+        self.uploaded_paths = None
+
+    def _get_instance_config(self, instance_config: dict):
+        return SimpleNamespace()
+
+    def is_host_project_dir_empty(self) -> bool:
+        return True
+
+    def upload_files(self, rel_paths: list, deleted_rel_paths: list, compress: bool = False):
+        self.uploaded_paths = rel_paths
+
+
+class TestInstanceManager(unittest.TestCase):
+
+    def test_first_sync_filters(self):
+        with tempfile.TemporaryDirectory() as project_dir:
+            for path in ['train.py', os.path.join('.git', 'config'), os.path.join('data', 'images', '1.jpg')]:
+                os.makedirs(os.path.dirname(os.path.join(project_dir, path)), exist_ok=True)
+                with open(os.path.join(project_dir, path), 'w') as f:
+                    f.write('test')
+
+            # bare directory patterns exclude the directories with all their files, like rsync does
+            instance_manager = FirstSyncInstanceManager(project_dir, [{'exclude': ['.git', 'data']}])
+            instance_manager.sync(NullOutputWriter())
+
+            self.assertEqual(instance_manager.uploaded_paths, ['train.py'])
+
+
+if __name__ == '__main__':
+    unittest.main()